@@ -1,10 +1,104 @@
+import csv
+import json
+import random
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import islice, repeat
+from math import inf, isfinite, nextafter
+from operator import mul, truediv
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple, Sequence
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import FloatPrompt
+from rich.table import Table
 from rich.text import Text
 
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se usa el camino con array
+    np = None
+
 console = Console()
 
+CODIGO_INVALIDO = -1
+CATEGORIA_INVALIDA = "Dato inválido"
+
+
+class TablaBandas:
+    """Tabla precompilada de bandas para clasificar valores por búsqueda binaria.
+
+    Cada banda va desde su límite inferior (incluido) hasta el siguiente (excluido);
+    la última llega hasta `maximo` incluido. Valores mayores que `maximo` (o NaN)
+    reciben la etiqueta `fuera_de_rango`. El código de un valor es el índice de su
+    etiqueta en `etiquetas`.
+
+    Atributos:
+        etiquetas: Etiquetas de cada banda seguidas de la etiqueta fuera de rango.
+    """
+
+    def __init__(self, limites: Sequence[float], etiquetas: Sequence[str],
+                 maximo: float = inf, fuera_de_rango: str = "Fuera de rango") -> None:
+        """
+        Args:
+            limites (Sequence[float]): Límites inferiores de la 2.ª banda en adelante, en orden creciente.
+            etiquetas (Sequence[str]): Una etiqueta por banda (len(limites) + 1).
+            maximo (float, optional): Valor máximo (incluido) de la última banda.
+            fuera_de_rango (str, optional): Etiqueta para valores por encima de `maximo`.
+
+        Raises:
+            ValueError: Si los límites no son crecientes o no hay una etiqueta por banda.
+        """
+        limites = tuple(float(limite) for limite in limites)
+        if len(etiquetas) != len(limites) + 1:
+            raise ValueError("Debe haber exactamente una etiqueta más que límites.")
+        if any(a >= b for a, b in zip(limites, (*limites[1:], maximo))):
+            raise ValueError("Los límites deben ser estrictamente crecientes y menores que el máximo.")
+        if len(etiquetas) >= 127:
+            raise ValueError("La tabla admite como máximo 126 bandas.")
+
+        # bisect_right sobre los cortes da el índice de la banda; el máximo se desplaza
+        # al siguiente float para que quede incluido en la última banda.
+        self._cortes = (*limites, nextafter(maximo, inf))
+        self.etiquetas = (*etiquetas, fuera_de_rango)
+
+    def codigo(self, valor: float) -> int:
+        """Devuelve el código (índice en `etiquetas`) de la banda de `valor`."""
+        return bisect_right(self._cortes, valor)
+
+    def etiqueta(self, valor: float) -> str:
+        """Devuelve la etiqueta de la banda de `valor`."""
+        return self.etiquetas[bisect_right(self._cortes, valor)]
+
+    def codigos_lote(self, valores: Sequence[float]):
+        """
+        Clasifica una columna completa de valores.
+
+        Returns:
+            Arreglo numpy int8 si `valores` es un arreglo numpy; si no, `array('b')`.
+        """
+        if np is not None and isinstance(valores, np.ndarray):
+            return np.searchsorted(self._cortes, valores, side="right").astype(np.int8)
+        return array("b", map(bisect_right, repeat(self._cortes), valores))
+
+
+# Rangos estándar de la OMS (los que usa interpretar_imc por defecto).
+TABLA_OMS = TablaBandas(
+    (18.5, 25, 30), ("Bajo peso", "Normal", "Sobrepeso", "Obesidad"),
+    maximo=50, fuera_de_rango="Valor de IMC fuera de rango válido",
+)
+# Puntos de corte de la OMS para población asiática.
+TABLA_ASIATICA = TablaBandas(
+    (18.5, 23, 27.5), ("Bajo peso", "Normal", "Sobrepeso", "Obesidad"),
+    maximo=50, fuera_de_rango="Valor de IMC fuera de rango válido",
+)
+# Categorías en el orden de sus códigos (ver calcular_imc_lote).
+CATEGORIAS_IMC = TABLA_OMS.etiquetas
+
 
 def calcular_imc(peso: float, altura: float) -> float:
     """
@@ -18,26 +112,272 @@ def calcular_imc(peso: float, altura: float) -> float:
         float: El valor del IMC calculado.
 
     Raises:
-        ValueError: Si el peso o la altura no son positivos.
+        ValueError: Si el peso o la altura no son positivos (o son NaN).
     """
-    if peso <= 0:
+    # `not x > 0` en lugar de `x <= 0` para rechazar también NaN.
+    if not peso > 0:
         raise ValueError("El peso debe ser mayor que 0.")
-    if altura <= 0:
+    if not altura > 0:
         raise ValueError("La altura debe ser mayor que 0.")
 
     return peso / (altura ** 2)
 
 
-def interpretar_imc(imc: float) -> str:
+def interpretar_imc(imc: float, tabla: TablaBandas = TABLA_OMS) -> str:
     """
-    Interpreta el valor del IMC según los rangos estándar de la OMS.
+    Interpreta el valor del IMC según una tabla de rangos (por defecto, la de la OMS).
 
     Args:
         imc (float): Índice de Masa Corporal.
+        tabla (TablaBandas, optional): Tabla de rangos a utilizar.
 
     Returns:
         str: Categoría del IMC.
     """
+    return tabla.etiqueta(imc)
+
+
+def codigo_imc(imc: float, tabla: TablaBandas = TABLA_OMS) -> int:
+    """
+    Devuelve el código compacto de la categoría del IMC (índice en `tabla.etiquetas`).
+
+    Args:
+        imc (float): Índice de Masa Corporal.
+        tabla (TablaBandas, optional): Tabla de rangos a utilizar.
+
+    Returns:
+        int: Código equivalente a interpretar_imc.
+    """
+    return tabla.codigo(imc)
+
+
+class ResultadoLoteIMC(NamedTuple):
+    """Columnas devueltas por calcular_imc_lote.
+
+    Atributos:
+        imc: IMC de cada fila ('nan' en filas inválidas).
+        codigo: Código de categoría por fila (CODIGO_INVALIDO en filas inválidas).
+        valido: 1 si la fila tenía peso y altura positivos, 0 en caso contrario (incluido NaN).
+    """
+    imc: Sequence[float]
+    codigo: Sequence[int]
+    valido: Sequence[int]
+
+
+def _validar_fila(peso: float, altura: float, fila: int) -> None:
+    """Lanza el mismo ValueError que calcular_imc indicando la fila afectada."""
+    try:
+        calcular_imc(peso, altura)
+    except ValueError as exc:
+        raise ValueError(f"Fila {fila}: {exc}") from exc
+
+
+def calcular_imc_lote(pesos: Sequence[float], alturas: Sequence[float], estricto: bool = True,
+                      tabla: TablaBandas = TABLA_OMS) -> ResultadoLoteIMC:
+    """
+    Calcula e interpreta el IMC de columnas completas de pesos y alturas en una sola pasada.
+
+    Acepta listas, `array.array` o arreglos de numpy. Si numpy está instalado el cálculo
+    se vectoriza con él; si no, se recorre con `map` sobre arreglos `array` compactos.
+
+    Args:
+        pesos (Sequence[float]): Columna de pesos en kilogramos.
+        alturas (Sequence[float]): Columna de alturas en metros.
+        estricto (bool, optional): Si es True, la primera fila inválida lanza ValueError.
+            Si es False, las filas inválidas se marcan en la máscara `valido`.
+        tabla (TablaBandas, optional): Tabla de rangos para los códigos de categoría.
+
+    Returns:
+        ResultadoLoteIMC: Columnas `imc`, `codigo` y `valido`. Con numpy son arreglos
+        numpy (float64, int8, bool); sin él, `array('d')`, `array('b')` y `array('b')`.
+
+    Raises:
+        ValueError: Si las columnas tienen distinta longitud, o si `estricto` es True y
+            alguna fila tiene peso o altura no positivos.
+    """
+    if len(pesos) != len(alturas):
+        raise ValueError("Las columnas de peso y altura deben tener la misma longitud.")
+
+    if np is not None:
+        return _calcular_imc_lote_numpy(pesos, alturas, estricto, tabla)
+
+    if not isinstance(pesos, array):
+        pesos = array("d", pesos)
+    if not isinstance(alturas, array):
+        alturas = array("d", alturas)
+
+    # min() no detecta un NaN que no esté al principio; la suma sí lo propaga.
+    if len(pesos) and not (min(pesos) > 0 and min(alturas) > 0 and isfinite(sum(pesos) + sum(alturas))):
+        valido = array("b", map(lambda p, a: p > 0 and a > 0, pesos, alturas))
+        if estricto and 0 in valido:
+            fila = valido.index(0)
+            _validar_fila(pesos[fila], alturas[fila], fila)
+        nan = float("nan")
+        imc = array("d", map(lambda p, a, v: p / (a * a) if v else nan, pesos, alturas, valido))
+        codigo = array("b", map(lambda i, v: tabla.codigo(i) if v else CODIGO_INVALIDO, imc, valido))
+    else:
+        valido = array("b", bytes([1]) * len(pesos))
+        imc = array("d", map(truediv, pesos, map(mul, alturas, alturas)))
+        codigo = tabla.codigos_lote(imc)
+    return ResultadoLoteIMC(imc, codigo, valido)
+
+
+def _calcular_imc_lote_numpy(pesos, alturas, estricto: bool, tabla: TablaBandas) -> ResultadoLoteIMC:
+    """Implementación vectorizada de calcular_imc_lote con numpy."""
+    pesos = np.asarray(pesos, dtype=np.float64)
+    alturas = np.asarray(alturas, dtype=np.float64)
+
+    valido = (pesos > 0) & (alturas > 0)
+    if estricto and not valido.all():
+        fila = int(np.argmin(valido))
+        _validar_fila(float(pesos[fila]), float(alturas[fila]), fila)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        imc = np.where(valido, pesos / (alturas * alturas), np.nan)
+
+    codigo = tabla.codigos_lote(imc)
+    codigo[~valido] = CODIGO_INVALIDO
+    return ResultadoLoteIMC(imc, codigo, valido)
+
+
+def _a_float(valor) -> float:
+    """Convierte un valor leído del archivo a float; los no numéricos o no finitos se tratan como 0 (inválidos)."""
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        return 0.0
+    return numero if isfinite(numero) else 0.0
+
+
+def _rechazar_constante(nombre: str) -> float:
+    """parse_constant de json.loads que rechaza NaN, Infinity y -Infinity."""
+    raise ValueError(f"Constante no válida en JSON: {nombre}")
+
+
+def _leer_objeto_json(linea: str) -> dict:
+    """
+    Decodifica una línea JSONL. Si no es JSON válido o no es un objeto, devuelve un
+    objeto que solo conserva el texto original en "original" (sin peso ni altura,
+    así que se clasifica como inválido).
+    """
+    try:
+        # NaN/Infinity no son JSON estándar: se rechazan para no copiarlos a la salida.
+        fila = json.loads(linea, parse_constant=_rechazar_constante)
+    except ValueError:
+        fila = None
+    return fila if isinstance(fila, dict) else {"original": linea.strip()}
+
+
+def _clasificar_bloque(pesos: list, alturas: list, conteos: Counter,
+                       tabla: TablaBandas) -> tuple[list, list[str]]:
+    """Clasifica un bloque de filas y acumula los conteos; devuelve las columnas imc y categoria."""
+    resultado = calcular_imc_lote(
+        array("d", map(_a_float, pesos)), array("d", map(_a_float, alturas)), estricto=False, tabla=tabla
+    )
+    etiquetas = (*tabla.etiquetas, CATEGORIA_INVALIDA)  # el código -1 cae en la última
+    categorias = [etiquetas[codigo] for codigo in resultado.codigo.tolist()]
+    imcs = [
+        round(imc, 2) if categoria != CATEGORIA_INVALIDA else ""
+        for imc, categoria in zip(resultado.imc.tolist(), categorias)
+    ]
+    conteos.update(categorias)
+    return imcs, categorias
+
+
+def procesar_archivo(ruta_entrada: str, ruta_salida: str, tamano_bloque: int = 10_000,
+                     tabla: TablaBandas = TABLA_OMS) -> dict[str, int]:
+    """
+    Clasifica por bloques un archivo CSV o JSONL de mediciones y escribe las filas enriquecidas.
+
+    Cada fila debe tener las columnas "peso" y "altura"; la salida conserva todas las
+    columnas originales y agrega "imc" y "categoria". Solo se mantiene en memoria un
+    bloque de `tamano_bloque` filas a la vez, sin importar el tamaño del archivo.
+
+    Los registros dañados (filas CSV incompletas, líneas que no son un objeto JSON,
+    valores no numéricos o no finitos) se clasifican como CATEGORIA_INVALIDA sin
+    interrumpir el proceso. El archivo de salida solo se abre cuando el encabezado es válido.
+
+    Args:
+        ruta_entrada (str): Archivo de entrada (.csv o .jsonl).
+        ruta_salida (str): Archivo de salida; se escribe en el mismo formato que la entrada.
+        tamano_bloque (int, optional): Filas procesadas por bloque. Por defecto 10 000.
+        tabla (TablaBandas, optional): Tabla de rangos para clasificar el IMC.
+
+    Returns:
+        dict[str, int]: Cantidad de filas por categoría, en el orden de la tabla
+        (incluye CATEGORIA_INVALIDA).
+
+    Raises:
+        ValueError: Si el formato no es CSV/JSONL, el tamaño de bloque no es positivo
+            o el CSV no tiene las columnas "peso" y "altura".
+    """
+    formato = Path(ruta_entrada).suffix.lower().lstrip(".")
+    if formato not in ("csv", "jsonl"):
+        raise ValueError("El archivo de entrada debe ser .csv o .jsonl.")
+    if tamano_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser mayor que 0.")
+
+    conteos: Counter[str] = Counter()
+    with open(ruta_entrada, newline="", encoding="utf-8") as entrada:
+        if formato == "csv":
+            lector = csv.reader(entrada)
+            encabezado = next(lector, None)
+            if encabezado is None:
+                return {}
+            if "peso" not in encabezado or "altura" not in encabezado:
+                raise ValueError("El CSV debe tener las columnas 'peso' y 'altura'.")
+            i_peso, i_altura = encabezado.index("peso"), encabezado.index("altura")
+            with open(ruta_salida, "w", newline="", encoding="utf-8") as salida:
+                escritor = csv.writer(salida)
+                escritor.writerow([*encabezado, "imc", "categoria"])
+
+                while bloque := list(islice(lector, tamano_bloque)):
+                    # Las filas cortas no tienen la columna: quedan como dato inválido.
+                    imcs, categorias = _clasificar_bloque(
+                        [fila[i_peso] if i_peso < len(fila) else "" for fila in bloque],
+                        [fila[i_altura] if i_altura < len(fila) else "" for fila in bloque],
+                        conteos, tabla,
+                    )
+                    escritor.writerows(map(lambda fila, imc, cat: [*fila, imc, cat], bloque, imcs, categorias))
+        else:
+            with open(ruta_salida, "w", newline="", encoding="utf-8") as salida:
+                _procesar_jsonl(entrada, salida, tamano_bloque, conteos, tabla)
+
+    return {etiqueta: conteos[etiqueta] for etiqueta in (*tabla.etiquetas, CATEGORIA_INVALIDA) if etiqueta in conteos}
+
+
+def _procesar_jsonl(entrada, salida, tamano_bloque: int, conteos: Counter, tabla: TablaBandas) -> None:
+    """Clasifica por bloques las líneas de un JSONL y escribe cada objeto con "imc" y "categoria"."""
+    filas = (_leer_objeto_json(linea) for linea in entrada if linea.strip())
+    while bloque := list(islice(filas, tamano_bloque)):
+        imcs, categorias = _clasificar_bloque(
+            [fila.get("peso") for fila in bloque], [fila.get("altura") for fila in bloque], conteos, tabla
+        )
+        for fila, imc, categoria in zip(bloque, imcs, categorias):
+            fila["imc"], fila["categoria"] = imc, categoria
+            salida.write(json.dumps(fila, ensure_ascii=False) + "\n")
+
+
+def mostrar_conteos(conteos: dict[str, int]) -> None:
+    """
+    Muestra en una tabla la cantidad de filas por categoría de IMC.
+
+    Args:
+        conteos (dict[str, int]): Resultado de procesar_archivo.
+    """
+    tabla = Table(title="Resumen de clasificación de IMC")
+    tabla.add_column("Categoría", style="bold cyan")
+    tabla.add_column("Filas", justify="right", style="green")
+    for categoria, filas in conteos.items():
+        tabla.add_row(categoria, f"{filas:,}")
+    tabla.add_row("Total", f"{sum(conteos.values()):,}", style="bold")
+    console.print(tabla)
+
+
+# ----------------------- RENDIMIENTO -----------------------
+
+def _interpretar_imc_encadenado(imc: float) -> str:
+    """Versión anterior de interpretar_imc (cadena de comparaciones), solo para comparar."""
     if imc < 18.5:
         return "Bajo peso"
     elif 18.5 <= imc < 25:
@@ -50,6 +390,50 @@ def interpretar_imc(imc: float) -> str:
         return "Valor de IMC fuera de rango válido"
 
 
+def comparar_rendimiento_interpretar(cantidad: int = 2_000_000, repeticiones: int = 3) -> dict[str, float]:
+    """
+    Compara la cadena de comparaciones anterior con TablaBandas (llamada a llamada y por
+    columnas con codigos_lote) al clasificar `cantidad` valores de IMC entre 10 y 60.
+
+    Args:
+        cantidad (int, optional): Valores a clasificar.
+        repeticiones (int, optional): Se toma el mejor tiempo de este número de ejecuciones.
+
+    Returns:
+        dict[str, float]: Segundos de cada variante.
+    """
+    generador = random.Random(0)
+    valores = [generador.uniform(10, 60) for _ in range(cantidad)]
+    columna = array("d", valores)
+    variantes = {
+        "cadena de comparaciones": lambda: list(map(_interpretar_imc_encadenado, valores)),
+        "TablaBandas.etiqueta": lambda: list(map(interpretar_imc, valores)),
+        "codigos_lote (array)": lambda: TABLA_OMS.codigos_lote(columna),
+    }
+    if np is not None:
+        arreglo = np.asarray(valores)
+        variantes["codigos_lote (numpy)"] = lambda: TABLA_OMS.codigos_lote(arreglo)
+    resultados = {}
+    for nombre, funcion in variantes.items():
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = perf_counter()
+            funcion()
+            tiempos.append(perf_counter() - inicio)
+        resultados[nombre] = min(tiempos)
+    return resultados
+
+
+def mostrar_rendimiento_interpretar(cantidad: int = 2_000_000) -> None:
+    """Muestra en una tabla el resultado de comparar_rendimiento_interpretar."""
+    tabla = Table(title=f"Clasificación de {cantidad:,} valores de IMC")
+    tabla.add_column("Variante", style="cyan")
+    tabla.add_column("Segundos", justify="right", style="green")
+    for nombre, segundos in comparar_rendimiento_interpretar(cantidad).items():
+        tabla.add_row(nombre, f"{segundos:.3f}")
+    console.print(tabla)
+
+
 def solicitar_valor(nombre: str) -> float:
     """
     Solicita un valor numérico positivo al usuario, mostrando errores si no lo cumple.
@@ -63,7 +447,7 @@ def solicitar_valor(nombre: str) -> float:
     while True:
         try:
             valor = FloatPrompt.ask(f"Ingrese su {nombre} en {'kg' if nombre == 'peso' else 'm'}")
-            if valor <= 0:
+            if not valor > 0:
                 console.print(f"[bold red]⚠ El {nombre} debe ser mayor que 0.[/bold red]")
                 continue
             return valor
@@ -71,10 +455,25 @@ def solicitar_valor(nombre: str) -> float:
             console.print(f"[bold red]⚠ Entrada inválida. Por favor ingrese un número válido para {nombre}.[/bold red]")
 
 
-def main() -> None:
+def main(argumentos: list[str] | None = None) -> None:
     """
     Función principal: pide los datos al usuario, calcula e interpreta el IMC.
+
+    Si se reciben dos argumentos (`entrada salida`) se ejecuta en modo no interactivo,
+    clasificando el archivo con procesar_archivo y mostrando el resumen por categoría.
+    Con el argumento `--rendimiento` muestra mostrar_rendimiento_interpretar.
     """
+    argumentos = sys.argv[1:] if argumentos is None else argumentos
+    if argumentos == ["--rendimiento"]:
+        mostrar_rendimiento_interpretar()
+        return
+    if argumentos:
+        if len(argumentos) != 2:
+            console.print("[bold red]Uso: python Ejercicio_1.py <entrada.csv|.jsonl> <salida>[/bold red]")
+            return
+        mostrar_conteos(procesar_archivo(*argumentos))
+        return
+
     console.print(Panel(Text("💪 CÁLCULO DE ÍNDICE DE MASA CORPORAL (IMC)", justify="center", style="bold cyan")))
 
     peso = solicitar_valor("peso")
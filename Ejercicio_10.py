@@ -1,44 +1,813 @@
-from typing import Any
+import json
+import math
+import os
+import re
+import sys
+from bisect import bisect_left
+from json.decoder import scanstring
+from time import perf_counter
+from typing import Any, Iterator, NamedTuple, Optional, TextIO, Union
 from rich.console import Console
 from rich.table import Table
 
 
-def explorar_estructura(elemento: Any, profundidad: int = 1) -> list[tuple[Any, int]]:
+# Valores que no se exploran por dentro (aunque str sea iterable).
+_TIPOS_HOJA = (str, int, float, bool, type(None))
+
+# Categorías de cada tipo ya visto: se consulta por type() en lugar de encadenar isinstance.
+_HOJA, _DICCIONARIO, _SECUENCIA, _OTRO = range(4)
+_CATEGORIAS: dict[type, int] = {}
+
+
+def _categoria(tipo: type) -> int:
+    """Clasifica un tipo (incluidas subclases) y guarda el resultado en _CATEGORIAS."""
+    if issubclass(tipo, _TIPOS_HOJA):
+        categoria = _HOJA
+    elif issubclass(tipo, dict):
+        categoria = _DICCIONARIO
+    elif issubclass(tipo, (list, tuple, set)):
+        categoria = _SECUENCIA
+    else:
+        categoria = _OTRO
+    _CATEGORIAS[tipo] = categoria
+    return categoria
+
+
+class ReferenciaCiclica(NamedTuple):
+    """Marca que se entrega en lugar de un contenedor que se contiene a sí mismo."""
+    tipo: str
+    profundidad: int
+
+    def __str__(self) -> str:
+        return f"<ciclo: {self.tipo} del nivel {self.profundidad}>"
+
+
+def _referencia_ciclica(hijo: Any, nivel: int, pila: list, error_en_ciclo: bool) -> ReferenciaCiclica:
+    """Construye la marca de un contenedor que ya está en la pila (o lanza el error)."""
+    clave = id(hijo)
+    # En la pila se guarda el nivel de los hijos; el del contenedor es uno menos.
+    nivel_destino = next(entrada[1] - 1 for entrada in pila if entrada[2] == clave)
+    if error_en_ciclo:
+        raise ValueError(
+            f"Referencia cíclica: {type(hijo).__name__} del nivel {nivel_destino} "
+            f"se contiene a sí mismo en el nivel {nivel}."
+        )
+    return ReferenciaCiclica(type(hijo).__name__, nivel_destino)
+
+
+def iterar_estructura(
+    elemento: Any,
+    profundidad: int = 1,
+    memorizar: bool = False,
+    error_en_ciclo: bool = False,
+    detectar_ciclos: bool = True,
+) -> Iterator[tuple[Any, int]]:
+    """
+    Recorre cualquier estructura de datos (listas, diccionarios, etc.) y produce,
+    a medida que los encuentra, los valores no iterables junto a su nivel de profundidad.
+
+    Usa una pila explícita de iteradores en lugar de recursión, así que no tiene
+    límite de profundidad y no copia listas intermedias. El orden es el mismo que
+    el de un recorrido en profundidad: cada contenedor se explora por completo
+    antes de pasar al siguiente elemento.
+
+    Los contenedores del camino actual se registran por id(): si uno vuelve a
+    aparecer dentro de sí mismo se entrega una ReferenciaCiclica (o se lanza un
+    error) en lugar de recorrerlo de nuevo sin fin. Con `detectar_ciclos=False` el
+    recorrido es más rápido, pero una estructura cíclica no termina nunca: solo
+    conviene cuando se sabe que no hay ciclos (por ejemplo, datos leídos de JSON).
+
+    Args:
+        elemento (Any): Estructura de datos a explorar (puede contener listas, tuplas, dict, etc.).
+        profundidad (int, optional): Nivel de profundidad del elemento raíz. Por defecto es 1.
+        memorizar (bool, optional): Si es True, un contenedor compartido que aparece varias
+            veces se recorre una sola vez; las siguientes se repiten sus hojas ya guardadas
+            (ajustando la profundidad). Guarda en memoria las hojas de cada contenedor
+            recorrido, no las repeticiones. Siempre detecta ciclos.
+        error_en_ciclo (bool, optional): Si es True, un ciclo lanza ValueError. Siempre detecta ciclos.
+        detectar_ciclos (bool, optional): Si es False, no registra el camino actual: más
+            rápido, pero no termina con estructuras cíclicas. Por defecto es True.
+
+    Returns:
+        Iterator[tuple[Any, int]]: Cada valor no iterable y su profundidad. Los objetos de
+        otros tipos se entregan como su repr().
+
+    Raises:
+        ValueError: Si hay un ciclo y `error_en_ciclo` es True (al llegar a él).
+    """
+    if memorizar:
+        return _iterar_memorizando(elemento, profundidad, error_en_ciclo)
+    if detectar_ciclos or error_en_ciclo:
+        return _iterar_detectando_ciclos(elemento, profundidad, error_en_ciclo)
+    return _iterar(elemento, profundidad)
+
+
+def _iterar(elemento: Any, profundidad: int) -> Iterator[tuple[Any, int]]:
+    """Recorrido de iterar_estructura sin detectar ciclos."""
+    categorias = _CATEGORIAS.get
+    # Cada entrada: (iterador de hijos, nivel de los hijos).
+    pila: list[tuple[Iterator[Any], int]] = [(iter((elemento,)), profundidad)]
+    while pila:
+        hijos, nivel = pila[-1]
+        for hijo in hijos:
+            categoria = categorias(type(hijo))
+            if categoria is None:
+                categoria = _categoria(type(hijo))
+            if categoria == _HOJA:
+                yield hijo, nivel
+            elif categoria == _DICCIONARIO:
+                pila.append((iter(hijo.values()), nivel + 1))
+                break
+            elif categoria == _SECUENCIA:
+                pila.append((iter(hijo), nivel + 1))
+                break
+            else:
+                yield repr(hijo), nivel
+        else:
+            # El iterador del tope se agotó: se vuelve al contenedor padre.
+            pila.pop()
+
+
+def _iterar_detectando_ciclos(elemento: Any, profundidad: int, error_en_ciclo: bool) -> Iterator[tuple[Any, int]]:
+    """Recorrido de iterar_estructura que marca los ciclos."""
+    categorias = _CATEGORIAS.get
+    # ids de los contenedores del camino actual.
+    en_camino: set[int] = set()
+    # Cada entrada: (iterador de hijos, nivel de los hijos, id del contenedor).
+    pila: list[tuple[Iterator[Any], int, int]] = [(iter((elemento,)), profundidad, 0)]
+    while pila:
+        hijos, nivel, _ = pila[-1]
+        for hijo in hijos:
+            categoria = categorias(type(hijo))
+            if categoria is None:
+                categoria = _categoria(type(hijo))
+            if categoria == _HOJA:
+                yield hijo, nivel
+            elif categoria == _OTRO:
+                yield repr(hijo), nivel
+            elif (clave := id(hijo)) in en_camino:
+                yield _referencia_ciclica(hijo, nivel, pila, error_en_ciclo), nivel
+            else:
+                en_camino.add(clave)
+                pila.append((iter(hijo.values() if categoria == _DICCIONARIO else hijo), nivel + 1, clave))
+                break
+        else:
+            en_camino.discard(pila.pop()[2])
+
+
+# Tramos con hasta tantas hojas (contando repeticiones) se expanden una vez y se copian.
+_MAXIMO_EXPANDIDO = 64
+
+
+class _Tramo(NamedTuple):
+    """Hojas guardadas de un contenedor: posiciones [inicio, fin), cuánto sumar a su nivel y total entregado."""
+    inicio: int
+    fin: int
+    desplazamiento: int
+    total: int
+
+
+def _repetir(
+    hojas: list,
+    repeticiones: list[int],
+    tramo: _Tramo,
+    expandidos: Optional[dict[tuple[int, int], list[tuple[Any, int]]]] = None,
+) -> Iterator[tuple[Any, int]]:
+    """
+    Entrega las hojas de un tramo con su nivel desplazado. Las posiciones de `repeticiones`
+    guardan un _Tramo (un contenedor repetido dentro del tramo) que se expande en su lugar.
+    Con `expandidos`, los tramos pequeños se expanden una sola vez y se guardan ahí.
+    """
+    pendientes: list[tuple[int, int, int, float]] = [tramo]
+    while pendientes:
+        inicio, fin, desplazamiento, total = pendientes.pop()
+        if expandidos is not None and total <= _MAXIMO_EXPANDIDO:
+            expandido = expandidos.get((inicio, fin))
+            if expandido is None:
+                expandido = expandidos[inicio, fin] = list(_repetir(hojas, repeticiones, _Tramo(inicio, fin, 0, total)))
+            yield from [(valor, nivel + desplazamiento) for valor, nivel in expandido]
+            continue
+        siguiente = bisect_left(repeticiones, inicio)
+        corte = repeticiones[siguiente] if siguiente < len(repeticiones) and repeticiones[siguiente] < fin else fin
+        if inicio < corte:
+            yield from [(valor, nivel + desplazamiento) for valor, nivel in hojas[inicio:corte]]
+        if corte < fin:
+            anidado_inicio, anidado_fin, anidado_desplazamiento, anidado_total = hojas[corte]
+            # Primero el tramo anidado y después el resto de este, que no es un contenedor.
+            if corte + 1 < fin:
+                pendientes.append((corte + 1, fin, desplazamiento, math.inf))
+            pendientes.append((anidado_inicio, anidado_fin, desplazamiento + anidado_desplazamiento, anidado_total))
+
+
+def _iterar_memorizando(elemento: Any, profundidad: int, error_en_ciclo: bool) -> Iterator[tuple[Any, int]]:
+    """
+    Recorrido de iterar_estructura que guarda las hojas encontradas y, por cada
+    contenedor terminado, su tramo en ellas, para repetirlo si el contenedor reaparece.
+    Una repetición no se copia: se guarda un _Tramo que apunta a las hojas originales.
+    """
+    categorias = _CATEGORIAS.get
+    en_camino: set[int] = set()
+    # Pares (valor, nivel) recorridos y, en las posiciones de `repeticiones`, un _Tramo.
+    hojas: list[Any] = []
+    repeticiones: list[int] = []
+    expandidos: dict[tuple[int, int], list[tuple[Any, int]]] = {}
+    # id del contenedor -> (inicio, fin, nivel de sus hijos, total entregado) en `hojas`.
+    tramos: dict[int, tuple[int, int, int, int]] = {}
+    # Hojas entregadas por las repeticiones de más de las que ocupan en `hojas`.
+    extra = 0
+    ciclos = 0
+    # Cada entrada: (iterador de hijos, nivel de los hijos, id del contenedor, inicio en hojas,
+    # hojas entregadas al entrar, ciclos al entrar).
+    pila: list[tuple[Iterator[Any], int, int, int, int, int]] = [(iter((elemento,)), profundidad, 0, 0, 0, 0)]
+    while pila:
+        hijos, nivel, _, _, _, _ = pila[-1]
+        for hijo in hijos:
+            categoria = categorias(type(hijo))
+            if categoria is None:
+                categoria = _categoria(type(hijo))
+            if categoria == _HOJA:
+                par = (hijo, nivel)
+            elif categoria == _OTRO:
+                par = (repr(hijo), nivel)
+            elif (clave := id(hijo)) in en_camino:
+                ciclos += 1
+                par = (_referencia_ciclica(hijo, nivel, pila, error_en_ciclo), nivel)
+            elif clave in tramos:
+                inicio, fin, nivel_original, total = tramos[clave]
+                tramo = _Tramo(inicio, fin, nivel + 1 - nivel_original, total)
+                repeticiones.append(len(hojas))
+                hojas.append(tramo)
+                extra += total - 1
+                yield from _repetir(hojas, repeticiones, tramo, expandidos)
+                continue
+            else:
+                en_camino.add(clave)
+                contenido = hijo.values() if categoria == _DICCIONARIO else hijo
+                pila.append((iter(contenido), nivel + 1, clave, len(hojas), len(hojas) + extra, ciclos))
+                break
+            hojas.append(par)
+            yield par
+        else:
+            _, nivel, clave, inicio, entregadas, ciclos_al_entrar = pila.pop()
+            en_camino.discard(clave)
+            # Un contenedor con ciclos dentro no se repite: su contenido depende del camino.
+            if pila and ciclos == ciclos_al_entrar:
+                tramos[clave] = (inicio, len(hojas), nivel, len(hojas) + extra - entregadas)
+
+
+def explorar_estructura(
+    elemento: Any,
+    profundidad: int = 1,
+    memorizar: bool = False,
+    error_en_ciclo: bool = False,
+    detectar_ciclos: bool = True,
+) -> list[tuple[Any, int]]:
     """
-    Explora recursivamente cualquier estructura de datos (listas, diccionarios, etc.)
+    Explora cualquier estructura de datos (listas, diccionarios, etc.)
     e identifica los valores no iterables junto a su nivel de profundidad.
 
+    Es una envoltura de iterar_estructura que devuelve todos los resultados en una lista.
+
     Args:
         elemento (Any): Estructura de datos a explorar (puede contener listas, tuplas, dict, etc.).
         profundidad (int, optional): Nivel actual de profundidad. Por defecto es 1.
+        memorizar (bool, optional): Recorre una sola vez los contenedores compartidos.
+        error_en_ciclo (bool, optional): Si es True, un ciclo lanza ValueError en lugar de marcarse.
+        detectar_ciclos (bool, optional): Si es False, no registra el camino actual: más
+            rápido, pero no termina con estructuras cíclicas. Por defecto es True.
 
     Returns:
         list[tuple[Any, int]]: Lista de tuplas con cada valor no iterable y su profundidad.
     """
-    resultados: list[tuple[Any, int]] = []
+    return list(iterar_estructura(elemento, profundidad, memorizar, error_en_ciclo, detectar_ciclos))
+
+
+# ----------------------- EXPLORACIÓN DE JSON EN STREAMING -----------------------
+
+_TOKEN_JSON = re.compile(
+    r'[ \t\n\r]*(?:([\[\]{}:,])|(")|(-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?)|(true|false|null))'
+)
+# Todo lo que no es un corchete o llave, incluidas cadenas completas (con sus escapes).
+_SIN_ESTRUCTURA_JSON = re.compile(r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.DOTALL)
+_CONTINUACION_NUMERO = re.compile(r'[0-9.eE+-]*')
+
+
+def _objeto_sin_claves_repetidas(pares: list[tuple[str, Any]]) -> dict[str, Any]:
+    """
+    object_pairs_hook del decodificador: un objeto con claves repetidas se rechaza
+    para que se lea token por token y entregue todas sus hojas.
+    """
+    objeto = dict(pares)
+    if len(objeto) != len(pares):
+        raise ValueError("clave repetida")
+    return objeto
+
+
+def _rechazar_constante(nombre: str) -> Any:
+    """parse_constant del decodificador: NaN e Infinity no son JSON y el tokenizador no los acepta."""
+    raise ValueError(f"constante no permitida: {nombre}")
+
+
+# Decodificador de los contenedores completos: rechaza lo que el tokenizador no
+# entregaría igual, y entonces el contenedor se lee token por token.
+_DECODIFICADOR_JSON = json.JSONDecoder(
+    object_pairs_hook=_objeto_sin_claves_repetidas, parse_constant=_rechazar_constante
+)
+_INCOMPLETO = object()
+_LITERALES_JSON = {"true": True, "false": False, "null": None}
+_SEGMENTO_FILTRO = re.compile(r'\.?([^.\[\]]+)|\[(\*|[0-9]+)\]')
+
+# Comodines de los filtros: `*` (cualquier clave) y `[*]` (cualquier índice).
+_CUALQUIER_CLAVE = object()
+_CUALQUIER_INDICE = object()
+
+
+def _compilar_filtro(filtro: str) -> tuple[Any, ...]:
+    """
+    Convierte un filtro como "a.b[*]" o "datos[0].*" en sus segmentos.
+
+    Raises:
+        ValueError: Si el filtro no tiene la sintaxis esperada.
+    """
+    segmentos: list[Any] = []
+    posicion = 0
+    while posicion < len(filtro):
+        coincidencia = _SEGMENTO_FILTRO.match(filtro, posicion)
+        if not coincidencia or (posicion == 0 and filtro.startswith(".")):
+            raise ValueError(f"Filtro inválido: {filtro!r}")
+        clave, indice = coincidencia.groups()
+        if clave is not None:
+            segmentos.append(_CUALQUIER_CLAVE if clave == "*" else clave)
+        else:
+            segmentos.append(_CUALQUIER_INDICE if indice == "*" else int(indice))
+        posicion = coincidencia.end()
+    return tuple(segmentos)
+
+
+def _coincide(segmento: Any, componente: Any) -> bool:
+    """Indica si una clave o índice del camino coincide con un segmento del filtro."""
+    if segmento is _CUALQUIER_CLAVE:
+        return isinstance(componente, str)
+    if segmento is _CUALQUIER_INDICE:
+        return isinstance(componente, int)
+    return type(segmento) is type(componente) and segmento == componente
+
+
+class _LectorJSON:
+    """
+    Tokenizador incremental de JSON: lee el archivo por bloques y solo guarda en
+    memoria el bloque actual (más el token que quede partido entre dos bloques).
+    """
+
+    def __init__(self, archivo: TextIO, tamano_bloque: int) -> None:
+        self.archivo = archivo
+        self.tamano_bloque = tamano_bloque
+        self.buffer = ""
+        self.posicion = 0
+        self.descartados = 0
+        self.agotado = False
+        self.decodificar_completos = True
+
+    def _rellenar(self) -> bool:
+        """Descarta lo ya leído y agrega el siguiente bloque. Devuelve False al final del archivo."""
+        bloque = self.archivo.read(self.tamano_bloque)
+        if not bloque:
+            self.agotado = True
+            return False
+        self.descartados += self.posicion
+        self.buffer = self.buffer[self.posicion:] + bloque
+        self.posicion = 0
+        self.decodificar_completos = True
+        return True
+
+    def error(self, mensaje: str) -> ValueError:
+        return ValueError(f"JSON inválido cerca del carácter {self.descartados + self.posicion}: {mensaje}")
+
+    def token(self) -> tuple[Optional[str], Any]:
+        """
+        Devuelve el siguiente token como (tipo, valor): tipo es un signo de
+        puntuación ("{", "}", "[", "]", ":", ","), "cadena", "valor" (número,
+        true, false o null) o None al final del archivo.
+        """
+        while True:
+            coincidencia = _TOKEN_JSON.match(self.buffer, self.posicion)
+            # Un token que llega justo al final del bloque puede continuar en el siguiente.
+            if coincidencia and (self.agotado or coincidencia.end() < len(self.buffer)):
+                signo, comilla, numero, fraccion, exponente, literal = coincidencia.groups()
+                if signo:
+                    self.posicion = coincidencia.end()
+                    return signo, None
+                if comilla:
+                    try:
+                        cadena, fin = scanstring(self.buffer, coincidencia.end())
+                    except json.JSONDecodeError as error:
+                        if self.agotado:
+                            raise self.error(error.msg) from None
+                        self._rellenar()
+                        continue
+                    self.posicion = fin
+                    return "cadena", cadena
+                if numero and not self.agotado and (
+                    _CONTINUACION_NUMERO.match(self.buffer, coincidencia.end()).end() == len(self.buffer)
+                ):
+                    # "25" al final del bloque podría seguir como "25.0" o "25e3".
+                    self._rellenar()
+                    continue
+                self.posicion = coincidencia.end()
+                if numero:
+                    return "valor", float(numero) if fraccion or exponente else int(numero)
+                return "valor", _LITERALES_JSON[literal]
+            if not self.agotado:
+                self._rellenar()
+                continue
+            if self.buffer[self.posicion:].strip(" \t\n\r"):
+                raise self.error(f"token inesperado {self.buffer[self.posicion:self.posicion + 20]!r}")
+            return None, None
 
-    # Caso base: si el elemento no es iterable (string, número, etc.)
+    def contenedor_completo(self) -> Any:
+        """
+        Justo después de leer "{" o "[", intenta decodificar el contenedor entero con el
+        decodificador nativo de json. Devuelve _INCOMPLETO si no termina dentro del bloque
+        actual; entonces no se vuelve a intentar hasta el siguiente bloque.
+        """
+        if not self.decodificar_completos:
+            return _INCOMPLETO
+        try:
+            valor, fin = _DECODIFICADOR_JSON.raw_decode(self.buffer, self.posicion - 1)
+        except (ValueError, RecursionError):
+            self.decodificar_completos = False
+            return _INCOMPLETO
+        self.posicion = fin
+        return valor
+
+    def saltar(self, tipo: Optional[str]) -> None:
+        """
+        Salta el valor que empieza con el token `tipo`. Los contenedores que terminan
+        dentro del bloque se decodifican de una vez; el resto se recorre contando
+        corchetes y llaves (las cadenas se saltan enteras con una expresión regular).
+        """
+        if tipo not in ("{", "[") or self.contenedor_completo() is not _INCOMPLETO:
+            return
+        abiertos = 1
+        while abiertos:
+            self.posicion = _SIN_ESTRUCTURA_JSON.match(self.buffer, self.posicion).end()
+            # Se detuvo al final del bloque o ante una cadena que sigue en el próximo bloque.
+            if self.posicion == len(self.buffer) or self.buffer[self.posicion] == '"':
+                if not self._rellenar():
+                    raise self.error("estructura sin cerrar")
+                continue
+            self.posicion += 1
+            if self.buffer[self.posicion - 1] not in "[{":
+                abiertos -= 1
+            elif self.contenedor_completo() is _INCOMPLETO:
+                abiertos += 1
+
+
+def iterar_json(
+    origen: Union[str, os.PathLike, TextIO],
+    filtro: Optional[str] = None,
+    profundidad: int = 1,
+    tamano_bloque: int = 1 << 16,
+) -> Iterator[tuple[Any, int]]:
+    """
+    Recorre un documento JSON directamente desde el archivo, sin cargarlo entero,
+    y produce los mismos pares (valor, profundidad) que
+    explorar_estructura(json.load(archivo)).
+
+    Solo se guarda en memoria un bloque del archivo y el camino actual. Con un
+    filtro, los subárboles que no coinciden se saltan sin recorrerlos: si terminan
+    dentro del bloque se decodifican de una vez y se descartan; si no, se cuentan
+    corchetes. Su contenido no se valida.
+
+    Las claves repetidas de un objeto entregan todas sus hojas (json.load solo
+    conserva la última), y NaN, Infinity y -Infinity no se aceptan, sea cual sea
+    `tamano_bloque`.
+
+    Args:
+        origen (str | os.PathLike | TextIO): Ruta del archivo o archivo abierto en modo texto.
+        filtro (str, optional): Camino de las hojas a entregar, con claves separadas por
+            puntos, `[n]` para un índice, `[*]` para cualquier índice y `*` para cualquier
+            clave (ej. "a.b[*]"). Se entregan las hojas que están en ese camino o debajo.
+        profundidad (int, optional): Nivel de profundidad de la raíz. Por defecto es 1.
+        tamano_bloque (int, optional): Caracteres leídos por bloque.
+
+    Yields:
+        tuple[Any, int]: Cada valor no iterable y su profundidad.
+
+    Raises:
+        ValueError: Si el JSON o el filtro no son válidos.
+    """
+    if isinstance(origen, (str, os.PathLike)):
+        with open(origen, mode="r", encoding="utf-8") as archivo:
+            yield from iterar_json(archivo, filtro, profundidad, tamano_bloque)
+        return
+
+    lector = _LectorJSON(origen, tamano_bloque)
+    segmentos = _compilar_filtro(filtro) if filtro else ()
+    # Por cada contenedor abierto: su tipo ("{" o "[") y la clave o índice actual.
+    abiertos: list[str] = []
+    camino: list[Any] = []
+
+    tipo, valor = lector.token()
+    if tipo is None:
+        raise lector.error("documento vacío")
+    while True:
+        # (tipo, valor) es el primer token de un valor cuyo camino es `camino`.
+        nivel = len(camino)
+        if nivel and nivel <= len(segmentos) and not _coincide(segmentos[nivel - 1], camino[-1]):
+            lector.saltar(tipo)
+        elif tipo == "cadena" or tipo == "valor":
+            if nivel >= len(segmentos):
+                yield valor, profundidad + nivel
+        elif (tipo == "{" or tipo == "[") and (contenedor := lector.contenedor_completo()) is not _INCOMPLETO:
+            # Contenedor entero dentro del bloque: se decodifica en C y se recorre en memoria
+            # (lo decodificado de JSON no tiene ciclos, así que no se registra el camino).
+            if nivel >= len(segmentos):
+                yield from iterar_estructura(contenedor, profundidad + nivel, detectar_ciclos=False)
+            else:
+                yield from _filtrar_en_memoria(contenedor, segmentos[nivel:], profundidad + nivel)
+        elif tipo == "{" or tipo == "[":
+            cierre = "}" if tipo == "{" else "]"
+            siguiente, valor = lector.token()
+            if siguiente != cierre:
+                abiertos.append(tipo)
+                if tipo == "[":
+                    camino.append(0)
+                    tipo = siguiente
+                    continue
+                camino.append(_leer_clave(lector, siguiente, valor))
+                tipo, valor = lector.token()
+                continue
+        else:
+            raise lector.error(f"se esperaba un valor y llegó {tipo!r}")
+
+        # Valor terminado: sigue una coma o el cierre de uno o más contenedores.
+        while abiertos:
+            tipo, valor = lector.token()
+            if tipo == ",":
+                if abiertos[-1] == "[":
+                    camino[-1] += 1
+                else:
+                    siguiente, valor = lector.token()
+                    camino[-1] = _leer_clave(lector, siguiente, valor)
+                tipo, valor = lector.token()
+                break
+            if tipo != ("}" if abiertos[-1] == "{" else "]"):
+                raise lector.error(f"se esperaba ',' o cierre y llegó {tipo!r}")
+            abiertos.pop()
+            camino.pop()
+        else:
+            if lector.token()[0] is not None:
+                raise lector.error("contenido después del final del documento")
+            return
+
+
+def _filtrar_en_memoria(valor: Any, segmentos: tuple[Any, ...], profundidad: int) -> Iterator[tuple[Any, int]]:
+    """Aplica los segmentos restantes de un filtro a un valor ya decodificado y lo recorre."""
+    if not segmentos:
+        yield from iterar_estructura(valor, profundidad, detectar_ciclos=False)
+        return
+    if isinstance(valor, dict):
+        hijos = valor.items()
+    elif isinstance(valor, list):
+        hijos = enumerate(valor)
+    else:
+        return
+    segmento, resto = segmentos[0], segmentos[1:]
+    for componente, hijo in hijos:
+        if _coincide(segmento, componente):
+            yield from _filtrar_en_memoria(hijo, resto, profundidad + 1)
+
+
+def _leer_clave(lector: _LectorJSON, tipo: Optional[str], valor: Any) -> str:
+    """Valida una clave de objeto y consume los dos puntos que la siguen."""
+    if tipo != "cadena":
+        raise lector.error(f"se esperaba una clave y llegó {tipo!r}")
+    if lector.token()[0] != ":":
+        raise lector.error("se esperaban ':' después de la clave")
+    return valor
+
+
+# ----------------------- ESTADÍSTICAS -----------------------
+
+# Bytes que sys.getsizeof suma a __sizeof__ en los contenedores (cabecera del recolector).
+_CABECERA_GC = sys.getsizeof([]) - [].__sizeof__()
+# Tipos exactos cuyo tamaño se calcula con __sizeof__ (más la cabecera en los contenedores).
+# Las subclases tienen además __dict__ y otras cabeceras: para ellas se usa sys.getsizeof.
+_HOJAS_SIN_CABECERA = frozenset(_TIPOS_HOJA)
+_CONTENEDORES_CON_CABECERA = frozenset((dict, list, tuple, set))
+
+
+def calcular_estadisticas(elemento: Any, profundidad: int = 1) -> dict[str, Any]:
+    """
+    Resume una estructura en una sola pasada, sin guardar la lista de hojas.
+
+    Recorre la estructura igual que iterar_estructura (pila explícita y ciclos
+    marcados) pero solo acumula conteos. La memoria es aproximada: suma
+    sys.getsizeof de cada contenedor y cada hoja cada vez que aparecen, sin contar
+    las claves de los diccionarios ni descontar objetos compartidos.
+
+    Args:
+        elemento (Any): Estructura de datos a resumir.
+        profundidad (int, optional): Nivel de profundidad del elemento raíz. Por defecto es 1.
+
+    Returns:
+        dict[str, Any]: Diccionario con las claves:
+            "hojas", "contenedores" y "ciclos" (totales),
+            "hojas_por_profundidad" (nivel -> cantidad, en orden de nivel),
+            "hojas_por_tipo" (nombre del tipo -> cantidad, de mayor a menor),
+            "profundidad_maxima" (de hojas y contenedores),
+            "contenedor_mas_ancho" ({"tipo", "elementos", "profundidad"} o None) y
+            "memoria_aproximada" (bytes).
+    """
+    categorias = _CATEGORIAS.get
+    # Por nivel, tipo -> hojas; cada nivel de la pila guarda su diccionario para no
+    # construir una clave (nivel, tipo) por hoja.
+    por_nivel: dict[int, dict[type, int]] = {}
+    contenedores = ciclos = memoria = 0
+    profundidad_maxima = profundidad
+    mas_ancho: Optional[dict[str, Any]] = None
+    ancho_maximo = -1
+    en_camino: set[int] = set()
+    # Como en _iterar, más el diccionario de conteos del nivel de los hijos.
+    conteo = por_nivel[profundidad] = {}
+    pila: list[tuple[Iterator[Any], int, int, dict[type, int]]] = [(iter((elemento,)), profundidad, 0, conteo)]
+    while pila:
+        hijos, nivel, _, conteo = pila[-1]
+        for hijo in hijos:
+            tipo = type(hijo)
+            categoria = categorias(tipo)
+            if categoria is None:
+                categoria = _categoria(tipo)
+            if categoria == _HOJA:
+                conteo[tipo] = conteo.get(tipo, 0) + 1
+                # Las hojas no llevan cabecera del recolector: __sizeof__ coincide con
+                # sys.getsizeof y es varias veces más rápido.
+                memoria += hijo.__sizeof__() if tipo in _HOJAS_SIN_CABECERA else sys.getsizeof(hijo)
+            elif categoria == _OTRO:
+                conteo[tipo] = conteo.get(tipo, 0) + 1
+                memoria += sys.getsizeof(hijo)
+            elif (clave := id(hijo)) in en_camino:
+                ciclos += 1
+                conteo[ReferenciaCiclica] = conteo.get(ReferenciaCiclica, 0) + 1
+            else:
+                contenedores += 1
+                if tipo in _CONTENEDORES_CON_CABECERA:
+                    memoria += hijo.__sizeof__() + _CABECERA_GC
+                else:
+                    memoria += sys.getsizeof(hijo)
+                if (ancho := len(hijo)) > ancho_maximo:
+                    ancho_maximo = ancho
+                    mas_ancho = {"tipo": tipo.__name__, "elementos": ancho, "profundidad": nivel}
+                siguiente = por_nivel.get(nivel + 1)
+                if siguiente is None:
+                    siguiente = por_nivel[nivel + 1] = {}
+                    # Primer contenedor de este nivel: cuenta para la profundidad aunque esté vacío.
+                    profundidad_maxima = max(profundidad_maxima, nivel)
+                en_camino.add(clave)
+                pila.append((iter(hijo.values() if categoria == _DICCIONARIO else hijo), nivel + 1, clave, siguiente))
+                break
+        else:
+            en_camino.discard(pila.pop()[2])
+
+    por_profundidad: dict[int, int] = {}
+    por_tipo: dict[str, int] = {}
+    for nivel, conteo in por_nivel.items():
+        if conteo:
+            por_profundidad[nivel] = sum(conteo.values())
+        for tipo, cantidad in conteo.items():
+            por_tipo[tipo.__name__] = por_tipo.get(tipo.__name__, 0) + cantidad
+    if por_profundidad:
+        profundidad_maxima = max(profundidad_maxima, max(por_profundidad))
+    return {
+        "hojas": sum(por_profundidad.values()),
+        "contenedores": contenedores,
+        "ciclos": ciclos,
+        "hojas_por_profundidad": dict(sorted(por_profundidad.items())),
+        "hojas_por_tipo": dict(sorted(por_tipo.items(), key=lambda par: (-par[1], par[0]))),
+        "profundidad_maxima": profundidad_maxima,
+        "contenedor_mas_ancho": mas_ancho,
+        "memoria_aproximada": memoria,
+    }
+
+
+def mostrar_estadisticas(estadisticas: dict[str, Any]) -> None:
+    """
+    Muestra el resumen de calcular_estadisticas en tablas compactas usando rich.
+
+    Args:
+        estadisticas (dict[str, Any]): Resultado de calcular_estadisticas.
+
+    Returns:
+        None
+    """
+    console = Console()
+    resumen = Table(title="📊 Resumen de la estructura", header_style="bold magenta")
+    resumen.add_column("Métrica", style="cyan")
+    resumen.add_column("Valor", justify="right", style="green")
+    mas_ancho = estadisticas["contenedor_mas_ancho"]
+    resumen.add_row("Hojas", f"{estadisticas['hojas']:,}")
+    resumen.add_row("Contenedores", f"{estadisticas['contenedores']:,}")
+    resumen.add_row("Ciclos", f"{estadisticas['ciclos']:,}")
+    resumen.add_row("Profundidad máxima", str(estadisticas["profundidad_maxima"]))
+    resumen.add_row(
+        "Contenedor más ancho",
+        f"{mas_ancho['tipo']} de {mas_ancho['elementos']:,} (nivel {mas_ancho['profundidad']})" if mas_ancho else "-",
+    )
+    resumen.add_row("Memoria aproximada", f"{estadisticas['memoria_aproximada'] / 1024:,.1f} KiB")
+    console.print(resumen)
+
+    total = estadisticas["hojas"] or 1
+    detalle = Table(title="Hojas por profundidad y por tipo", header_style="bold magenta")
+    detalle.add_column("Profundidad", justify="right", style="cyan")
+    detalle.add_column("Hojas", justify="right")
+    detalle.add_column("", style="green")
+    detalle.add_column("Tipo", style="cyan")
+    detalle.add_column("Hojas", justify="right")
+    niveles = list(estadisticas["hojas_por_profundidad"].items())
+    tipos = list(estadisticas["hojas_por_tipo"].items())
+    for i in range(max(len(niveles), len(tipos))):
+        nivel, cantidad = niveles[i] if i < len(niveles) else ("", None)
+        tipo, cantidad_tipo = tipos[i] if i < len(tipos) else ("", None)
+        detalle.add_row(
+            str(nivel),
+            f"{cantidad:,}" if cantidad is not None else "",
+            "█" * round(20 * cantidad / total) if cantidad else "",
+            tipo,
+            f"{cantidad_tipo:,}" if cantidad_tipo is not None else "",
+        )
+    console.print(detalle)
+
+
+# ----------------------- RENDIMIENTO -----------------------
+
+def _explorar_recursivo(elemento: Any, profundidad: int = 1) -> list[tuple[Any, int]]:
+    """Versión recursiva anterior de explorar_estructura, solo para comparar rendimiento."""
+    resultados: list[tuple[Any, int]] = []
     if isinstance(elemento, (str, int, float, bool)) or elemento is None:
         resultados.append((elemento, profundidad))
-        return resultados
-
-    # Si es un diccionario, exploramos sus valores
-    if isinstance(elemento, dict):
+    elif isinstance(elemento, dict):
         for valor in elemento.values():
-            resultados.extend(explorar_estructura(valor, profundidad + 1))
-
-    # Si es una lista, tupla o conjunto, exploramos sus elementos
+            resultados.extend(_explorar_recursivo(valor, profundidad + 1))
     elif isinstance(elemento, (list, tuple, set)):
         for sub_elemento in elemento:
-            resultados.extend(explorar_estructura(sub_elemento, profundidad + 1))
-
-    # Cualquier otro tipo de objeto (caso residual)
+            resultados.extend(_explorar_recursivo(sub_elemento, profundidad + 1))
     else:
         resultados.append((repr(elemento), profundidad))
+    return resultados
 
+
+def comparar_rendimiento_exploracion(
+    hojas: int = 1_000_000, profundidad_cadena: int = 100_000, repeticiones: int = 3
+) -> dict[str, float]:
+    """
+    Compara la versión recursiva anterior con explorar_estructura (con y sin detectar
+    ciclos) sobre una estructura ancha de `hojas` hojas y una cadena de
+    `profundidad_cadena` niveles.
+
+    Args:
+        hojas (int, optional): Hojas de la estructura ancha (listas y diccionarios).
+        profundidad_cadena (int, optional): Niveles de la cadena [n, [n - 1, [...]]].
+        repeticiones (int, optional): Se toma el mejor tiempo de este número de ejecuciones.
+
+    Returns:
+        dict[str, float]: Segundos de cada variante; NaN si lanza RecursionError.
+    """
+    ancha = [[i, str(i), {"a": i, "b": [i, i + 0.5]}] for i in range(hojas // 5)]
+    cadena: list = [0]
+    for i in range(1, profundidad_cadena):
+        cadena = [i, cadena]
+    variantes = {
+        "recursiva": _explorar_recursivo,
+        "explorar_estructura": explorar_estructura,
+        "sin detectar ciclos": lambda estructura: explorar_estructura(estructura, detectar_ciclos=False),
+    }
+    resultados = {}
+    for nombre_estructura, estructura in (("ancha", ancha), ("cadena", cadena)):
+        for nombre, funcion in variantes.items():
+            tiempos = []
+            for _ in range(repeticiones):
+                inicio = perf_counter()
+                try:
+                    funcion(estructura)
+                except RecursionError:
+                    tiempos.append(math.nan)
+                    break
+                tiempos.append(perf_counter() - inicio)
+            resultados[f"{nombre_estructura}: {nombre}"] = min(tiempos)
     return resultados
 
 
+def mostrar_rendimiento_exploracion(hojas: int = 1_000_000, profundidad_cadena: int = 100_000) -> None:
+    """Muestra en una tabla el resultado de comparar_rendimiento_exploracion."""
+    tabla = Table(title=f"Exploración de {hojas:,} hojas y de una cadena de {profundidad_cadena:,} niveles")
+    tabla.add_column("Variante", style="cyan")
+    tabla.add_column("Segundos", justify="right", style="green")
+    for nombre, segundos in comparar_rendimiento_exploracion(hojas, profundidad_cadena).items():
+        tabla.add_row(nombre, "RecursionError" if math.isnan(segundos) else f"{segundos:.3f}")
+    Console().print(tabla)
+
+
 def mostrar_tabla_resultados(resultados: list[tuple[Any, int]]) -> None:
     """
     Muestra los valores y su profundidad en una tabla usando la librería rich.
@@ -60,7 +829,22 @@ def mostrar_tabla_resultados(resultados: list[tuple[Any, int]]) -> None:
     console.print(tabla)
 
 
-if __name__ == "__main__":
+def main(argumentos: Optional[list[str]] = None) -> None:
+    """
+    Explora una estructura de ejemplo y muestra sus hojas y estadísticas.
+
+    Con el argumento `--rendimiento` muestra en su lugar mostrar_rendimiento_exploracion.
+    """
+    argumentos = sys.argv[1:] if argumentos is None else argumentos
+    if argumentos == ["--rendimiento"]:
+        mostrar_rendimiento_exploracion()
+        return
+
     estructura = [1, [2, 3], {"a": 4, "b": [5, {"c": 6}]}]
     resultados = explorar_estructura(estructura)
     mostrar_tabla_resultados(resultados)
+    mostrar_estadisticas(calcular_estadisticas(estructura))
+
+
+if __name__ == "__main__":
+    main()
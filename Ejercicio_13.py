@@ -1,9 +1,12 @@
 import json
-from typing import List, TypedDict, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, TypedDict, Optional
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 
+from tabla_paginada import Columna, crear_tabla, mostrar_tabla_paginada
+
 Console = Console()
 INVENTARIO_FILE = "inventario.json"
 
@@ -192,27 +195,50 @@ def modificar_producto(
     raise ValueError("Producto no encontrado.")
 
 
-def mostrar_inventario(inventario: List[Producto]) -> Table:
+COLUMNAS_INVENTARIO = (
+    Columna("ID", justify="right", style="cyan"),
+    Columna("Nombre", style="bold"),
+    Columna("Precio", justify="right"),
+    Columna("Stock", justify="right"),
+)
+
+
+def _filas_inventario(inventario: Iterable[Producto]) -> Iterator[tuple[str, str, str, str]]:
+    """Genera perezosamente las filas de texto del inventario."""
+    for prod in inventario:
+        precio_str = f"$ {format(prod['precio'], ',.0f').replace(',', '.')}"
+        yield str(prod["id"]), prod["nombre"], precio_str, str(prod["stock"])
+
+
+def mostrar_inventario(inventario: List[Producto], inicio: int = 0, limite: Optional[int] = None) -> Table:
     """
     Crea y retorna una tabla rich con el inventario (no imprime directamente).
 
     Args:
         inventario: Lista de productos.
+        inicio: Índice del primer producto a incluir.
+        limite: Cantidad máxima de productos a incluir (None = todos desde `inicio`).
 
     Returns:
         rich.table.Table con la representación del inventario.
     """
-    tabla = Table(title="📦 Inventario", show_lines=True)
-    tabla.add_column("ID", justify="right", style="cyan")
-    tabla.add_column("Nombre", style="bold")
-    tabla.add_column("Precio", justify="right")
-    tabla.add_column("Stock", justify="right")
+    fin = None if limite is None else inicio + limite
+    ventana = islice(inventario, inicio, fin)
+    return crear_tabla("📦 Inventario", COLUMNAS_INVENTARIO, _filas_inventario(ventana), show_lines=True)
 
-    for prod in inventario:
-        precio_str = f"$ {format(prod['precio'], ',.0f').replace(',', '.')}"
-        tabla.add_row(str(prod["id"]), prod["nombre"], precio_str, str(prod["stock"]))
 
-    return tabla
+def imprimir_inventario(inventario: List[Producto], tamano_pagina: int = 50) -> None:
+    """
+    Imprime el inventario página a página, formateando solo la página visible.
+
+    Args:
+        inventario: Lista de productos.
+        tamano_pagina: Filas por página.
+    """
+    mostrar_tabla_paginada(
+        "📦 Inventario", COLUMNAS_INVENTARIO, _filas_inventario(inventario), tamano_pagina,
+        consola=Console, show_lines=True,
+    )
 
 
 if __name__ == "__main__":
@@ -221,5 +247,4 @@ if __name__ == "__main__":
         inv = []
         agregar_producto(inv, "Camisa", 50000.0, 10)
         agregar_producto(inv, "Pantalón", 80000.0, 5)
-    tabla = mostrar_inventario(inv)
-    Console.print(tabla)
+    imprimir_inventario(inv)
@@ -6,10 +6,12 @@ Ejercicio 14: Generador de Reportes a partir de Múltiples Archivos
 import csv
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from rich.console import Console
 from rich.panel import Panel
 
+from registros_estudiantes import RegistrosEstudiantes
+
 console = Console()
 
 
@@ -32,6 +34,27 @@ def leer_csv(nombre_archivo: str) -> List[Dict[str, str]]:
         return []
 
 
+def leer_csv_compacto(nombre_archivo: str) -> RegistrosEstudiantes:
+    """
+    Lee un archivo CSV de estudiantes en un almacén compacto por columnas,
+    sin crear un diccionario por fila.
+
+    Args:
+        nombre_archivo (str): Ruta al archivo CSV.
+
+    Returns:
+        RegistrosEstudiantes: Estudiantes leídos (vacío si el archivo no existe o no es válido).
+    """
+    try:
+        with open(nombre_archivo, mode="r", encoding="utf-8", newline="") as archivo:
+            return RegistrosEstudiantes.desde_csv(archivo)
+    except FileNotFoundError:
+        console.print(f"[red] No se encontró el archivo CSV: {nombre_archivo}[/red]")
+    except ValueError as error:
+        console.print(f"[red] {error} ({nombre_archivo})[/red]")
+    return RegistrosEstudiantes()
+
+
 def leer_json(nombre_archivo: str) -> Dict[str, Any]:
     """
     Lee un archivo JSON y devuelve un diccionario con su contenido.
@@ -53,12 +76,13 @@ def leer_json(nombre_archivo: str) -> Dict[str, Any]:
         return {}
 
 
-def generar_reporte(estudiantes: List[Dict[str, str]], cursos: Dict[str, Any]) -> str:
+def generar_reporte(estudiantes: Union[List[Dict[str, str]], RegistrosEstudiantes], cursos: Dict[str, Any]) -> str:
     """
     Combina la información de estudiantes y cursos en un reporte de texto.
 
     Args:
-        estudiantes (List[Dict[str, str]]): Lista de estudiantes con id y nombre.
+        estudiantes (List[Dict[str, str]] | RegistrosEstudiantes): Lista de estudiantes con id y nombre,
+            o el almacén compacto de leer_csv_compacto.
         cursos (Dict[str, Any]): Diccionario con id de estudiante y lista de cursos.
 
     Returns:
@@ -67,12 +91,17 @@ def generar_reporte(estudiantes: List[Dict[str, str]], cursos: Dict[str, Any]) -
     if not estudiantes:
         return " No hay datos de estudiantes para generar el reporte."
 
-    reporte = ""
-    for est in estudiantes:
-        cursos_est = cursos.get(est["id"], ["Sin cursos registrados"])
-        lista_cursos = ", ".join(cursos_est)
-        reporte += f"Estudiante: {est['nombre']}\nCursos: {lista_cursos}\n\n"
-    return reporte.strip()
+    if isinstance(estudiantes, RegistrosEstudiantes):
+        pares = zip(estudiantes.iterar_ids(), estudiantes.nombres)
+    else:
+        pares = ((est["id"], est["nombre"]) for est in estudiantes)
+
+    sin_cursos = ["Sin cursos registrados"]
+    bloques = [
+        f"Estudiante: {nombre}\nCursos: {', '.join(cursos.get(id_estudiante, sin_cursos))}"
+        for id_estudiante, nombre in pares
+    ]
+    return "\n\n".join(bloques).strip()
 
 
 def guardar_reporte(nombre_archivo: str, contenido: str) -> None:
@@ -99,7 +128,7 @@ def main() -> None:
     archivo_json = os.path.join(base_path, "cursos.json")
     archivo_reporte = os.path.join(base_path, "reporte.txt")
 
-    estudiantes = leer_csv(archivo_csv)
+    estudiantes = leer_csv_compacto(archivo_csv)
     cursos = leer_json(archivo_json)
     reporte = generar_reporte(estudiantes, cursos)
 
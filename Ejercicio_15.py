@@ -4,14 +4,17 @@ Ejercicio 15: Mini Sistema de Biblioteca (mejorado)
 """
 
 import json
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, TypedDict
+from typing import Iterable, Iterator, List, Optional, TypedDict
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt
 
+from tabla_paginada import Columna, crear_tabla, mostrar_tabla_paginada
+
 console = Console()
 BIBLIOTECA_FILE = "biblioteca.json"
 
@@ -238,29 +241,52 @@ def ver_libros_prestados(libros: List[Libro]) -> List[Libro]:
     return [lb for lb in libros if lb["prestado_a"]]
 
 
-def crear_tabla_libros(libros: List[Libro]) -> Table:
+COLUMNAS_LIBROS = (
+    Columna("ID", justify="center"),
+    Columna("Título", style="bold"),
+    Columna("Autor"),
+    Columna("Prestado a", justify="center"),
+)
+
+
+def _filas_libros(libros: Iterable[Libro]) -> Iterator[tuple[str, str, str, str]]:
+    """Genera perezosamente las filas de texto de los libros."""
+    for lb in libros:
+        yield (
+            lb["libro_id"],
+            lb["titulo"],
+            str(lb.get("autor") or "-"),
+            str(lb.get("prestado_a") or "-"),
+        )
+
+
+def crear_tabla_libros(libros: List[Libro], inicio: int = 0, limite: Optional[int] = None) -> Table:
     """
     Crea una tabla rich a partir de una lista de libros (no imprime).
 
     Args:
         libros: Lista de libros.
+        inicio: Índice del primer libro a incluir.
+        limite: Cantidad máxima de libros a incluir (None = todos desde `inicio`).
 
     Returns:
         rich.table.Table con la representación.
     """
-    tabla = Table(title="📚 Biblioteca", show_lines=True)
-    tabla.add_column("ID", justify="center")
-    tabla.add_column("Título", style="bold")
-    tabla.add_column("Autor")
-    tabla.add_column("Prestado a", justify="center")
-    for lb in libros:
-        tabla.add_row(
-            lb["libro_id"],
-            lb["titulo"],
-            str(lb.get("autor") or "-"),
-            str(lb.get("prestado_a") or "-"),
-        )
-    return tabla
+    fin = None if limite is None else inicio + limite
+    return crear_tabla("📚 Biblioteca", COLUMNAS_LIBROS, _filas_libros(islice(libros, inicio, fin)), show_lines=True)
+
+
+def imprimir_libros(libros: List[Libro], tamano_pagina: int = 50) -> None:
+    """
+    Imprime los libros página a página, formateando solo la página visible.
+
+    Args:
+        libros: Lista de libros.
+        tamano_pagina: Filas por página.
+    """
+    mostrar_tabla_paginada(
+        "📚 Biblioteca", COLUMNAS_LIBROS, _filas_libros(libros), tamano_pagina, consola=console, show_lines=True
+    )
 
 
 def mostrar_libros(libros: List[Libro]) -> None:
@@ -273,8 +299,7 @@ def mostrar_libros(libros: List[Libro]) -> None:
     if not libros:
         console.print(Panel("[yellow]No hay libros en la biblioteca.[/yellow]"))
         return
-    tabla = crear_tabla_libros(libros)
-    console.print(tabla)
+    imprimir_libros(libros)
 
 
 def mostrar_libros_prestados(libros: List[Libro]) -> None:
@@ -288,9 +313,8 @@ def mostrar_libros_prestados(libros: List[Libro]) -> None:
     if not prestados:
         console.print(Panel("[green]No hay libros prestados.[/green]"))
         return
-    tabla = crear_tabla_libros(prestados)
     console.print(Panel("[bold]Libros prestados[/bold]", style="blue"))
-    console.print(tabla)
+    imprimir_libros(prestados)
 
 
 def mostrar_busqueda(libros: List[Libro], query: str) -> None:
@@ -305,9 +329,8 @@ def mostrar_busqueda(libros: List[Libro], query: str) -> None:
     if not resultados:
         console.print(Panel(f"[yellow]No se encontraron libros para: {query}[/yellow]"))
         return
-    tabla = crear_tabla_libros(resultados)
     console.print(Panel(f"[bold]Resultados para: {query}[/bold]", style="green"))
-    console.print(tabla)
+    imprimir_libros(resultados)
 
 
 def mostrar_menu() -> None:
@@ -1,4 +1,4 @@
-from typing import Tuple, Dict
+from typing import Dict, Iterable, List, Mapping, Sequence, TextIO, Tuple, TypedDict
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -6,6 +6,34 @@ from rich.text import Text
 console = Console()
 
 
+class RegistroPerfil(TypedDict, total=False):
+    """Datos de un perfil para la exportación masiva.
+
+    Atributos:
+        nombre: Nombre del usuario (obligatorio).
+        edad: Edad del usuario (obligatorio).
+        hobbies: Secuencia de hobbies (opcional).
+        redes_sociales: Redes sociales como pares red-usuario (opcional).
+    """
+    nombre: str
+    edad: int
+    hobbies: Sequence[str]
+    redes_sociales: Mapping[str, str]
+
+
+def _renderizar_perfil(nombre: str, edad: int, hobbies: Sequence[str], redes_sociales: Mapping[str, str]) -> str:
+    """Valida los datos y arma el texto del perfil con la plantilla precompilada."""
+    if not nombre.strip():
+        raise ValueError("El nombre no puede estar vacío.")
+    if edad <= 0:
+        raise ValueError("La edad debe ser mayor que 0.")
+
+    hobbies_txt = ", ".join(hobbies) if hobbies else "No especificados"
+    redes_txt = ", ".join([f"{k}: {v}" for k, v in redes_sociales.items()]) if redes_sociales else "No registradas"
+    # Un único f-string: el diseño queda compilado una vez y cada perfil se arma en un solo paso.
+    return f"👤 Nombre: {nombre}\n🎂 Edad: {edad} años\n🎯 Hobbies: {hobbies_txt}\n🌐 Redes Sociales: {redes_txt}"
+
+
 def crear_perfil(nombre: str, edad: int, *hobbies: Tuple[str], **redes_sociales: Dict[str, str]) -> str:
     """
     Genera un perfil de usuario con nombre, edad, hobbies y redes sociales.
@@ -22,25 +50,49 @@ def crear_perfil(nombre: str, edad: int, *hobbies: Tuple[str], **redes_sociales:
     Raises:
         ValueError: Si el nombre está vacío o la edad no es válida.
     """
-    if not nombre.strip():
-        raise ValueError("El nombre no puede estar vacío.")
-    if edad <= 0:
-        raise ValueError("La edad debe ser mayor que 0.")
+    return _renderizar_perfil(nombre, edad, hobbies, redes_sociales)
 
-    perfil = f"👤 Nombre: {nombre}\n🎂 Edad: {edad} años\n"
 
-    if hobbies:
-        perfil += f"🎯 Hobbies: {', '.join(hobbies)}\n"
-    else:
-        perfil += "🎯 Hobbies: No especificados\n"
+def exportar_perfiles(
+    registros: Iterable[RegistroPerfil], destino: TextIO, separador: str = "\n\n"
+) -> List[Tuple[int, str]]:
+    """
+    Renderiza muchos perfiles y los escribe uno a uno en un destino tipo archivo.
 
-    if redes_sociales:
-        redes = ", ".join([f"{k}: {v}" for k, v in redes_sociales.items()])
-        perfil += f"🌐 Redes Sociales: {redes}\n"
-    else:
-        perfil += "🌐 Redes Sociales: No registradas\n"
+    Los registros se consumen de forma perezosa, así que `registros` puede ser un
+    generador de cualquier tamaño. Un registro inválido no detiene la exportación:
+    se omite y su error queda en la lista devuelta.
 
-    return perfil.strip()
+    Args:
+        registros (Iterable[RegistroPerfil]): Registros con nombre, edad y, opcionalmente,
+            hobbies y redes_sociales.
+        destino (TextIO): Objeto con método `write` (archivo, io.StringIO, sys.stdout...).
+        separador (str, optional): Texto escrito después de cada perfil.
+
+    Returns:
+        List[Tuple[int, str]]: Pares (índice del registro, mensaje de error) de los
+        registros que no se pudieron renderizar.
+    """
+    escribir = destino.write
+    errores: List[Tuple[int, str]] = []
+
+    for indice, registro in enumerate(registros):
+        try:
+            perfil = _renderizar_perfil(
+                registro["nombre"],
+                registro["edad"],
+                registro.get("hobbies", ()),
+                registro.get("redes_sociales", {}),
+            )
+        except KeyError as exc:
+            errores.append((indice, f"Falta el campo obligatorio {exc}."))
+            continue
+        except (TypeError, ValueError, AttributeError) as exc:
+            errores.append((indice, str(exc)))
+            continue
+        escribir(perfil + separador)
+
+    return errores
 
 
 def main() -> None:
@@ -1,16 +1,326 @@
+import itertools
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
 console = Console()
+registro_log = logging.getLogger(__name__)
+
+# Segundos de espera antes de reintentar un punto de control que falló.
+ESPERA_REINTENTO = 1.0
+
+
+class RegistroContadores:
+    """
+    Registro de contadores con nombre, seguro para usar desde muchos hilos.
+
+    Cada hilo incrementa su propio fragmento (un diccionario local al hilo), de modo que
+    los incrementos nunca toman un candado global. Las lecturas suman los fragmentos de
+    todos los hilos; el candado solo se usa al registrar el fragmento de un hilo nuevo
+    y al reiniciar. Al registrar un hilo nuevo, los fragmentos de los hilos que ya
+    terminaron se fusionan en uno solo, así que la cantidad de fragmentos no crece
+    con los hilos que van y vienen.
+
+    Ejemplo:
+        >>> registro = RegistroContadores()
+        >>> registro.incrementar("peticiones")
+        >>> registro.incrementar("peticiones", 2)
+        >>> registro.valor("peticiones")
+        3
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # El primer fragmento acumula los conteos de los hilos terminados. La tupla se
+        # reemplaza entera (nunca se modifica), así que un lector siempre ve un estado
+        # coherente sin tomar el candado.
+        self._fragmentos: Tuple[Dict[Hashable, int], ...] = ({},)
+        # Hilo dueño de cada fragmento, alineado con self._fragmentos[1:].
+        self._duenos: List[threading.Thread] = []
+        # Valor acumulado al último reinicio: reiniciar no escribe en fragmentos ajenos.
+        self._bases: Dict[Hashable, int] = {}
+        self._candado = threading.Lock()
+
+    def _fragmento(self) -> Dict[Hashable, int]:
+        """Devuelve (creándolo la primera vez) el fragmento del hilo actual."""
+        try:
+            return self._local.fragmento
+        except AttributeError:
+            fragmento: Dict[Hashable, int] = {}
+            with self._candado:
+                self._retirar_terminados()
+                self._fragmentos = (*self._fragmentos, fragmento)
+                self._duenos.append(threading.current_thread())
+            self._local.fragmento = fragmento
+            return fragmento
+
+    def _retirar_terminados(self) -> None:
+        """Fusiona en el primer fragmento los de hilos terminados (con el candado tomado)."""
+        if all(hilo.is_alive() for hilo in self._duenos):
+            return
+        # Un hilo terminado ya no escribe en su fragmento: se puede sumar sin copiarlo.
+        retirados = dict(self._fragmentos[0])
+        vivos: List[Dict[Hashable, int]] = []
+        duenos: List[threading.Thread] = []
+        for hilo, fragmento in zip(self._duenos, self._fragmentos[1:]):
+            if hilo.is_alive():
+                duenos.append(hilo)
+                vivos.append(fragmento)
+            else:
+                for nombre, conteo in fragmento.items():
+                    retirados[nombre] = retirados.get(nombre, 0) + conteo
+        self._fragmentos = (retirados, *vivos)
+        self._duenos = duenos
+
+    def incrementar(self, nombre: Hashable, cantidad: int = 1) -> None:
+        """
+        Suma `cantidad` al contador `nombre` en el fragmento del hilo actual.
+
+        Args:
+            nombre (Hashable): Nombre del contador.
+            cantidad (int, optional): Valor a sumar. Por defecto 1.
+        """
+        fragmento = self._fragmento()
+        fragmento[nombre] = fragmento.get(nombre, 0) + cantidad
+
+    def _total(self, nombre: Hashable) -> int:
+        """Suma el contador en todos los fragmentos, sin descontar reinicios."""
+        total = 0
+        for fragmento in self._fragmentos:
+            total += fragmento.get(nombre, 0)
+        return total
 
+    def valor(self, nombre: Hashable) -> int:
+        """
+        Devuelve el valor actual de un contador (0 si nunca se incrementó).
+
+        Args:
+            nombre (Hashable): Nombre del contador.
+
+        Returns:
+            int: Suma de los fragmentos de todos los hilos desde el último reinicio.
+        """
+        return self._total(nombre) - self._bases.get(nombre, 0)
 
-def crear_contador():
+    def snapshot(self) -> Dict[Hashable, int]:
+        """
+        Devuelve una copia con el valor de todos los contadores.
+
+        Returns:
+            Dict[Hashable, int]: Diccionario nombre -> valor.
+        """
+        totales: Dict[Hashable, int] = {}
+        for fragmento in self._fragmentos:
+            for nombre, conteo in fragmento.copy().items():
+                totales[nombre] = totales.get(nombre, 0) + conteo
+        bases = self._bases
+        for nombre in bases:
+            totales.setdefault(nombre, 0)
+        return {nombre: total - bases.get(nombre, 0) for nombre, total in totales.items()}
+
+    def reiniciar(self, nombre: Optional[Hashable] = None) -> None:
+        """
+        Reinicia a 0 un contador, o todos si no se indica `nombre`.
+
+        Args:
+            nombre (Hashable, optional): Contador a reiniciar.
+        """
+        with self._candado:
+            if nombre is None:
+                bases = {n: 0 for n in self._bases}
+                for fragmento in self._fragmentos:
+                    for n, conteo in fragmento.copy().items():
+                        bases[n] = bases.get(n, 0) + conteo
+                self._bases = bases
+            else:
+                self._bases = {**self._bases, nombre: self._total(nombre)}
+
+
+class RegistroPersistente(RegistroContadores):
+    """
+    Registro de contadores que guarda sus valores en un archivo JSON y los recupera al iniciar.
+
+    Un hilo en segundo plano guarda un punto de control cada `intervalo` segundos y,
+    si se indica `cada_n`, también cada vez que un hilo acumula `cada_n` incrementos de
+    un mismo contador (cada hilo cuenta los suyos, sin compartir estado). Los incrementos nunca escriben
+    en disco: solo despiertan al hilo de guardado. El archivo se reemplaza de forma
+    atómica, así que tras un `kill -9` se pierde como mucho lo contado desde el último
+    punto de control. Si un guardado falla, el error se registra y se reintenta.
+    Los nombres de contador deben ser str.
+
+    Ejemplo:
+        >>> with RegistroPersistente("contadores.json", intervalo=5) as registro:
+        ...     contar = crear_contador("peticiones", registro)
+        ...     contar()
+    """
+
+    def __init__(self, ruta: str, intervalo: Optional[float] = 5.0, cada_n: Optional[int] = None) -> None:
+        """
+        Args:
+            ruta (str): Archivo JSON donde se guardan los contadores.
+            intervalo (float, optional): Segundos entre puntos de control (None para desactivar).
+            cada_n (int, optional): Incrementos que fuerzan un punto de control.
+
+        Raises:
+            ValueError: Si el archivo existe pero no es un JSON de contadores válido,
+                o si no se indica ni `intervalo` ni `cada_n`.
+        """
+        if intervalo is None and cada_n is None:
+            raise ValueError("Debe indicar 'intervalo', 'cada_n' o ambos.")
+        super().__init__()
+        self.ruta = Path(ruta)
+        self.intervalo = intervalo
+        self.cada_n = cada_n
+        # Los valores recuperados se guardan como bases negativas: valor = total - base.
+        self._bases = {nombre: -conteo for nombre, conteo in self._cargar().items()}
+        self._ultimo_guardado = self.snapshot()
+        self._candado_guardado = threading.Lock()
+        # Avisa de cada punto de control terminado (ver esperar_guardado).
+        self._guardado = threading.Condition(self._candado_guardado)
+        self._puntos_de_control = 0
+        self._despertar = threading.Event()
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._bucle_guardado, name="guardado-contadores", daemon=True)
+        self._hilo.start()
+
+    def _cargar(self) -> Dict[str, int]:
+        """Lee los contadores guardados (vacío si el archivo no existe)."""
+        if not self.ruta.exists():
+            return {}
+        try:
+            with self.ruta.open("r", encoding="utf-8") as fh:
+                datos = json.load(fh)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"JSON inválido en {self.ruta}: {exc}") from exc
+        if not isinstance(datos, dict) or not all(isinstance(v, int) for v in datos.values()):
+            raise ValueError("El archivo de contadores debe ser un objeto nombre -> entero.")
+        return datos
+
+    def incrementar(self, nombre: str, cantidad: int = 1) -> None:
+        """
+        Suma `cantidad` al contador `nombre`; cada vez que el conteo de `nombre` en el
+        fragmento del hilo actual cruza un múltiplo de `cada_n`, despierta al hilo de guardado.
+
+        Args:
+            nombre (str): Nombre del contador.
+            cantidad (int, optional): Valor a sumar. Por defecto 1.
+
+        Raises:
+            TypeError: Si `nombre` no es str (no se podría guardar en JSON).
+        """
+        try:
+            fragmento = self._local.fragmento
+        except AttributeError:
+            fragmento = self._fragmento()
+        anterior = fragmento.get(nombre)
+        if anterior is None:
+            # Solo se valida la primera vez que el nombre aparece en el fragmento del hilo.
+            if not isinstance(nombre, str):
+                raise TypeError(f"El nombre del contador debe ser str, no {type(nombre).__name__}.")
+            anterior = 0
+        fragmento[nombre] = valor = anterior + cantidad
+        # El umbral se mira sobre el conteo local del fragmento, sin estado compartido:
+        # avisa cuando ese conteo cruza un múltiplo de cada_n.
+        cada_n = self.cada_n
+        if cada_n and valor % cada_n < cantidad:
+            self._despertar.set()
+
+    def guardar(self) -> None:
+        """Escribe un punto de control si los valores cambiaron desde el último y avisa a esperar_guardado."""
+        with self._candado_guardado:
+            valores = self.snapshot()
+            if valores != self._ultimo_guardado:
+                self._escribir(valores)
+            self._puntos_de_control += 1
+            self._guardado.notify_all()
+
+    def _escribir(self, valores: Dict[str, int]) -> None:
+        """Reemplaza el archivo de forma atómica por `valores` (con _candado_guardado tomado)."""
+        temporal = self.ruta.with_name(self.ruta.name + ".tmp")
+        with temporal.open("w", encoding="utf-8") as fh:
+            json.dump(valores, fh, ensure_ascii=False)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(temporal, self.ruta)
+        self._ultimo_guardado = valores
+
+    def esperar_guardado(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que termine un punto de control posterior a esta llamada, de modo que
+        el archivo incluya todos los incrementos hechos antes de llamarla.
+
+        Args:
+            timeout (float, optional): Segundos máximos de espera (None para esperar siempre).
+
+        Returns:
+            bool: True si se escribió el punto de control, False si venció el tiempo.
+        """
+        with self._guardado:
+            objetivo = self._puntos_de_control + 1
+            self._despertar.set()
+            return self._guardado.wait_for(lambda: self._puntos_de_control >= objetivo, timeout)
+
+    def _bucle_guardado(self) -> None:
+        """
+        Cuerpo del hilo de guardado: espera el intervalo o un aviso y guarda. Un error
+        al guardar se registra y se reintenta tras ESPERA_REINTENTO segundos, sin
+        detener el hilo.
+        """
+        espera = self.intervalo
+        while not self._detener.is_set():
+            self._despertar.wait(espera)
+            self._despertar.clear()
+            try:
+                self.guardar()
+            except Exception:
+                registro_log.exception("No se pudo guardar el punto de control en %s", self.ruta)
+                espera = ESPERA_REINTENTO if self.intervalo is None else min(self.intervalo, ESPERA_REINTENTO)
+            else:
+                espera = self.intervalo
+
+    def cerrar(self) -> None:
+        """Detiene el hilo de guardado y escribe un último punto de control."""
+        self._detener.set()
+        self._despertar.set()
+        self._hilo.join()
+        self.guardar()
+
+    def __enter__(self) -> "RegistroPersistente":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cerrar()
+
+
+# Registro compartido por los contadores con nombre creados con crear_contador.
+CONTADORES = RegistroContadores()
+
+
+def crear_contador(nombre: Optional[Hashable] = None,
+                   registro: Optional[RegistroContadores] = None) -> Callable[[], int]:
     """
     Crea un contador independiente que mantiene su propio estado interno.
 
+    Sin argumentos el contador es privado: cada llamada cuesta O(1) y devuelve un
+    valor distinto aunque se llame desde varios hilos. Con `nombre` se registra en
+    `registro` (por defecto CONTADORES) y todas las funciones creadas con ese nombre
+    comparten el mismo conteo; el incremento nunca se pierde, pero el valor devuelto
+    es solo una lectura del total en ese momento (suma los fragmentos de todos los
+    hilos), así que con varios hilos dos llamadas pueden devolver el mismo número.
+
+    Args:
+        nombre (Hashable, optional): Nombre del contador en el registro.
+        registro (RegistroContadores, optional): Registro donde guardar el conteo.
+
     Returns:
-        function: Una función interna que incrementa y devuelve el valor del conteo.
+        Callable[[], int]: Función que incrementa y devuelve el valor del conteo.
 
     Ejemplo:
         >>> contador1 = crear_contador()
@@ -22,7 +332,11 @@ def crear_contador():
         >>> contador2()
         1
     """
-    conteo = 0
+    if nombre is None:
+        # next() sobre itertools.count es atómico: no hace falta candado ni registro.
+        return itertools.count(1).__next__
+    if registro is None:
+        registro = CONTADORES
 
     def incrementar() -> int:
         """
@@ -31,9 +345,8 @@ def crear_contador():
         Returns:
             int: El valor actual del conteo después de incrementarlo.
         """
-        nonlocal conteo
-        conteo += 1
-        return conteo
+        registro.incrementar(nombre)
+        return registro.valor(nombre)
 
     return incrementar
 
@@ -2,18 +2,88 @@
 # ------------------------------------------------------
 # Conceptos aplicados: Scope Global vs. Local, uso de 'global', y Rich para visualización
 
+import random
+import sys
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import add, index
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se usa el camino con array
+    np = None
 
 console = Console()
 
-# 🌐 Variable global
+# 🌐 Variable global (tasa por defecto cuando no hay un contexto de IVA activo)
 TASA_IVA = 0.19
 
+# Tasas de IVA generales por región (código ISO del país).
+TASAS_POR_REGION: Dict[str, float] = {
+    "CO": 0.19,
+    "CL": 0.19,
+    "MX": 0.16,
+    "AR": 0.21,
+    "ES": 0.21,
+}
+
+# Tasa del contexto actual; cada hilo y cada tarea de asyncio ve su propio valor.
+_tasa_contexto: ContextVar[Optional[float]] = ContextVar("tasa_iva", default=None)
+
+
+def tasa_iva_actual() -> float:
+    """
+    Devuelve la tasa de IVA activa: la del contexto_iva en curso o, si no hay, TASA_IVA.
+
+    Returns:
+        float: Tasa de IVA en formato decimal.
+    """
+    tasa = _tasa_contexto.get()
+    return TASA_IVA if tasa is None else tasa
+
+
+@contextmanager
+def contexto_iva(tasa: Optional[float] = None, region: Optional[str] = None) -> Iterator[float]:
+    """
+    Activa una tasa de IVA solo dentro del bloque `with`, sin tocar la variable global.
+
+    El valor vive en una ContextVar, así que varios hilos o tareas de asyncio pueden
+    calcular con tasas distintas al mismo tiempo sin candados ni interferencias.
+
+    Args:
+        tasa (float, optional): Tasa a usar (por ejemplo, 0.21 para 21%).
+        region (str, optional): Región de TASAS_POR_REGION cuya tasa se usará.
+
+    Yields:
+        float: La tasa activada.
+
+    Raises:
+        ValueError: Si no se indica exactamente uno de `tasa` o `region`, o la región no existe.
+    """
+    if (tasa is None) == (region is None):
+        raise ValueError("Debe indicar 'tasa' o 'region', pero no ambos.")
+    if region is not None:
+        if region not in TASAS_POR_REGION:
+            raise ValueError(f"No hay una tasa de IVA registrada para la región '{region}'.")
+        tasa = TASAS_POR_REGION[region]
+
+    token = _tasa_contexto.set(tasa)
+    try:
+        yield tasa
+    finally:
+        _tasa_contexto.reset(token)
+
 
 def calcular_iva(precio_base: float) -> float:
     """
-    Calcula el valor del IVA para un precio dado usando la tasa global.
+    Calcula el valor del IVA para un precio dado usando la tasa activa (ver tasa_iva_actual).
     
     Args:
         precio_base (float): Precio antes de impuestos.
@@ -21,12 +91,190 @@ def calcular_iva(precio_base: float) -> float:
     Returns:
         float: Valor del IVA calculado.
     """
-    return round(precio_base * TASA_IVA, 2)
+    return round(precio_base * tasa_iva_actual(), 2)
+
+
+# Mayor importe (en centavos) que admite calcular_iva_lote: hasta aquí los centavos
+# se convierten a float sin perder precisión y los resultados caben en int64.
+MAXIMO_CENTAVOS = 2**53
+
+# Con |x * 100| por debajo de este valor, el error de calcularlo en float es menor
+# que el margen usado para detectar las líneas cercanas a medio centavo.
+_LIMITE_RAPIDO = 1e11
+
+
+class ResultadoFacturacion(NamedTuple):
+    """Resultado de calcular_iva_lote; todos los importes están en centavos (enteros).
+
+    Atributos:
+        iva: IVA de cada línea.
+        total: Precio base más IVA de cada línea.
+        suma_base: Suma exacta de los precios base.
+        suma_iva: Suma exacta del IVA de todas las líneas.
+        suma_total: Suma exacta de los totales.
+    """
+    iva: Sequence[int]
+    total: Sequence[int]
+    suma_base: int
+    suma_iva: int
+    suma_total: int
+
+
+def a_centavos(precios: Iterable[float]) -> array:
+    """
+    Convierte precios en pesos a centavos enteros, redondeando al centavo más cercano.
+
+    Args:
+        precios (Iterable[float]): Precios con hasta dos decimales.
+
+    Returns:
+        array: Arreglo `array('q')` con los precios en centavos.
+    """
+    return array("q", [round(precio * 100) for precio in precios])
+
+
+def _comprobar_rango(minimo: int, maximo: int, que: str) -> None:
+    """Lanza ValueError si algún importe supera MAXIMO_CENTAVOS en valor absoluto."""
+    if maximo > MAXIMO_CENTAVOS or minimo < -MAXIMO_CENTAVOS:
+        raise ValueError(f"{que} debe estar entre -2**53 y 2**53 centavos.")
+
+
+def calcular_iva_lote(precios_centavos: Sequence[int], tasa: Optional[float] = None) -> ResultadoFacturacion:
+    """
+    Calcula el IVA y el total de muchas líneas de factura, con el mismo resultado que
+    calcular_iva línea por línea y sumas enteras exactas.
+
+    El IVA de cada línea es round(calcular_iva(centavos / 100) * 100): se calcula el
+    mismo producto en coma flotante y, para no pagar round(x, 2) en cada línea, se
+    redondea x * 100 al entero; solo las líneas que quedan a menos de 0.0001 centavos
+    de un medio centavo se redondean con round(x, 2), igual que calcular_iva. Las
+    sumas se hacen en centavos enteros, sin errores acumulados. Si numpy está
+    instalado el cálculo se vectoriza con él.
+
+    Args:
+        precios_centavos (Sequence[int]): Precios base en centavos (ver a_centavos).
+        tasa (float, optional): Tasa a aplicar. Por defecto, la de tasa_iva_actual().
+
+    Returns:
+        ResultadoFacturacion: IVA y total por línea, y las sumas de la factura.
+
+    Raises:
+        TypeError: Si algún precio no es un entero.
+        ValueError: Si algún precio o IVA supera MAXIMO_CENTAVOS en valor absoluto.
+    """
+    tasa = tasa_iva_actual() if tasa is None else tasa
+
+    if np is not None:
+        return _calcular_iva_lote_numpy(precios_centavos, tasa)
+
+    # operator.index rechaza floats y otros tipos no enteros con TypeError.
+    base = list(map(index, precios_centavos))
+    if base:
+        _comprobar_rango(min(base), max(base), "El precio")
+    # y = x * 100 con x = centavos / 100 * tasa, el mismo float que calcula calcular_iva.
+    iva = [
+        k if abs((y := precio / 100 * tasa * 100) - (k := round(y))) < 0.4999 and -_LIMITE_RAPIDO < y < _LIMITE_RAPIDO
+        else round(round(precio / 100 * tasa, 2) * 100)
+        for precio in base
+    ]
+    if iva:
+        _comprobar_rango(min(iva), max(iva), "El IVA")
+    suma_base, suma_iva = sum(base), sum(iva)
+    iva = array("q", iva)
+    total = array("q", map(add, base, iva))
+    return ResultadoFacturacion(iva, total, suma_base, suma_iva, suma_base + suma_iva)
+
+
+def _calcular_iva_lote_numpy(precios_centavos, tasa: float) -> ResultadoFacturacion:
+    """Implementación vectorizada de calcular_iva_lote con numpy."""
+    base = np.asarray(precios_centavos)
+    if base.dtype.kind == "O":
+        # Enteros que no caben en int64: se validan como enteros de Python.
+        base = np.asarray(list(map(index, base.tolist())), dtype=object)
+    elif base.size and base.dtype.kind not in "iu":
+        raise TypeError("Los precios deben ser centavos enteros (ver a_centavos).")
+    cota_base = cota_iva = 0
+    if base.size:
+        minimo, maximo = int(base.min()), int(base.max())
+        _comprobar_rango(minimo, maximo, "El precio")
+        cota_base = max(-minimo, maximo)
+    base = base.astype(np.int64)
+
+    x = base / 100 * tasa
+    y = x * 100
+    iva = np.rint(y)
+    dudosos = np.flatnonzero((np.abs(y - iva) >= 0.4999) | (np.abs(y) >= _LIMITE_RAPIDO))
+    for i in dudosos.tolist():
+        iva[i] = round(round(float(x[i]), 2) * 100)
+    if iva.size:
+        minimo, maximo = int(iva.min()), int(iva.max())
+        _comprobar_rango(minimo, maximo, "El IVA")
+        cota_iva = max(-minimo, maximo)
+    iva = iva.astype(np.int64)
+    total = base + iva
+    suma_base, suma_iva = _sumar_exacto(base, cota_base), _sumar_exacto(iva, cota_iva)
+    return ResultadoFacturacion(iva, total, suma_base, suma_iva, suma_base + suma_iva)
+
+
+def _sumar_exacto(valores, cota: int) -> int:
+    """
+    Suma un arreglo int64 cuyos valores no superan `cota` en valor absoluto. Si la
+    suma podría desbordar int64 se hace con enteros de Python.
+    """
+    if len(valores) * cota < 2**63:
+        return int(valores.sum())
+    return sum(valores.tolist())
+
+
+def comparar_rendimiento_iva(cantidad: int = 1_000_000, tasa: float = 0.19, repeticiones: int = 3) -> Dict[str, float]:
+    """
+    Compara un bucle que llama a calcular_iva línea por línea (y suma los floats) con
+    calcular_iva_lote sobre `cantidad` precios aleatorios de hasta 100 000 pesos.
+
+    Args:
+        cantidad (int, optional): Líneas de factura.
+        tasa (float, optional): Tasa de IVA aplicada.
+        repeticiones (int, optional): Se toma el mejor tiempo de este número de ejecuciones.
+
+    Returns:
+        Dict[str, float]: Segundos de cada variante; calcular_iva_lote usa numpy si está instalado.
+    """
+    generador = random.Random(0)
+    centavos = array("q", [generador.randrange(0, 10_000_000) for _ in range(cantidad)])
+    precios = [precio / 100 for precio in centavos]
+
+    def bucle() -> float:
+        return sum(calcular_iva(precio) for precio in precios)
+
+    variantes = {
+        "bucle con calcular_iva": bucle,
+        f"calcular_iva_lote ({'numpy' if np is not None else 'array'})": lambda: calcular_iva_lote(centavos),
+    }
+    resultados = {}
+    with contexto_iva(tasa):
+        for nombre, funcion in variantes.items():
+            tiempos = []
+            for _ in range(repeticiones):
+                inicio = perf_counter()
+                funcion()
+                tiempos.append(perf_counter() - inicio)
+            resultados[nombre] = min(tiempos)
+    return resultados
+
+
+def mostrar_rendimiento_iva(cantidad: int = 1_000_000) -> None:
+    """Muestra en una tabla el resultado de comparar_rendimiento_iva."""
+    tabla = Table(title=f"IVA de {cantidad:,} líneas de factura")
+    tabla.add_column("Variante", style="cyan")
+    tabla.add_column("Segundos", justify="right", style="green")
+    for nombre, segundos in comparar_rendimiento_iva(cantidad).items():
+        tabla.add_row(nombre, f"{segundos:.3f}")
+    console.print(tabla)
 
 
 def actualizar_tasa_iva(nueva_tasa: float) -> None:
     """
-    Actualiza la tasa global del IVA.
+    Actualiza la tasa global del IVA (la usada fuera de cualquier contexto_iva).
     
     Args:
         nueva_tasa (float): Nueva tasa de IVA (por ejemplo, 0.21 para 21%).
@@ -44,19 +292,33 @@ def mostrar_resultados(precio: float) -> None:
     total = precio + iva
     texto = f"""
 💰 Precio base: [yellow]{precio:,.2f}[/yellow]
-🧾 Tasa de IVA actual: [cyan]{TASA_IVA * 100:.1f}%[/cyan]
+🧾 Tasa de IVA actual: [cyan]{tasa_iva_actual() * 100:.1f}%[/cyan]
 📊 Valor del IVA: [green]{iva:,.2f}[/green]
 🏷️ Total con IVA: [bold]{total:,.2f}[/bold]
 """
     console.print(Panel(texto, title="CALCULADORA DE IVA", border_style="blue"))
 
 
-if __name__ == "__main__":
+def main(argumentos: Optional[List[str]] = None) -> None:
+    """
+    Muestra el IVA de un precio de ejemplo con la tasa por defecto y con otra tasa.
+
+    Con el argumento `--rendimiento` muestra en su lugar mostrar_rendimiento_iva.
+    """
+    argumentos = sys.argv[1:] if argumentos is None else argumentos
+    if argumentos == ["--rendimiento"]:
+        mostrar_rendimiento_iva()
+        return
+
     console.print(Panel("[bold cyan]💼 Ejercicio 5: Calculadora de Impuestos[/bold cyan]", border_style="cyan"))
-    
+
     precio_base = 100000
     mostrar_resultados(precio_base)
 
     # Cambiamos la tasa y volvemos a calcular
     actualizar_tasa_iva(0.21)
     mostrar_resultados(precio_base)
+
+
+if __name__ == "__main__":
+    main()
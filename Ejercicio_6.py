@@ -1,6 +1,17 @@
-from typing import TypedDict
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from itertools import repeat
+from operator import mul
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Tuple, TypedDict
 from rich.console import Console
-from rich.table import Table
+
+from tabla_paginada import Columna, mostrar_tabla_paginada
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se usa el camino con array
+    np = None
 
 console = Console()
 
@@ -31,42 +42,336 @@ def calcular_precios_con_descuento(
     Raises:
         ValueError: Si el porcentaje de descuento no está entre 0 y 1.
     """
+    _validar_porcentaje(porcentaje_descuento)
+
+    # Uso de map y lambda según lo pedido en el ejercicio
+    return list(map(lambda p: _precio_con_descuento(p, porcentaje_descuento), productos))
+
+
+def _precio_con_descuento(producto: Producto, porcentaje_descuento: float) -> float:
+    """Precio de un producto con el descuento aplicado, redondeado a 2 decimales (sin validar)."""
+    return round(producto["precio"] * (1 - porcentaje_descuento), 2)
+
+
+def _validar_porcentaje(porcentaje_descuento: float) -> None:
+    """Lanza ValueError si el porcentaje de descuento no está entre 0 y 1."""
     if not 0 <= porcentaje_descuento <= 1:
         raise ValueError("El porcentaje de descuento debe estar entre 0 y 1.")
 
-    # Uso de map y lambda según lo pedido en el ejercicio
-    precios_descuento = list(
-        map(
-            lambda p: round(p["precio"] * (1 - porcentaje_descuento), 2),
-            productos,
-        )
-    )
-    return precios_descuento
+
+# Con |x * 100| por debajo de este valor, el error de calcularlo en float es menor
+# que el margen usado para detectar los valores cercanos a medio centavo.
+_LIMITE_RAPIDO = 1e11
+
+
+def _redondear_como_round(valores: "np.ndarray") -> "np.ndarray":
+    """Redondea un arreglo numpy a 2 decimales con el mismo resultado que round(x, 2).
+
+    np.round multiplica por 100 antes de redondear y ese producto inexacto cambia
+    el resultado en algunos valores (np.round(2.675, 2) da 2.68, round da 2.67).
+    Aquí se redondea x * 100 al entero y solo los valores que quedan a menos de
+    0.0001 de un medio centavo (o muy grandes, o no finitos) se redondean con round().
+    """
+    escalados = valores * 100
+    centavos = np.rint(escalados)
+    with np.errstate(invalid="ignore"):  # inf - inf: esos valores ya son dudosos
+        dudosos = np.flatnonzero((np.abs(escalados - centavos) >= 0.4999) | ~(np.abs(escalados) < _LIMITE_RAPIDO))
+    resultado = centavos / 100
+    for i in dudosos.tolist():
+        resultado[i] = round(float(valores[i]), 2)
+    return resultado
+
+
+class CatalogoColumnar:
+    """Catálogo de productos guardado por columnas: nombres en una lista y precios
+    en un arreglo contiguo de float64.
+
+    Evita un diccionario por producto, así que ocupa mucha menos memoria que una
+    lista de `Producto` y permite aplicar descuentos a todo el catálogo de una vez.
+
+    Atributos:
+        nombres: Nombres de los productos.
+        precios: Precios en un `array('d')`.
+    """
+
+    def __init__(self, nombres: Iterable[str] = (), precios: Iterable[float] = ()) -> None:
+        """
+        Args:
+            nombres: Nombres de los productos.
+            precios: Precios en el mismo orden que los nombres.
+
+        Raises:
+            ValueError: Si hay distinta cantidad de nombres y precios.
+        """
+        self.nombres = list(nombres)
+        self.precios = precios if isinstance(precios, array) and precios.typecode == "d" else array("d", precios)
+        if len(self.nombres) != len(self.precios):
+            raise ValueError("Debe haber la misma cantidad de nombres y precios.")
+
+    @classmethod
+    def desde_productos(cls, productos: Iterable[Producto]) -> "CatalogoColumnar":
+        """Construye el catálogo a partir de una lista de `Producto`."""
+        catalogo = cls()
+        for producto in productos:
+            catalogo.agregar(producto["nombre"], producto["precio"])
+        return catalogo
+
+    def a_productos(self) -> list[Producto]:
+        """Exporta el catálogo como lista de `Producto`."""
+        return [{"nombre": nombre, "precio": precio} for nombre, precio in zip(self.nombres, self.precios)]
+
+    def agregar(self, nombre: str, precio: float) -> None:
+        """Agrega un producto al final del catálogo."""
+        self.nombres.append(nombre)
+        self.precios.append(precio)
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def precios_con_descuento(self, porcentaje_descuento: float = 0.10) -> array:
+        """Aplica el descuento a todos los precios en una sola operación.
+
+        Args:
+            porcentaje_descuento: Porcentaje de descuento en formato decimal (ej. 0.10 = 10 %).
+
+        Returns:
+            `array('d')` con los precios con descuento, redondeados a 2 decimales
+            como en calcular_precios_con_descuento.
+
+        Raises:
+            ValueError: Si el porcentaje de descuento no está entre 0 y 1.
+        """
+        _validar_porcentaje(porcentaje_descuento)
+        factor = 1 - porcentaje_descuento
+        if np is not None:
+            # frombuffer no copia: numpy opera directamente sobre la memoria del array.
+            precios = np.frombuffer(self.precios, dtype=np.float64)
+            return array("d", _redondear_como_round(precios * factor).tobytes())
+        return array("d", map(round, map(mul, self.precios, repeat(factor)), repeat(2)))
+
+
+class ReglaDescuento(NamedTuple):
+    """Regla del motor de descuentos.
+
+    Atributos:
+        porcentaje: Descuento en formato decimal (entre 0 y 1).
+        categoria: Categoría a la que aplica (None = todas).
+        cantidad_minima: Cantidad mínima comprada para que aplique.
+        desde: Inicio de vigencia, incluido (None = sin inicio).
+        hasta: Fin de vigencia, excluido (None = sin fin).
+    """
+    porcentaje: float
+    categoria: Optional[str] = None
+    cantidad_minima: int = 1
+    desde: Optional[datetime] = None
+    hasta: Optional[datetime] = None
+
+
+class _TablaEscalones(NamedTuple):
+    """Descuentos de una categoría: porcentajes[i] aplica desde minimos[i] unidades."""
+    minimos: Tuple[int, ...]
+    porcentajes: Tuple[float, ...]
+
+    def porcentaje(self, cantidad: int) -> float:
+        """Descuento para `cantidad` unidades (no negativa; ver _validar_cantidades)."""
+        return self.porcentajes[bisect_right(self.minimos, cantidad) - 1]
+
+
+def _validar_cantidades(minima: int) -> None:
+    """Lanza ValueError si la menor cantidad comprada es negativa."""
+    if minima < 0:
+        raise ValueError("La cantidad comprada no puede ser negativa.")
+
+
+class MotorDescuentos:
+    """Motor de descuentos por categoría, cantidad y ventana de fechas.
+
+    Las reglas vigentes se compilan una vez en tablas de escalones por categoría
+    (búsqueda binaria por cantidad) y se guardan en caché por tramo de fechas; la
+    caché se invalida al cambiar las reglas. Cuando varias reglas aplican a un
+    producto se usa el mayor descuento (no se acumulan).
+
+    Ejemplo:
+        >>> motor = MotorDescuentos([ReglaDescuento(0.10, "ropa"), ReglaDescuento(0.20, cantidad_minima=10)])
+        >>> motor.porcentaje("ropa", 1), motor.porcentaje("hogar", 12)
+        (0.1, 0.2)
+    """
+
+    def __init__(self, reglas: Iterable[ReglaDescuento] = ()) -> None:
+        """
+        Args:
+            reglas: Reglas iniciales.
+
+        Raises:
+            ValueError: Si alguna regla tiene un porcentaje fuera de 0 a 1 o una cantidad mínima menor que 1.
+        """
+        self._reglas: list[ReglaDescuento] = []
+        self._cache: Dict[int, Tuple[Dict[str, _TablaEscalones], _TablaEscalones]] = {}
+        self._cortes: list[datetime] = []
+        for regla in reglas:
+            self.agregar_regla(regla)
+
+    @property
+    def reglas(self) -> Tuple[ReglaDescuento, ...]:
+        """Reglas actuales del motor (solo lectura)."""
+        return tuple(self._reglas)
+
+    def agregar_regla(self, regla: ReglaDescuento) -> None:
+        """Agrega una regla e invalida las tablas compiladas.
+
+        Raises:
+            ValueError: Si el porcentaje no está entre 0 y 1 o la cantidad mínima es menor que 1.
+        """
+        _validar_porcentaje(regla.porcentaje)
+        if regla.cantidad_minima < 1:
+            raise ValueError("La cantidad mínima de una regla debe ser al menos 1.")
+        self._reglas.append(regla)
+        self._invalidar()
+
+    def eliminar_regla(self, regla: ReglaDescuento) -> None:
+        """Elimina una regla e invalida las tablas compiladas.
+
+        Raises:
+            ValueError: Si la regla no está en el motor.
+        """
+        self._reglas.remove(regla)
+        self._invalidar()
+
+    def _invalidar(self) -> None:
+        """Vacía la caché y recalcula los instantes en que cambian las reglas vigentes."""
+        self._cache.clear()
+        self._cortes = sorted({f for r in self._reglas for f in (r.desde, r.hasta) if f is not None})
+
+    def _tablas(self, fecha: datetime) -> Tuple[Dict[str, _TablaEscalones], _TablaEscalones]:
+        """Devuelve (tablas por categoría, tabla general) vigentes en `fecha`, compilándolas si hace falta."""
+        # Entre dos cortes consecutivos las reglas vigentes son siempre las mismas.
+        tramo = bisect_right(self._cortes, fecha)
+        if tramo not in self._cache:
+            vigentes = [
+                r for r in self._reglas
+                if (r.desde is None or r.desde <= fecha) and (r.hasta is None or fecha < r.hasta)
+            ]
+            generales = [r for r in vigentes if r.categoria is None]
+            categorias = {r.categoria for r in vigentes if r.categoria is not None}
+            tablas = {
+                categoria: self._compilar(generales + [r for r in vigentes if r.categoria == categoria])
+                for categoria in categorias
+            }
+            self._cache[tramo] = (tablas, self._compilar(generales))
+        return self._cache[tramo]
+
+    @staticmethod
+    def _compilar(reglas: list[ReglaDescuento]) -> _TablaEscalones:
+        """Convierte reglas en escalones de cantidad con el mejor descuento acumulado."""
+        mejores: Dict[int, float] = {}
+        for regla in reglas:
+            mejores[regla.cantidad_minima] = max(mejores.get(regla.cantidad_minima, 0.0), regla.porcentaje)
+        minimos, porcentajes, actual = [0], [0.0], 0.0
+        for minimo in sorted(mejores):
+            actual = max(actual, mejores[minimo])
+            minimos.append(minimo)
+            porcentajes.append(actual)
+        return _TablaEscalones(tuple(minimos), tuple(porcentajes))
+
+    def porcentaje(self, categoria: str, cantidad: int = 1, fecha: Optional[datetime] = None) -> float:
+        """Devuelve el descuento que aplica a un producto.
+
+        Args:
+            categoria: Categoría del producto.
+            cantidad: Unidades compradas.
+            fecha: Momento de la compra (por defecto, ahora).
+
+        Returns:
+            Porcentaje de descuento en formato decimal.
+
+        Raises:
+            ValueError: Si la cantidad es negativa.
+        """
+        _validar_cantidades(cantidad)
+        tablas, general = self._tablas(fecha or datetime.now())
+        return tablas.get(categoria, general).porcentaje(cantidad)
+
+    def precios(
+        self,
+        catalogo: CatalogoColumnar,
+        categorias: Sequence[str],
+        cantidades: Optional[Sequence[int]] = None,
+        fecha: Optional[datetime] = None,
+    ) -> array:
+        """Calcula en bloque el precio con descuento de todo un catálogo.
+
+        Args:
+            catalogo: Catálogo con los precios originales.
+            categorias: Categoría de cada producto, en el orden del catálogo.
+            cantidades: Unidades de cada producto (por defecto, 1 para todos).
+            fecha: Momento de la compra (por defecto, ahora).
+
+        Returns:
+            `array('d')` con los precios con descuento redondeados a 2 decimales.
+
+        Raises:
+            ValueError: Si las columnas no tienen la longitud del catálogo o alguna cantidad es negativa.
+        """
+        if len(categorias) != len(catalogo) or (cantidades is not None and len(cantidades) != len(catalogo)):
+            raise ValueError("Las columnas deben tener la misma longitud que el catálogo.")
+        # len() y no la verdad de la secuencia: cantidades puede ser un arreglo de numpy.
+        if cantidades is not None and len(cantidades):
+            _validar_cantidades(min(cantidades))
+        tablas, general = self._tablas(fecha or datetime.now())
+
+        if cantidades is None:
+            # Con cantidad 1 el descuento solo depende de la categoría: un dict basta.
+            por_categoria = {categoria: 1 - tabla.porcentaje(1) for categoria, tabla in tablas.items()}
+            factor_general = 1 - general.porcentaje(1)
+            factores = array("d", [por_categoria.get(c, factor_general) for c in categorias])
+        else:
+            factores = array("d", [
+                1 - tablas.get(c, general).porcentaje(n) for c, n in zip(categorias, cantidades)
+            ])
+
+        if np is not None:
+            resultado = _redondear_como_round(np.frombuffer(catalogo.precios, dtype=np.float64) * np.frombuffer(factores))
+            return array("d", resultado.tobytes())
+        return array("d", map(round, map(mul, catalogo.precios, factores), repeat(2)))
+
+
+COLUMNAS_PRECIOS = (
+    Columna("Producto", justify="left", style="bold cyan"),
+    Columna("Precio Original", justify="right", style="yellow"),
+    Columna("Con Descuento", justify="right", style="green"),
+)
+
+
+def _formatear_pesos(valor: float) -> str:
+    """Formatea un precio como '$ 1.234.567'."""
+    return f"$ {format(valor, ',.0f').replace(',', '.')}"
 
 
 def mostrar_tabla_precios(
-    productos: list[Producto], porcentaje_descuento: float = 0.10
+    productos: list[Producto], porcentaje_descuento: float = 0.10, tamano_pagina: int = 50
 ) -> None:
     """Muestra una tabla comparando precios originales y con descuento.
 
+    Las filas se calculan y formatean de forma perezosa, página a página
+    (ver tabla_paginada.mostrar_tabla_paginada).
+
     Args:
         productos: Lista de productos con sus precios originales.
         porcentaje_descuento: Porcentaje de descuento aplicado.
-    """
-    precios_descuento = calcular_precios_con_descuento(productos, porcentaje_descuento)
-
-    tabla = Table(title=f"Listado de precios con {int(porcentaje_descuento * 100)} % de descuento")
-    tabla.add_column("Producto", justify="left", style="bold cyan")
-    tabla.add_column("Precio Original", justify="right", style="yellow")
-    tabla.add_column("Con Descuento", justify="right", style="green")
-
-    for prod, nuevo_precio in zip(productos, precios_descuento):
-        precio_original = f"$ {format(prod['precio'], ',.0f').replace(',', '.')}"
-        precio_descuento = f"$ {format(nuevo_precio, ',.0f').replace(',', '.')}"
-        tabla.add_row(prod["nombre"], precio_original, precio_descuento)
-
+        tamano_pagina: Filas por página.
 
-    console.print(tabla)
+    Raises:
+        ValueError: Si el porcentaje de descuento no está entre 0 y 1.
+    """
+    _validar_porcentaje(porcentaje_descuento)
+    filas = (
+        (prod["nombre"], _formatear_pesos(prod["precio"]), _formatear_pesos(_precio_con_descuento(prod, porcentaje_descuento)))
+        for prod in productos
+    )
+    mostrar_tabla_paginada(
+        f"Listado de precios con {int(porcentaje_descuento * 100)} % de descuento",
+        COLUMNAS_PRECIOS, filas, tamano_pagina, consola=console,
+    )
 
 
 def prueba() -> None:
@@ -1,19 +1,151 @@
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+from math import isnan
+from typing import Iterable, List, Tuple, Union
 from rich.console import Console
 from rich.table import Table
 
+from registros_estudiantes import RegistrosEstudiantes
 
-def filtrar_aprobados(estudiantes: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+NOTA_APROBATORIA = 3.0
+
+
+class IndiceNotas:
+    """
+    Índice de estudiantes ordenado por nota para consultas rápidas.
+
+    Guarda tres listas paralelas ordenadas por nota (y, a igual nota, por orden de
+    llegada): notas, nombres y número de llegada. Las consultas por umbral o rango
+    usan búsqueda binaria y las de los k mejores solo recorren k elementos.
+    Las notas NaN (sin nota, ver RegistrosEstudiantes) no se pueden ordenar y no
+    se agregan.
+
+    Ejemplo:
+        >>> indice = IndiceNotas([("Ana", 4.5), ("Juan", 2.8), ("María", 3.9)])
+        >>> indice.contar_entre(3.0, 5.0)
+        2
+        >>> indice.mejores(1)
+        [('Ana', 4.5)]
+    """
+
+    def __init__(self, estudiantes: Iterable[Tuple[str, float]] = ()) -> None:
+        """
+        Args:
+            estudiantes (Iterable[Tuple[str, float]]): Tuplas (nombre, nota) iniciales.
+        """
+        self._notas: List[float] = []
+        self._nombres: List[str] = []
+        self._llegadas: List[int] = []
+        self.agregar_varios(estudiantes)
+
+    def __len__(self) -> int:
+        return len(self._notas)
+
+    def agregar(self, nombre: str, nota: float) -> None:
+        """
+        Inserta un estudiante manteniendo el orden (búsqueda binaria + inserción).
+
+        Args:
+            nombre (str): Nombre del estudiante.
+            nota (float): Nota del estudiante. Si es NaN no se agrega.
+        """
+        if isnan(nota):
+            return
+        posicion = bisect_right(self._notas, nota)
+        self._notas.insert(posicion, nota)
+        self._nombres.insert(posicion, nombre)
+        self._llegadas.insert(posicion, len(self._llegadas))
+
+    def agregar_varios(self, estudiantes: Iterable[Tuple[str, float]]) -> None:
+        """
+        Inserta muchos estudiantes a la vez, reordenando una sola vez al final.
+
+        Args:
+            estudiantes (Iterable[Tuple[str, float]]): Tuplas (nombre, nota). Las de nota NaN se omiten.
+        """
+        inicio = len(self._notas)
+        for nombre, nota in estudiantes:
+            if isnan(nota):
+                continue
+            self._llegadas.append(len(self._notas))
+            self._notas.append(nota)
+            self._nombres.append(nombre)
+        if len(self._notas) == inicio:
+            return
+        # sorted es estable: a igual nota se conserva el orden de llegada.
+        orden = sorted(range(len(self._notas)), key=self._notas.__getitem__)
+        self._notas = [self._notas[i] for i in orden]
+        self._nombres = [self._nombres[i] for i in orden]
+        self._llegadas = [self._llegadas[i] for i in orden]
+
+    def mayores_o_iguales(self, nota_minima: float, orden_original: bool = True) -> List[Tuple[str, float]]:
+        """
+        Devuelve los estudiantes con nota mayor o igual a `nota_minima`.
+
+        Args:
+            nota_minima (float): Umbral (incluido).
+            orden_original (bool, optional): Si es True, en el orden en que se agregaron;
+                si es False, de menor a mayor nota (sin costo extra de ordenamiento).
+
+        Returns:
+            List[Tuple[str, float]]: Tuplas (nombre, nota).
+        """
+        inicio = bisect_left(self._notas, nota_minima)
+        if not orden_original:
+            return list(zip(self._nombres[inicio:], self._notas[inicio:]))
+        seleccion = sorted(zip(self._llegadas[inicio:], self._nombres[inicio:], self._notas[inicio:]))
+        return [(nombre, nota) for _, nombre, nota in seleccion]
+
+    def contar_entre(self, minimo: float, maximo: float) -> int:
+        """
+        Cuenta los estudiantes con nota entre `minimo` y `maximo` (ambos incluidos).
+
+        Returns:
+            int: Cantidad de estudiantes en el rango.
+        """
+        return max(0, bisect_right(self._notas, maximo) - bisect_left(self._notas, minimo))
+
+    def mejores(self, k: int) -> List[Tuple[str, float]]:
+        """
+        Devuelve los `k` estudiantes con mejor nota, de mayor a menor
+        (a igual nota, primero el que se agregó antes).
+
+        Returns:
+            List[Tuple[str, float]]: Hasta `k` tuplas (nombre, nota).
+        """
+        resultado: List[Tuple[str, float]] = []
+        fin = len(self._notas)
+        # Cada grupo de notas iguales ya está en orden de llegada: se recorren los grupos
+        # de la nota más alta a la más baja y se corta el último sin ordenarlo.
+        while fin and len(resultado) < k:
+            inicio = bisect_left(self._notas, self._notas[fin - 1], 0, fin)
+            corte = min(fin, inicio + k - len(resultado))
+            resultado.extend(zip(self._nombres[inicio:corte], self._notas[inicio:corte]))
+            fin = inicio
+        return resultado
+
+
+def filtrar_aprobados(
+    estudiantes: Union[List[Tuple[str, float]], IndiceNotas, RegistrosEstudiantes],
+    nota_minima: float = NOTA_APROBATORIA,
+) -> List[Tuple[str, float]]:
     """
     Filtra los estudiantes que aprobaron con nota mayor o igual a 3.0.
 
     Args:
-        estudiantes (List[Tuple[str, float]]): Lista de tuplas con nombre y nota del estudiante.
+        estudiantes (List[Tuple[str, float]] | IndiceNotas | RegistrosEstudiantes): Lista de tuplas
+            con nombre y nota del estudiante, un IndiceNotas ya construido (búsqueda binaria en lugar
+            de recorrido) o un almacén compacto RegistrosEstudiantes.
+        nota_minima (float, optional): Nota mínima para aprobar. Por defecto 3.0.
 
     Returns:
-        List[Tuple[str, float]]: Nueva lista con solo los estudiantes que aprobaron.
+        List[Tuple[str, float]]: Nueva lista con solo los estudiantes que aprobaron, en el orden original.
     """
-    return list(filter(lambda est: est[1] >= 3.0, estudiantes))
+    if isinstance(estudiantes, IndiceNotas):
+        return estudiantes.mayores_o_iguales(nota_minima)
+    if isinstance(estudiantes, RegistrosEstudiantes):
+        return [(nombre, nota) for nombre, nota in zip(estudiantes.nombres, estudiantes.notas) if nota >= nota_minima]
+    # Para una consulta única sobre una lista, un recorrido lineal es más barato que indexar.
+    return [estudiante for estudiante in estudiantes if estudiante[1] >= nota_minima]
 
 
 def mostrar_tabla_estudiantes(estudiantes: List[Tuple[str, float]]) -> None:
@@ -1,33 +1,43 @@
+import sys
 from functools import reduce
-from typing import List
+from operator import add
+from time import perf_counter
+from typing import Dict, List, Optional, Union
 from rich.console import Console
 from rich.table import Table
 
+from agregaciones import reducir, sumar_paralelo
 
-def sumar_lista(numeros: List[int]) -> int:
+
+def sumar_lista(numeros: List[int], procesos: Optional[int] = 1, compensada: bool = False) -> Union[int, float]:
     """
-    Calcula la suma total de una lista de números usando reduce.
+    Calcula la suma total de una lista de números usando reducir (sum por debajo).
 
     Args:
         numeros (List[int]): Lista de números enteros a sumar.
+        procesos (int, optional): Con más de 1 (o None, uno por CPU) la lista se reduce
+            por bloques en un pool de procesos. Por defecto 1 (sin pool).
+        compensada (bool, optional): Si es True, usa suma compensada (math.fsum) y devuelve float.
 
     Returns:
-        int: Resultado de la suma total.
+        int | float: Resultado de la suma total (0 si la lista está vacía).
     """
-    return reduce(lambda x, y: x + y, numeros)
+    if procesos == 1 and not compensada:
+        return reducir(add, numeros, 0)
+    return sumar_paralelo(numeros, procesos=procesos, compensada=compensada)
 
 
 def concatenar_textos(textos: List[str]) -> str:
     """
-    Concatena una lista de strings en una sola cadena usando reduce.
+    Concatena una lista de strings en una sola cadena usando reducir (str.join por debajo).
 
     Args:
         textos (List[str]): Lista de cadenas de texto.
 
     Returns:
-        str: Texto concatenado resultante.
+        str: Texto concatenado resultante ("" si la lista está vacía).
     """
-    return reduce(lambda a, b: a + b, textos)
+    return reducir(add, textos, "")
 
 
 def mostrar_resultados(suma_total: int, frase: str) -> None:
@@ -52,10 +62,75 @@ def mostrar_resultados(suma_total: int, frase: str) -> None:
     console.print(tabla)
 
 
-if __name__ == "__main__":
+def comparar_rendimiento_agregaciones(
+    cantidad: int = 1_000_000, cantidad_reduce_textos: int = 50_000, repeticiones: int = 3
+) -> Dict[str, float]:
+    """
+    Compara sumar_lista y concatenar_textos con la versión anterior (reduce con lambda).
+
+    La concatenación con reduce es cuadrática y no termina en un tiempo razonable con
+    `cantidad` textos, así que se compara con `cantidad_reduce_textos`.
+
+    Args:
+        cantidad (int, optional): Elementos de cada lista.
+        cantidad_reduce_textos (int, optional): Textos concatenados al comparar con reduce.
+        repeticiones (int, optional): Se toma el mejor tiempo de este número de ejecuciones.
+
+    Returns:
+        Dict[str, float]: Segundos de cada variante.
+    """
+    enteros = list(range(cantidad))
+    flotantes = [i / 3 for i in range(cantidad)]
+    textos = [f"t{i % 100}" for i in range(cantidad)]
+    pocos_textos = textos[:cantidad_reduce_textos]
+    variantes = {
+        "enteros: reduce + lambda": lambda: reduce(lambda x, y: x + y, enteros),
+        "enteros: sumar_lista": lambda: sumar_lista(enteros),
+        "floats: reduce + lambda": lambda: reduce(lambda x, y: x + y, flotantes),
+        "floats: sumar_lista": lambda: sumar_lista(flotantes),
+        f"{len(pocos_textos):,} textos: reduce + lambda": lambda: reduce(lambda a, b: a + b, pocos_textos),
+        f"{len(pocos_textos):,} textos: concatenar_textos": lambda: concatenar_textos(pocos_textos),
+        f"{cantidad:,} textos: concatenar_textos": lambda: concatenar_textos(textos),
+    }
+    resultados = {}
+    for nombre, funcion in variantes.items():
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = perf_counter()
+            funcion()
+            tiempos.append(perf_counter() - inicio)
+        resultados[nombre] = min(tiempos)
+    return resultados
+
+
+def mostrar_rendimiento_agregaciones(cantidad: int = 1_000_000) -> None:
+    """Muestra en una tabla el resultado de comparar_rendimiento_agregaciones."""
+    tabla = Table(title=f"Agregaciones de {cantidad:,} elementos")
+    tabla.add_column("Variante", style="cyan")
+    tabla.add_column("Segundos", justify="right", style="green")
+    for nombre, segundos in comparar_rendimiento_agregaciones(cantidad).items():
+        tabla.add_row(nombre, f"{segundos:.3f}")
+    Console().print(tabla)
+
+
+def main(argumentos: Optional[List[str]] = None) -> None:
+    """
+    Muestra la suma y la concatenación de unas listas de ejemplo.
+
+    Con el argumento `--rendimiento` muestra en su lugar mostrar_rendimiento_agregaciones.
+    """
+    argumentos = sys.argv[1:] if argumentos is None else argumentos
+    if argumentos == ["--rendimiento"]:
+        mostrar_rendimiento_agregaciones()
+        return
+
     lista_numeros = [1, 2, 3, 4, 5]
     lista_textos = ["Hola", " ", "SENA", "!"]
 
     total = sumar_lista(lista_numeros)
     frase_final = concatenar_textos(lista_textos)
     mostrar_resultados(total, frase_final)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+Reducciones con núcleos especializados por operación.
+
+`reducir` tiene la misma firma que functools.reduce, pero cuando reconoce la
+operación y el tipo de los datos usa una función nativa equivalente: sum para
+números, str.join para textos, bytes.join para bytes, chain para listas y
+tuplas, math.prod para productos y min/max. Así concatenar textos es lineal en
+lugar de cuadrático. Para cualquier otro operador asociativo se usa reduce.
+
+Con floats, sum (desde Python 3.12) compensa el error de redondeo, así que el
+resultado puede diferir de reduce en el último dígito, siendo más exacto.
+
+`reducir_paralelo` reparte entradas grandes en bloques entre procesos, reduce
+cada bloque por separado y combina los parciales en árbol; `sumar_paralelo`
+añade la suma compensada (math.fsum) para floats.
+
+"""
+
+import math
+import operator
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from itertools import chain
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Núcleos por (operador, tipo del primer valor): reciben el primer valor y un
+# iterador con el resto, y devuelven lo mismo que reduce(operador, ...).
+_NUCLEOS: Dict[Tuple[Callable, type], Callable[[Any, Iterator], Any]] = {}
+
+_SIN_INICIAL = object()
+
+TAMANO_BLOQUE = 100_000
+
+
+def registrar_nucleo(operador: Callable, *tipos: type) -> Callable:
+    """
+    Decorador que registra un núcleo especializado para un operador y uno o más tipos.
+
+    Args:
+        operador (Callable): Operador binario al que reemplaza (ej. operator.add).
+        *tipos (type): Tipos del primer valor para los que aplica (también a sus subclases).
+
+    Returns:
+        Callable: Decorador que devuelve el mismo núcleo.
+    """
+    def decorador(nucleo: Callable[[Any, Iterator], Any]) -> Callable[[Any, Iterator], Any]:
+        for tipo in tipos:
+            _NUCLEOS[operador, tipo] = nucleo
+        return nucleo
+    return decorador
+
+
+def _buscar_nucleo(operador: Callable, valor: Any) -> Callable[[Any, Iterator], Any]:
+    """Núcleo registrado para el operador y el tipo de `valor` (recorriendo su MRO), o reduce."""
+    for tipo in type(valor).__mro__:
+        nucleo = _NUCLEOS.get((operador, tipo))
+        if nucleo is not None:
+            return nucleo
+    return lambda primero, resto: reduce(operador, resto, primero)
+
+
+def reducir(operador: Callable, valores: Iterable, inicial: Any = _SIN_INICIAL) -> Any:
+    """
+    Reduce `valores` con `operador`, igual que functools.reduce, usando un núcleo
+    nativo si existe uno para esa operación y el tipo del primer valor.
+
+    El operador debe ser asociativo; solo se reconocen funciones como operator.add,
+    no lambdas equivalentes.
+
+    Args:
+        operador (Callable): Función de dos argumentos (ej. operator.add, max).
+        valores (Iterable): Valores a reducir.
+        inicial (Any, optional): Valor inicial; es el resultado si `valores` está vacío.
+
+    Returns:
+        Any: Resultado de la reducción.
+
+    Raises:
+        TypeError: Si `valores` está vacío y no se da `inicial`.
+
+    Ejemplo:
+        >>> reducir(operator.add, ["Hola", " ", "SENA"])
+        'Hola SENA'
+    """
+    resto = iter(valores)
+    primero = next(resto, _SIN_INICIAL) if inicial is _SIN_INICIAL else inicial
+    if primero is _SIN_INICIAL:
+        raise TypeError("reducir() de una secuencia vacía sin valor inicial")
+    return _buscar_nucleo(operador, primero)(primero, resto)
+
+
+# ----------------------- REDUCCIÓN PARALELA -----------------------
+
+def _reducir_compartido(nombre: str, tipo: str, inicio: int, fin: int, nucleo: Callable[[Sequence], Any]) -> Any:
+    """Aplica `nucleo` a un tramo de un array en memoria compartida (en un proceso trabajador)."""
+    memoria = SharedMemory(name=nombre, track=False)
+    try:
+        vista = memoria.buf.cast(tipo)
+        try:
+            return nucleo(vista[inicio:fin])
+        finally:
+            vista.release()
+    finally:
+        memoria.close()
+
+
+def _reducir_bloques(valores: Union[Sequence, array], nucleo: Callable[[Sequence], Any],
+                     procesos: int, tamano_bloque: int) -> List[Any]:
+    """
+    Reduce cada bloque de `tamano_bloque` elementos con `nucleo` y devuelve los parciales en orden.
+
+    Los arrays numéricos se copian una sola vez a memoria compartida y cada proceso
+    lee su tramo sin serializarlo; las demás secuencias se envían por bloques.
+    """
+    tramos = [(inicio, min(inicio + tamano_bloque, len(valores))) for inicio in range(0, len(valores), tamano_bloque)]
+    if procesos == 1 or len(tramos) <= 1:
+        return [nucleo(valores[inicio:fin]) for inicio, fin in tramos]
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        if not isinstance(valores, array) or valores.typecode == "u":
+            futuros = [ejecutor.submit(nucleo, valores[inicio:fin]) for inicio, fin in tramos]
+            return [futuro.result() for futuro in futuros]
+
+        memoria = SharedMemory(create=True, size=max(1, len(valores) * valores.itemsize))
+        try:
+            memoria.buf[:len(valores) * valores.itemsize] = memoryview(valores).cast("B")
+            futuros = [ejecutor.submit(_reducir_compartido, memoria.name, valores.typecode, inicio, fin, nucleo)
+                       for inicio, fin in tramos]
+            return [futuro.result() for futuro in futuros]
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+
+def _combinar_en_arbol(operador: Callable, parciales: List[Any]) -> Any:
+    """Combina los parciales por pares, nivel a nivel, conservando su orden."""
+    while len(parciales) > 1:
+        parciales = [
+            reducir(operador, parciales[i:i + 2]) for i in range(0, len(parciales), 2)
+        ]
+    return parciales[0]
+
+
+def reducir_paralelo(
+    operador: Callable,
+    valores: Union[Sequence, array],
+    inicial: Any = _SIN_INICIAL,
+    procesos: Optional[int] = None,
+    tamano_bloque: int = TAMANO_BLOQUE,
+) -> Any:
+    """
+    Reduce una secuencia grande en un pool de procesos: cada bloque se reduce por
+    separado (con `reducir`) y los parciales se combinan en árbol.
+
+    Los bloques dependen solo de `tamano_bloque`, no del número de procesos, así que
+    el resultado es el mismo con 1 o con N procesos. El operador debe ser asociativo
+    y poder enviarse a otro proceso (operator.add, max o una función de módulo; no
+    una lambda).
+
+    Args:
+        operador (Callable): Función asociativa de dos argumentos.
+        valores (Sequence | array): Secuencia indexable (lista, tupla, array.array...).
+        inicial (Any, optional): Valor inicial; es el resultado si `valores` está vacío.
+        procesos (int, optional): Número de procesos. Por defecto, uno por CPU; con 1 no se crea pool.
+        tamano_bloque (int, optional): Elementos por bloque.
+
+    Returns:
+        Any: Resultado de la reducción.
+
+    Raises:
+        TypeError: Si `valores` está vacío y no se da `inicial`.
+        ValueError: Si `tamano_bloque` o `procesos` no son positivos.
+    """
+    procesos = _validar_parametros(procesos, tamano_bloque)
+    if not len(valores):
+        return reducir(operador, (), inicial)
+    resultado = _combinar_en_arbol(operador, _reducir_bloques(valores, partial(reducir, operador), procesos, tamano_bloque))
+    return resultado if inicial is _SIN_INICIAL else reducir(operador, (resultado,), inicial)
+
+
+def sumar_paralelo(
+    valores: Union[Sequence, array],
+    procesos: Optional[int] = None,
+    tamano_bloque: int = TAMANO_BLOQUE,
+    compensada: bool = False,
+) -> Union[int, float]:
+    """
+    Suma una secuencia grande de números repartiéndola entre procesos.
+
+    Con `compensada=True` cada bloque devuelve floats parciales cuya suma exacta es
+    la del bloque, y un único math.fsum final los combina: el resultado es el mismo
+    que math.fsum(valores) (redondeo correcto, si ningún bloque desborda), sin importar
+    los bloques ni el número de procesos. El resultado es siempre float en ese modo.
+
+    Args:
+        valores (Sequence | array): Números a sumar (lista, tupla o array.array).
+        procesos (int, optional): Número de procesos. Por defecto, uno por CPU; con 1 no se crea pool.
+        tamano_bloque (int, optional): Elementos por bloque.
+        compensada (bool, optional): Si es True, usa suma compensada para floats.
+
+    Returns:
+        int | float: Suma total (0 o 0.0 si `valores` está vacío).
+
+    Raises:
+        ValueError: Si `tamano_bloque` o `procesos` no son positivos.
+    """
+    if not compensada:
+        return reducir_paralelo(operator.add, valores, 0, procesos, tamano_bloque)
+    procesos = _validar_parametros(procesos, tamano_bloque)
+    return math.fsum(chain.from_iterable(_reducir_bloques(valores, _parciales_exactos, procesos, tamano_bloque)))
+
+
+def _parciales_exactos(valores: Sequence) -> List[float]:
+    """
+    Floats cuya suma exacta es la de `valores`: la suma redondeada y, mientras no sea
+    exacta, lo que le falta (cada parcial se obtiene con math.fsum, así que suele
+    bastar con uno o dos).
+    """
+    parciales: List[float] = []
+    while True:
+        parcial = math.fsum(chain(valores, map(operator.neg, parciales)))
+        if parcial or not parciales:
+            parciales.append(parcial)
+        # Un resto no nulo nunca se redondea a 0; inf y nan no tienen resto.
+        if not parcial or not math.isfinite(parcial):
+            return parciales
+
+
+def _validar_parametros(procesos: Optional[int], tamano_bloque: int) -> int:
+    """Valida los parámetros de las reducciones paralelas y devuelve el número de procesos."""
+    if tamano_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser mayor que 0.")
+    if procesos is None:
+        return os.cpu_count() or 1
+    if procesos < 1:
+        raise ValueError("El número de procesos debe ser mayor que 0.")
+    return procesos
+
+
+# ----------------------- NÚCLEOS -----------------------
+
+@registrar_nucleo(operator.add, int, float, complex)
+def _sumar_numeros(primero: Any, resto: Iterator) -> Any:
+    return sum(resto, primero)
+
+
+@registrar_nucleo(operator.mul, int, float, complex)
+def _multiplicar_numeros(primero: Any, resto: Iterator) -> Any:
+    return math.prod(resto, start=primero)
+
+
+@registrar_nucleo(operator.add, str)
+@registrar_nucleo(operator.concat, str)
+def _concatenar_textos(primero: str, resto: Iterator) -> str:
+    return "".join(chain((primero,), resto))
+
+
+@registrar_nucleo(operator.add, bytes)
+@registrar_nucleo(operator.concat, bytes)
+def _concatenar_bytes(primero: bytes, resto: Iterator) -> bytes:
+    return b"".join(chain((primero,), resto))
+
+
+@registrar_nucleo(operator.add, bytearray)
+@registrar_nucleo(operator.concat, bytearray)
+def _concatenar_bytearray(primero: bytearray, resto: Iterator) -> bytearray:
+    return bytearray().join(chain((primero,), resto))
+
+
+def _concatenar_secuencias(tipo: type, primero: Any, resto: Iterator) -> Any:
+    """
+    Concatena con chain si todos los valores son exactamente de `tipo`; si no, usa
+    reduce para conservar sus errores (lista + texto) y los __add__ de las subclases.
+    """
+    valores = [primero, *resto]
+    if set(map(type, valores)) == {tipo}:
+        return tipo(chain.from_iterable(valores))
+    return reduce(operator.add, valores)
+
+
+@registrar_nucleo(operator.add, list)
+@registrar_nucleo(operator.concat, list)
+def _concatenar_listas(primero: list, resto: Iterator) -> list:
+    return _concatenar_secuencias(list, primero, resto)
+
+
+@registrar_nucleo(operator.add, tuple)
+@registrar_nucleo(operator.concat, tuple)
+def _concatenar_tuplas(primero: tuple, resto: Iterator) -> tuple:
+    return _concatenar_secuencias(tuple, primero, resto)
+
+
+@registrar_nucleo(max, object)
+def _maximo(primero: Any, resto: Iterator) -> Any:
+    return max(chain((primero,), resto))
+
+
+@registrar_nucleo(min, object)
+def _minimo(primero: Any, resto: Iterator) -> Any:
+    return min(chain((primero,), resto))
@@ -0,0 +1,216 @@
+"""
+Almacén compacto de estudiantes en columnas (struct-of-arrays).
+
+En lugar de una tupla o un diccionario por estudiante, se guardan tres columnas:
+los ids (en un array('q') mientras todos sean enteros canónicos como "17"; si no,
+en una lista de cadenas), los nombres en una lista de cadenas internadas (los
+nombres repetidos se comparten en memoria) y las notas en un array('d').
+Ejercicio_7.filtrar_aprobados y Ejercicio_14.generar_reporte aceptan esta clase
+directamente.
+
+Ejecutar el módulo mide los bytes por estudiante frente a tuplas y diccionarios.
+
+"""
+
+import csv
+import sys
+import tracemalloc
+from array import array
+from math import isnan, nan
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO, Tuple, Union
+from rich.console import Console
+from rich.table import Table
+
+
+_LIMITE_ID = 2**63
+
+
+def _es_entero_canonico(texto: str) -> bool:
+    """Indica si `texto` es un entero sin signo que se puede reconstruir igual con str(int(texto))."""
+    return (
+        texto.isascii() and texto.isdigit()
+        and (texto == "0" or texto[0] != "0")
+        and int(texto) < _LIMITE_ID
+    )
+
+
+class RegistrosEstudiantes:
+    """
+    Columnas paralelas de id, nombre y nota de cada estudiante.
+
+    Los ids se exponen siempre como texto mediante la propiedad `ids`.
+
+    Ejemplo:
+        >>> registros = RegistrosEstudiantes.desde_tuplas([("Ana", 4.5), ("Juan", 2.8)])
+        >>> list(registros)
+        [('Ana', 4.5), ('Juan', 2.8)]
+    """
+
+    __slots__ = ("_ids", "nombres", "notas")
+
+    def __init__(self) -> None:
+        self._ids: Union[array, List[str]] = array("q")
+        self.nombres: List[str] = []
+        self.notas = array("d")
+
+    @property
+    def ids(self) -> Sequence[str]:
+        """Ids de los estudiantes como texto, en orden."""
+        if isinstance(self._ids, list):
+            return self._ids
+        return list(map(str, self._ids))
+
+    def iterar_ids(self) -> Iterator[str]:
+        """Recorre los ids como texto sin materializar una lista."""
+        return iter(self._ids) if isinstance(self._ids, list) else map(str, self._ids)
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def __iter__(self) -> Iterator[Tuple[str, float]]:
+        """Recorre los estudiantes como tuplas (nombre, nota), igual que en Ejercicio_7."""
+        return zip(self.nombres, self.notas)
+
+    def agregar(self, id_estudiante: str, nombre: str, nota: float = nan) -> None:
+        """
+        Agrega un estudiante. Los textos se internan para compartir los repetidos.
+
+        Args:
+            id_estudiante (str): Identificador del estudiante.
+            nombre (str): Nombre del estudiante.
+            nota (float, optional): Nota; NaN si no se conoce.
+        """
+        if isinstance(self._ids, list):
+            self._ids.append(sys.intern(id_estudiante))
+        elif _es_entero_canonico(id_estudiante):
+            self._ids.append(int(id_estudiante))
+        else:
+            # Primer id no numérico: se pasa la columna a texto de una vez.
+            self._ids = [*map(str, self._ids), sys.intern(id_estudiante)]
+        self.nombres.append(sys.intern(nombre))
+        self.notas.append(nota)
+
+    def tiene_notas(self) -> bool:
+        """Indica si al menos un estudiante tiene nota registrada."""
+        return any(not isnan(nota) for nota in self.notas)
+
+    @classmethod
+    def desde_tuplas(cls, estudiantes: Iterable[Tuple[str, float]]) -> "RegistrosEstudiantes":
+        """
+        Crea el almacén a partir de tuplas (nombre, nota). El id es la posición (desde "1").
+        """
+        registros = cls()
+        for posicion, (nombre, nota) in enumerate(estudiantes, start=1):
+            registros.agregar(str(posicion), nombre, nota)
+        return registros
+
+    @classmethod
+    def desde_diccionarios(cls, estudiantes: Iterable[Mapping[str, str]]) -> "RegistrosEstudiantes":
+        """
+        Crea el almacén a partir de diccionarios con claves "id", "nombre" y opcionalmente "nota".
+        """
+        registros = cls()
+        for estudiante in estudiantes:
+            nota = estudiante.get("nota")
+            registros.agregar(estudiante["id"], estudiante["nombre"], float(nota) if nota else nan)
+        return registros
+
+    @classmethod
+    def desde_csv(cls, archivo: TextIO) -> "RegistrosEstudiantes":
+        """
+        Lee un CSV con encabezado (id, nombre y opcionalmente nota) fila a fila,
+        sin crear un diccionario por estudiante.
+
+        Las filas dañadas no interrumpen la lectura: las que no traen id o nombre se
+        omiten y una nota ausente o que no es un número se guarda como NaN.
+
+        Args:
+            archivo (TextIO): Archivo de texto ya abierto.
+
+        Raises:
+            ValueError: Si faltan las columnas "id" o "nombre".
+        """
+        lector = csv.reader(archivo)
+        encabezado = next(lector, [])
+        try:
+            columna_id, columna_nombre = encabezado.index("id"), encabezado.index("nombre")
+        except ValueError:
+            raise ValueError("El CSV debe tener las columnas 'id' y 'nombre'.") from None
+        columna_nota = encabezado.index("nota") if "nota" in encabezado else None
+
+        registros = cls()
+        for fila in lector:
+            if len(fila) <= max(columna_id, columna_nombre) or not fila[columna_id] or not fila[columna_nombre]:
+                continue
+            nota = fila[columna_nota] if columna_nota is not None and columna_nota < len(fila) else ""
+            registros.agregar(fila[columna_id], fila[columna_nombre], _leer_nota(nota))
+        return registros
+
+
+def _leer_nota(texto: str) -> float:
+    """Convierte una nota del CSV a float; NaN si está vacía o no es un número."""
+    try:
+        return float(texto) if texto else nan
+    except ValueError:
+        return nan
+
+
+def medir_memoria(constructor: Callable[[], object]) -> Tuple[object, int]:
+    """
+    Construye un objeto y mide los bytes reservados durante su construcción.
+
+    Returns:
+        Tuple[object, int]: El objeto construido y los bytes que ocupa.
+    """
+    tracemalloc.start()
+    try:
+        objeto = constructor()
+        actual, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return objeto, actual
+
+
+def comparar_memoria(cantidad: int = 1_000_000, nombres_distintos: int = 5_000) -> Dict[str, float]:
+    """
+    Compara los bytes por estudiante de tuplas, diccionarios de csv.DictReader y RegistrosEstudiantes.
+
+    Args:
+        cantidad (int, optional): Estudiantes simulados.
+        nombres_distintos (int, optional): Nombres distintos (se repiten cíclicamente).
+
+    Returns:
+        Dict[str, float]: Bytes por estudiante de cada representación.
+    """
+    def filas() -> Iterator[Tuple[str, str, str]]:
+        for i in range(cantidad):
+            yield str(i), f"Estudiante {i % nombres_distintos}", f"{(i % 50) / 10:.1f}"
+
+    representaciones: Dict[str, Callable[[], object]] = {
+        "tuplas": lambda: [(nombre, float(nota)) for _, nombre, nota in filas()],
+        "diccionarios": lambda: [{"id": i, "nombre": nombre, "nota": nota} for i, nombre, nota in filas()],
+        "compacto": lambda: RegistrosEstudiantes.desde_diccionarios(
+            {"id": i, "nombre": nombre, "nota": nota} for i, nombre, nota in filas()
+        ),
+    }
+    resultados = {}
+    for nombre, constructor in representaciones.items():
+        objeto, bytes_totales = medir_memoria(constructor)
+        resultados[nombre] = bytes_totales / cantidad
+        del objeto
+    return resultados
+
+
+def main(cantidad: Optional[int] = None) -> None:
+    """Muestra en una tabla la comparación de memoria por estudiante."""
+    cantidad = cantidad or 1_000_000
+    tabla = Table(title=f"Memoria de {cantidad:,} estudiantes")
+    tabla.add_column("Representación", style="cyan")
+    tabla.add_column("Bytes/estudiante", justify="right", style="green")
+    for nombre, bytes_por_estudiante in comparar_memoria(cantidad).items():
+        tabla.add_row(nombre, f"{bytes_por_estudiante:.1f}")
+    Console().print(tabla)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Renderizado paginado de tablas grandes con rich.
+
+Las filas se reciben como un iterable perezoso de tuplas de texto y solo se formatea
+la página visible. En una terminal se muestra una tabla rich por página y, entre
+una página y la siguiente, se lee una línea con Console.input; si la salida no es
+una terminal, las filas se escriben como texto plano separado por tabuladores, que
+es mucho más rápido.
+
+"""
+
+from itertools import islice
+from time import perf_counter
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence
+
+from rich.console import Console
+from rich.table import Table
+
+
+class Columna(NamedTuple):
+    """Definición de una columna de la tabla.
+
+    Atributos:
+        encabezado: Texto del encabezado.
+        justify: Alineación ("left", "center" o "right").
+        style: Estilo rich de la columna (opcional).
+    """
+    encabezado: str
+    justify: str = "left"
+    style: Optional[str] = None
+
+
+def crear_tabla(titulo: str, columnas: Sequence[Columna], filas: Iterable[Sequence[str]], **opciones) -> Table:
+    """
+    Crea una tabla rich con las columnas y filas dadas (no imprime).
+
+    Args:
+        titulo: Título de la tabla.
+        columnas: Definición de las columnas.
+        filas: Filas ya formateadas como texto.
+        **opciones: Opciones extra para rich.table.Table (ej. show_lines=True).
+
+    Returns:
+        rich.table.Table con las filas.
+    """
+    tabla = Table(title=titulo, **opciones)
+    for columna in columnas:
+        tabla.add_column(columna.encabezado, justify=columna.justify, style=columna.style)
+    for fila in filas:
+        tabla.add_row(*fila)
+    return tabla
+
+
+def escribir_texto_plano(columnas: Sequence[Columna], filas: Iterable[Sequence[str]], consola: Console,
+                         tamano_bloque: int = 10_000, titulo: Optional[str] = None) -> int:
+    """
+    Escribe encabezados y filas separados por tabuladores directamente en el archivo de la consola.
+
+    Args:
+        columnas: Definición de las columnas.
+        filas: Filas ya formateadas como texto.
+        consola: Consola cuyo archivo de salida se usa.
+        tamano_bloque: Filas acumuladas por cada escritura.
+        titulo: Línea escrita antes de los encabezados (opcional).
+
+    Returns:
+        Cantidad de filas escritas.
+    """
+    escribir = consola.file.write
+    if titulo:
+        escribir(titulo + "\n")
+    escribir("\t".join(columna.encabezado for columna in columnas) + "\n")
+    iterador = iter(filas)
+    total = 0
+    while bloque := list(islice(iterador, tamano_bloque)):
+        escribir("".join(["\t".join(fila) + "\n" for fila in bloque]))
+        total += len(bloque)
+    return total
+
+
+def mostrar_tabla_paginada(
+    titulo: str,
+    columnas: Sequence[Columna],
+    filas: Iterable[Sequence[str]],
+    tamano_pagina: int = 50,
+    consola: Optional[Console] = None,
+    interactivo: Optional[bool] = None,
+    **opciones,
+) -> int:
+    """
+    Muestra una tabla página a página, formateando solo las filas de la página actual.
+
+    Si todas las filas caben en una página se imprime una única tabla con el título
+    original. Si la consola no es una terminal se usa escribir_texto_plano.
+
+    Args:
+        titulo: Título de la tabla.
+        columnas: Definición de las columnas.
+        filas: Iterable (idealmente un generador) de filas ya formateadas como texto.
+        tamano_pagina: Filas por página.
+        consola: Consola de salida. Por defecto, una nueva rich.console.Console.
+        interactivo: Si es True, después de cada página (salvo la última) lee una línea
+            con consola.input: una línea "q" (sin distinguir mayúsculas ni espacios)
+            termina y cualquier otra, incluida una vacía (Enter), muestra la siguiente.
+            No lee teclas sueltas: hay que confirmar con Enter. Si es False, muestra
+            todas las páginas seguidas. Por defecto es True; sin terminal no aplica,
+            porque se escribe texto plano.
+        **opciones: Opciones extra para rich.table.Table.
+
+    Returns:
+        Cantidad de filas mostradas.
+
+    Raises:
+        ValueError: Si el tamaño de página no es positivo.
+    """
+    if tamano_pagina <= 0:
+        raise ValueError("El tamaño de página debe ser mayor que 0.")
+    consola = consola or Console()
+    if not consola.is_terminal:
+        return escribir_texto_plano(columnas, filas, consola, titulo=titulo)
+    if interactivo is None:
+        interactivo = True
+
+    iterador = iter(filas)
+    # Se lee una fila de más para saber si hay otra página sin formatearla entera.
+    pendientes = list(islice(iterador, tamano_pagina + 1))
+    numero, total = 1, 0
+    while pendientes:
+        pagina, siguientes = pendientes[:tamano_pagina], pendientes[tamano_pagina:]
+        titulo_pagina = titulo if numero == 1 and not siguientes else f"{titulo} (página {numero})"
+        consola.print(crear_tabla(titulo_pagina, columnas, pagina, **opciones))
+        total += len(pagina)
+        if not siguientes:
+            break
+        if interactivo and consola.input("[dim]Enter para ver más, 'q' para salir: [/dim]").strip().lower() == "q":
+            break
+        pendientes = siguientes + list(islice(iterador, tamano_pagina))
+        numero += 1
+    return total
+
+
+# ----------------------- RENDIMIENTO -----------------------
+
+class _SalidaCronometrada:
+    """Archivo de salida que descarta el texto y recuerda cuándo apareció `marca` por primera vez."""
+
+    def __init__(self, marca: str) -> None:
+        self.marca = marca
+        self.primera_escritura: Optional[float] = None
+
+    def write(self, texto: str) -> int:
+        if self.primera_escritura is None and self.marca in texto:
+            self.primera_escritura = perf_counter()
+        return len(texto)
+
+    def flush(self) -> None:
+        pass
+
+
+def medir_primera_fila(cantidad: int = 1_000_000, tamano_pagina: int = 50,
+                       cantidad_tabla_completa: int = 20_000) -> Dict[str, float]:
+    """
+    Mide los segundos hasta que se escribe la primera fila de datos de un listado grande.
+
+    Se comparan la tabla paginada en una terminal (se sale tras la primera página),
+    el texto plano que se usa fuera de una terminal y una única rich.Table con todas
+    las filas. Esta última no escribe nada hasta haber renderizado la tabla entera,
+    por lo que se mide sobre `cantidad_tabla_completa` filas: con `cantidad` tardaría minutos.
+
+    Args:
+        cantidad: Filas del listado paginado y del texto plano.
+        tamano_pagina: Filas por página de la tabla paginada.
+        cantidad_tabla_completa: Filas de la rich.Table completa.
+
+    Returns:
+        Segundos hasta la primera escritura de cada variante.
+    """
+    columnas = (Columna("N°", justify="right"), Columna("Valor"))
+
+    def filas(total: int) -> Iterable[Sequence[str]]:
+        return ((str(i), f"valor {i}") for i in range(total))
+
+    def nueva_consola(terminal: bool) -> Console:
+        return Console(file=_SalidaCronometrada("valor 0"), force_terminal=terminal, width=80, color_system=None)
+
+    def tiempo(consola: Console, inicio: float) -> float:
+        return consola.file.primera_escritura - inicio
+
+    resultados = {}
+    consola = nueva_consola(terminal=True)
+    consola.input = lambda *args, **kwargs: "q"
+    inicio = perf_counter()
+    mostrar_tabla_paginada("Prueba", columnas, filas(cantidad), tamano_pagina, consola=consola)
+    resultados[f"paginada ({cantidad:,} filas)"] = tiempo(consola, inicio)
+
+    consola = nueva_consola(terminal=False)
+    inicio = perf_counter()
+    mostrar_tabla_paginada("Prueba", columnas, filas(cantidad), tamano_pagina, consola=consola)
+    resultados[f"texto plano ({cantidad:,} filas)"] = tiempo(consola, inicio)
+
+    consola = nueva_consola(terminal=True)
+    inicio = perf_counter()
+    consola.print(crear_tabla("Prueba", columnas, filas(cantidad_tabla_completa)))
+    resultados[f"rich.Table completa ({cantidad_tabla_completa:,} filas)"] = tiempo(consola, inicio)
+    return resultados
+
+
+def mostrar_rendimiento(cantidad: int = 1_000_000) -> None:
+    """Muestra en una tabla el resultado de medir_primera_fila."""
+    tabla = crear_tabla(
+        "Tiempo hasta la primera fila", (Columna("Variante", style="cyan"), Columna("Segundos", justify="right", style="green")),
+        ((nombre, f"{segundos:.4f}") for nombre, segundos in medir_primera_fila(cantidad).items()),
+    )
+    Console().print(tabla)
+
+
+if __name__ == "__main__":
+    mostrar_rendimiento()
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture
+def modulo_numpy():
+    """Módulo cuyo `np` alterna el fixture motor; cada archivo de pruebas lo redefine."""
+    raise pytest.UsageError("Defina el fixture modulo_numpy con el módulo bajo prueba.")
+
+
+@pytest.fixture(params=["numpy", "array"])
+def motor(request, monkeypatch, modulo_numpy):
+    """Ejecuta cada prueba con numpy (si está instalado) y con el camino de array."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(modulo_numpy, "np", None)
+    return request.param
@@ -1,5 +1,23 @@
+import csv
+import json
+import math
+from array import array
+
 import pytest
-from Ejercicio_1 import calcular_imc, interpretar_imc
+import Ejercicio_1
+from Ejercicio_1 import (
+    CATEGORIA_INVALIDA,
+    CATEGORIAS_IMC,
+    CODIGO_INVALIDO,
+    TABLA_ASIATICA,
+    TablaBandas,
+    calcular_imc,
+    calcular_imc_lote,
+    codigo_imc,
+    comparar_rendimiento_interpretar,
+    interpretar_imc,
+    procesar_archivo,
+)
 
 
 # ------------------ TESTS CALCULAR_IMC ------------------
@@ -15,6 +33,8 @@ def test_calcular_imc_peso_invalido():
         calcular_imc(0, 1.75)
     with pytest.raises(ValueError, match="peso debe ser mayor que 0"):
         calcular_imc(-5, 1.75)
+    with pytest.raises(ValueError, match="peso debe ser mayor que 0"):
+        calcular_imc(math.nan, 1.75)
 
 def test_calcular_imc_altura_invalida():
     """Debe lanzar ValueError si la altura es 0 o negativa."""
@@ -35,3 +55,187 @@ def test_calcular_imc_altura_invalida():
 def test_interpretar_imc(imc, resultado):
     """Debe devolver la interpretación correcta según el rango."""
     assert interpretar_imc(imc) == resultado
+
+# ------------------ TESTS CALCULAR_IMC_LOTE ------------------
+
+@pytest.fixture
+def modulo_numpy():
+    return Ejercicio_1
+
+
+def test_calcular_imc_lote_coincide_con_escalar(motor):
+    """Cada fila del lote debe coincidir con calcular_imc e interpretar_imc."""
+    pesos = array("d", [45, 70, 80, 100, 150, 57.8])
+    alturas = array("d", [1.70, 1.75, 1.70, 1.70, 1.60, 1.70])
+    resultado = calcular_imc_lote(pesos, alturas)
+
+    for i, (peso, altura) in enumerate(zip(pesos, alturas)):
+        imc = calcular_imc(peso, altura)
+        assert resultado.imc[i] == pytest.approx(imc)
+        assert CATEGORIAS_IMC[resultado.codigo[i]] == interpretar_imc(imc)
+    assert list(resultado.valido) == [1] * len(pesos)
+
+
+def test_calcular_imc_lote_limite_50_es_obesidad(motor):
+    """Un IMC de exactamente 50 debe seguir clasificándose como obesidad."""
+    resultado = calcular_imc_lote([50.0], [1.0])
+    assert CATEGORIAS_IMC[resultado.codigo[0]] == "Obesidad"
+
+
+def test_calcular_imc_lote_estricto_indica_fila(motor):
+    """En modo estricto debe lanzar el mismo ValueError que calcular_imc, con la fila."""
+    with pytest.raises(ValueError, match="Fila 1: El peso debe ser mayor que 0"):
+        calcular_imc_lote([70, 0, 80], [1.75, 1.75, 1.80])
+    with pytest.raises(ValueError, match="Fila 2: La altura debe ser mayor que 0"):
+        calcular_imc_lote([70, 60, 80], [1.75, 1.75, -1])
+    with pytest.raises(ValueError, match="Fila 2: El peso debe ser mayor que 0"):
+        calcular_imc_lote([70, 60, math.nan], [1.75, 1.75, 1.80])
+    with pytest.raises(ValueError, match="Fila 0: La altura debe ser mayor que 0"):
+        calcular_imc_lote([70, 60], [math.nan, 1.75])
+
+
+def test_calcular_imc_lote_mascara_validez(motor):
+    """Con estricto=False las filas inválidas se marcan en la máscara."""
+    resultado = calcular_imc_lote([70, -5, 80], [1.75, 1.75, 0], estricto=False)
+    assert [bool(v) for v in resultado.valido] == [True, False, False]
+    assert list(resultado.codigo) == [1, CODIGO_INVALIDO, CODIGO_INVALIDO]
+    assert math.isnan(resultado.imc[1])
+    resultado = calcular_imc_lote([70, math.nan, 80, 90], [1.75, 1.75, math.nan, math.inf], estricto=False)
+    assert [bool(v) for v in resultado.valido] == [True, False, False, True]
+    assert list(resultado.codigo) == [1, CODIGO_INVALIDO, CODIGO_INVALIDO, 0]
+
+
+def test_calcular_imc_lote_longitudes_distintas():
+    with pytest.raises(ValueError, match="misma longitud"):
+        calcular_imc_lote([70, 80], [1.75])
+
+# ------------------ TESTS PROCESAR_ARCHIVO ------------------
+
+def test_procesar_archivo_csv(tmp_path):
+    """Debe escribir las filas enriquecidas y contar por categoría, bloque a bloque."""
+    entrada = tmp_path / "medidas.csv"
+    entrada.write_text("id,peso,altura\n1,70,1.75\n2,45,1.70\n3,abc,1.70\n4,100,1.70\n", encoding="utf-8")
+    salida = tmp_path / "salida.csv"
+
+    conteos = procesar_archivo(str(entrada), str(salida), tamano_bloque=2)
+
+    assert conteos == {"Normal": 1, "Bajo peso": 1, CATEGORIA_INVALIDA: 1, "Obesidad": 1}
+    with open(salida, newline="", encoding="utf-8") as fh:
+        filas = list(csv.DictReader(fh))
+    assert [f["id"] for f in filas] == ["1", "2", "3", "4"]
+    assert filas[0]["imc"] == "22.86"
+    assert filas[0]["categoria"] == "Normal"
+    assert filas[2]["imc"] == ""
+    assert filas[2]["categoria"] == CATEGORIA_INVALIDA
+
+
+def test_procesar_archivo_jsonl(tmp_path):
+    entrada = tmp_path / "medidas.jsonl"
+    entrada.write_text('{"peso": 70, "altura": 1.75}\n\n{"peso": 0, "altura": 1.6}\n', encoding="utf-8")
+    salida = tmp_path / "salida.jsonl"
+
+    conteos = procesar_archivo(str(entrada), str(salida))
+
+    assert conteos == {"Normal": 1, CATEGORIA_INVALIDA: 1}
+    filas = [json.loads(linea) for linea in salida.read_text(encoding="utf-8").splitlines()]
+    assert filas[0] == {"peso": 70, "altura": 1.75, "imc": 22.86, "categoria": "Normal"}
+    assert filas[1]["categoria"] == CATEGORIA_INVALIDA
+
+
+def test_procesar_archivo_formato_invalido(tmp_path):
+    with pytest.raises(ValueError, match=".csv o .jsonl"):
+        procesar_archivo(str(tmp_path / "datos.txt"), str(tmp_path / "salida.txt"))
+
+
+def test_procesar_archivo_csv_sin_columnas(tmp_path):
+    entrada = tmp_path / "medidas.csv"
+    entrada.write_text("id,kg\n1,70\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="'peso' y 'altura'"):
+        procesar_archivo(str(entrada), str(tmp_path / "salida.csv"))
+
+def test_procesar_archivo_csv_filas_danadas_no_interrumpen(tmp_path):
+    entrada = tmp_path / "medidas.csv"
+    entrada.write_text("id,peso,altura\n1,70,1.75\n2,80\n3,nan,1.7\n4,70,inf\n5,1e400,1.7\n6,45,1.70\n",
+                       encoding="utf-8")
+    salida = tmp_path / "salida.csv"
+
+    conteos = procesar_archivo(str(entrada), str(salida))
+
+    assert conteos == {"Bajo peso": 1, "Normal": 1, CATEGORIA_INVALIDA: 4}
+    filas = list(csv.reader(salida.open(newline="", encoding="utf-8")))
+    assert filas[2] == ["2", "80", "", CATEGORIA_INVALIDA]
+    assert [fila[-1] for fila in filas[3:6]] == [CATEGORIA_INVALIDA] * 3
+
+
+def test_procesar_archivo_jsonl_lineas_danadas_no_interrumpen(tmp_path):
+    entrada = tmp_path / "medidas.jsonl"
+    entrada.write_text('{"peso": 70, "altura": 1.75}\n{roto\n[70, 1.75]\n{"peso": NaN, "altura": 1.7}\n'
+                       '{"peso": "Infinity", "altura": 1.7}\n', encoding="utf-8")
+    salida = tmp_path / "salida.jsonl"
+
+    conteos = procesar_archivo(str(entrada), str(salida))
+
+    assert conteos == {"Normal": 1, CATEGORIA_INVALIDA: 4}
+    lineas = salida.read_text(encoding="utf-8").splitlines()
+    # La salida es JSON estándar: no contiene NaN ni Infinity como números.
+    filas = [json.loads(linea, parse_constant=pytest.fail) for linea in lineas]
+    assert filas[1] == {"original": "{roto", "imc": "", "categoria": CATEGORIA_INVALIDA}
+    assert filas[2]["original"] == "[70, 1.75]"
+    assert filas[3]["original"] == '{"peso": NaN, "altura": 1.7}'
+
+
+def test_procesar_archivo_no_trunca_salida_si_el_encabezado_es_invalido(tmp_path):
+    entrada = tmp_path / "medidas.csv"
+    entrada.write_text("id,kg\n1,70\n", encoding="utf-8")
+    salida = tmp_path / "salida.csv"
+    salida.write_text("resultado anterior\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        procesar_archivo(str(entrada), str(salida))
+    assert salida.read_text(encoding="utf-8") == "resultado anterior\n"
+
+# ------------------ TESTS TABLABANDAS ------------------
+
+@pytest.mark.parametrize("imc,resultado", [
+    (18.49, "Bajo peso"),
+    (18.5, "Normal"),
+    (25.0, "Sobrepeso"),
+    (30.0, "Obesidad"),
+    (50.0, "Obesidad"),
+    (50.01, "Valor de IMC fuera de rango válido"),
+    (float("nan"), "Valor de IMC fuera de rango válido"),
+])
+def test_tabla_oms_limites(imc, resultado):
+    """Los límites de cada banda deben coincidir con los rangos de la OMS."""
+    assert interpretar_imc(imc) == resultado
+    assert CATEGORIAS_IMC[codigo_imc(imc)] == resultado
+
+
+def test_interpretar_imc_con_tabla_asiatica():
+    assert interpretar_imc(24.0) == "Normal"
+    assert interpretar_imc(24.0, TABLA_ASIATICA) == "Sobrepeso"
+    assert interpretar_imc(28.0, TABLA_ASIATICA) == "Obesidad"
+
+
+def test_tabla_bandas_personalizada(motor):
+    """Una tabla propia debe servir igual para el camino escalar y el de lotes."""
+    tabla = TablaBandas((10, 20), ("bajo", "medio", "alto"), maximo=30, fuera_de_rango="fuera")
+    assert [tabla.etiqueta(v) for v in (5, 10, 25, 30, 31)] == ["bajo", "medio", "alto", "alto", "fuera"]
+
+    resultado = calcular_imc_lote([5, 15, 25, 40], [1, 1, 1, 1], tabla=tabla)
+    assert [tabla.etiquetas[c] for c in resultado.codigo] == ["bajo", "medio", "alto", "fuera"]
+
+
+def test_tabla_bandas_invalida():
+    with pytest.raises(ValueError, match="una etiqueta más"):
+        TablaBandas((10, 20), ("a", "b"))
+    with pytest.raises(ValueError, match="estrictamente crecientes"):
+        TablaBandas((20, 10), ("a", "b", "c"))
+    with pytest.raises(ValueError, match="estrictamente crecientes"):
+        TablaBandas((10, 20), ("a", "b", "c"), maximo=15)
+
+
+def test_comparar_rendimiento_interpretar(motor):
+    resultados = comparar_rendimiento_interpretar(cantidad=1_000, repeticiones=1)
+    variantes = ["cadena de comparaciones", "TablaBandas.etiqueta", "codigos_lote (array)"]
+    assert list(resultados) == variantes + (["codigos_lote (numpy)"] if motor == "numpy" else [])
+    assert all(segundos >= 0 for segundos in resultados.values())
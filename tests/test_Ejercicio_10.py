@@ -1,4 +1,20 @@
-from Ejercicio_10 import explorar_estructura
+import io
+import json
+import math
+import sys
+
+import pytest
+
+from Ejercicio_10 import (
+    ReferenciaCiclica,
+    calcular_estadisticas,
+    comparar_rendimiento_exploracion,
+    explorar_estructura,
+    iterar_estructura,
+    iterar_json,
+    main,
+    mostrar_estadisticas,
+)
 
 
 def test_explorar_lista_simple():
@@ -25,3 +41,200 @@ def test_explorar_valor_unico():
     datos = 10
     resultado = explorar_estructura(datos)
     assert resultado == [(10, 1)]
+
+
+def test_iterar_estructura_mismo_orden_que_recursivo():
+    class Punto:
+        def __repr__(self):
+            return "Punto()"
+
+    datos = [1, [2, [], (3, {"a": None, "b": [True, "x"]})], {}, Punto(), 4.5]
+    assert list(iterar_estructura(datos)) == [
+        (1, 2), (2, 3), (3, 4), (None, 5), (True, 6), ("x", 6), ("Punto()", 2), (4.5, 2)
+    ]
+
+
+def test_iterar_estructura_perezoso_y_sin_limite_de_recursion():
+    cadena = [0]
+    for i in range(1, 20_000):
+        cadena = [i, cadena]
+    generador = iterar_estructura(cadena)
+    assert next(generador) == (19_999, 2)
+    assert explorar_estructura(cadena)[-1] == (0, 20_001)
+
+
+def test_lista_ciclica_se_marca():
+    datos = [1, [2]]
+    datos[1].append(datos)
+    resultado = explorar_estructura(datos)
+    assert resultado[:2] == [(1, 2), (2, 3)]
+    marca, nivel = resultado[2]
+    assert marca == ReferenciaCiclica("list", 1)
+    assert nivel == 3
+    assert str(marca) == "<ciclo: list del nivel 1>"
+
+
+def test_ciclo_se_marca_con_las_opciones_por_defecto():
+    datos = [1]
+    datos.append(datos)
+    esperado = [(1, 2), (ReferenciaCiclica("list", 1), 2)]
+    assert list(iterar_estructura(datos)) == esperado
+    assert explorar_estructura(datos) == esperado
+
+
+def test_sin_detectar_ciclos_igual_en_estructuras_sin_ciclos():
+    compartida = [1, {"a": (2, None)}]
+    datos = {"x": [compartida, compartida], "y": "z"}
+    assert explorar_estructura(datos, detectar_ciclos=False) == explorar_estructura(datos)
+
+
+def test_diccionario_ciclico_se_marca_o_lanza_error():
+    datos = {"a": 1, "hijo": {"b": 2}}
+    datos["hijo"]["padre"] = datos
+    assert explorar_estructura(datos) == [(1, 2), (2, 3), (ReferenciaCiclica("dict", 1), 3)]
+    with pytest.raises(ValueError, match="cíclica"):
+        explorar_estructura(datos, error_en_ciclo=True)
+
+
+def test_subestructura_compartida_no_es_ciclo_y_se_memoriza():
+    compartida = {"x": [1, 2], "y": "z"}
+    datos = [compartida, [compartida, (compartida,)]]
+    esperado = [(1, 4), (2, 4), ("z", 3), (1, 5), (2, 5), ("z", 4), (1, 6), (2, 6), ("z", 5)]
+    assert explorar_estructura(datos) == esperado
+    assert explorar_estructura(datos, memorizar=True) == esperado
+
+
+def test_memorizar_con_ciclos_igual_que_sin_memorizar():
+    nodo = [1]
+    nodo.append(nodo)
+    datos = [nodo, [nodo], {"k": nodo}]
+    assert explorar_estructura(datos, memorizar=True) == explorar_estructura(datos)
+
+
+def test_memorizar_repite_tramos_anidados():
+    hoja = ["a", ("b",)]
+    nivel = [hoja, 1, hoja]
+    for _ in range(10):
+        nivel = [nivel, {"x": nivel}, 2]
+    esperado = explorar_estructura(nivel)
+    assert len(esperado) == 6 * 2**10 - 1
+    assert explorar_estructura(nivel, memorizar=True) == esperado
+    assert explorar_estructura(nivel, memorizar=True, profundidad=4) == explorar_estructura(nivel, profundidad=4)
+
+
+DOCUMENTO_JSON = {
+    "a": {"b": [1, {"c": "comillas \" y \\u00e9"}, [2.5e3, None, -7]], "z": True},
+    "lista": [[], {}, -0.5, "ñ"],
+}
+
+
+@pytest.mark.parametrize("tamano_bloque", [1, 3, 64])
+def test_iterar_json_igual_que_explorar_json_load(tmp_path, tamano_bloque):
+    archivo = tmp_path / "datos.json"
+    archivo.write_text(json.dumps(DOCUMENTO_JSON, ensure_ascii=False, indent=2), encoding="utf-8")
+    esperado = explorar_estructura(json.loads(archivo.read_text(encoding="utf-8")))
+    assert list(iterar_json(archivo, tamano_bloque=tamano_bloque)) == esperado
+
+
+def test_iterar_json_filtros():
+    texto = json.dumps(DOCUMENTO_JSON)
+    assert list(iterar_json(io.StringIO(texto), "a.b[*]", tamano_bloque=4)) == [
+        (1, 4), ('comillas " y \\u00e9', 5), (2500.0, 5), (None, 5), (-7, 5)
+    ]
+    assert list(iterar_json(io.StringIO(texto), "a.b[2][1]")) == [(None, 5)]
+    assert list(iterar_json(io.StringIO(texto), "*.z")) == [(True, 3)]
+    assert list(iterar_json(io.StringIO(texto), "lista.*")) == []
+    with pytest.raises(ValueError, match="Filtro"):
+        list(iterar_json(io.StringIO(texto), "a..b"))
+
+
+@pytest.mark.parametrize("texto", ["", "[1,", '{"a" 1}', "[1 2]", "[1]]", '{"a": tru}', '"abc'])
+def test_iterar_json_invalido(texto):
+    with pytest.raises(ValueError, match="JSON inválido"):
+        list(iterar_json(io.StringIO(texto), tamano_bloque=2))
+
+
+@pytest.mark.parametrize("tamano_bloque", [1, 2, 5, 1 << 16])
+def test_iterar_json_no_depende_del_tamano_de_bloque(tamano_bloque):
+    def leer(texto, filtro=None):
+        return list(iterar_json(io.StringIO(texto), filtro, tamano_bloque=tamano_bloque))
+
+    assert leer('{"a":1,"a":2}') == [(1, 2), (2, 2)]
+    assert leer('[{"a":1,"b":[3],"a":{"c":2}}]', "[0].a") == [(1, 3), (2, 4)]
+    for texto in ("[NaN, 1]", '{"x": -Infinity}', "[1, [Infinity]]"):
+        with pytest.raises(ValueError, match="JSON inválido"):
+            leer(texto)
+    # Los subárboles saltados por el filtro no se validan.
+    assert leer('{"a": [NaN, {"k": 1, "k": 2}], "b": 3}', "b") == [(3, 2)]
+
+
+def test_iterar_json_anidamiento_profundo_y_contenedores_completos():
+    profundo = "[" * 5000 + "1" + "]" * 5000
+    assert list(iterar_json(io.StringIO(profundo))) == [(1, 5001)]
+    texto = json.dumps({"x": [{"id": i, "v": [i, str(i)]} for i in range(50)], "y": 1})
+    assert list(iterar_json(io.StringIO(texto), tamano_bloque=1 << 16)) == explorar_estructura(json.loads(texto))
+    assert list(iterar_json(io.StringIO(texto), "x[3].v[1]", tamano_bloque=40)) == [("3", 5)]
+
+
+def test_calcular_estadisticas_cuenta_igual_que_explorar():
+    datos = [1, [2, "a", (3.5, {"k": None, "v": [True]})], {}, {"x": [1, 2, 3, 4]}]
+    estadisticas = calcular_estadisticas(datos)
+    hojas = explorar_estructura(datos)
+    assert estadisticas["hojas"] == len(hojas)
+    niveles = {}
+    for _, nivel in hojas:
+        niveles[nivel] = niveles.get(nivel, 0) + 1
+    assert estadisticas["hojas_por_profundidad"] == dict(sorted(niveles.items()))
+    assert estadisticas["hojas_por_tipo"] == {"int": 6, "str": 1, "NoneType": 1, "bool": 1, "float": 1}
+    assert estadisticas["contenedores"] == 8
+    assert estadisticas["profundidad_maxima"] == 6
+    assert estadisticas["contenedor_mas_ancho"] == {"tipo": "list", "elementos": 4, "profundidad": 1}
+    assert estadisticas["ciclos"] == 0
+    assert estadisticas["memoria_aproximada"] > 0
+
+
+def test_calcular_estadisticas_memoria_igual_que_getsizeof():
+    class Texto(str):
+        pass
+
+    class Lista(list):
+        pass
+
+    hojas = [Texto("x"), "x", 7, 2.5, True, None]
+    contenedores = [Lista([1]), (2,), {"k": 3}, {4}]
+    datos = [*hojas, *contenedores]
+    esperado = sum(map(sys.getsizeof, [datos, *hojas, *contenedores, 1, 2, 3, 4]))
+    assert calcular_estadisticas(datos)["memoria_aproximada"] == esperado
+
+
+def test_calcular_estadisticas_valor_unico_y_ciclos(capsys):
+    assert calcular_estadisticas(10) == {
+        "hojas": 1, "contenedores": 0, "ciclos": 0, "hojas_por_profundidad": {1: 1},
+        "hojas_por_tipo": {"int": 1}, "profundidad_maxima": 1, "contenedor_mas_ancho": None,
+        "memoria_aproximada": 28,
+    }
+    datos = {"a": 1, "hijo": {"b": 2}}
+    datos["hijo"]["padre"] = datos
+    estadisticas = calcular_estadisticas(datos)
+    assert estadisticas["ciclos"] == 1
+    assert estadisticas["hojas"] == len(explorar_estructura(datos)) == 3
+    assert estadisticas["hojas_por_tipo"] == {"int": 2, "ReferenciaCiclica": 1}
+    mostrar_estadisticas(estadisticas)
+    assert "Profundidad máxima" in capsys.readouterr().out
+
+
+def test_comparar_rendimiento_exploracion():
+    resultados = comparar_rendimiento_exploracion(hojas=1_000, profundidad_cadena=sys.getrecursionlimit() + 10,
+                                                  repeticiones=1)
+    assert list(resultados) == [
+        f"{estructura}: {variante}"
+        for estructura in ("ancha", "cadena")
+        for variante in ("recursiva", "explorar_estructura", "sin detectar ciclos")
+    ]
+    assert math.isnan(resultados["cadena: recursiva"])
+    assert all(segundos >= 0 for nombre, segundos in resultados.items() if nombre != "cadena: recursiva")
+
+
+def test_main_muestra_estructura_de_ejemplo(capsys):
+    main([])
+    assert "Profundidad" in capsys.readouterr().out
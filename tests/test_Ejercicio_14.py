@@ -1,11 +1,16 @@
 import json
 from unittest.mock import mock_open, patch
+
+import pytest
+
 from Ejercicio_14 import (
     leer_csv,
     leer_json,
     generar_reporte,
     guardar_reporte,
+    leer_csv_compacto,
 )
+from registros_estudiantes import RegistrosEstudiantes
 
 
 # ---------- PRUEBAS PARA leer_csv ----------
@@ -86,6 +91,29 @@ def test_generar_reporte_sin_cursos():
     assert "Sin cursos registrados" in reporte
 
 
+def test_generar_reporte_registros_compactos(tmp_path):
+    """Debe producir el mismo reporte desde el almacén compacto que desde diccionarios."""
+    archivo = tmp_path / "estudiantes.csv"
+    archivo.write_text("id,nombre\n1,Ana\n2,Juan\n", encoding="utf-8")
+    cursos = {"1": ["Matemáticas", "Historia"]}
+
+    registros = leer_csv_compacto(str(archivo))
+    assert isinstance(registros, RegistrosEstudiantes)
+    assert generar_reporte(registros, cursos) == generar_reporte(leer_csv(str(archivo)), cursos)
+    assert generar_reporte(RegistrosEstudiantes(), cursos).startswith(" No hay datos")
+
+
+@pytest.mark.parametrize("contenido", ["id,nombre\n1,Ana\n2\n", "id,nombre,nota\n1,Ana,n/a\n"])
+def test_leer_csv_compacto_fila_danada_no_vacia_el_almacen(tmp_path, contenido):
+    archivo = tmp_path / "estudiantes.csv"
+    archivo.write_text(contenido, encoding="utf-8")
+
+    registros = leer_csv_compacto(str(archivo))
+    assert registros.ids == ["1"]
+    assert registros.nombres == ["Ana"]
+    assert not generar_reporte(registros, {}).startswith(" No hay datos")
+
+
 def test_guardar_reporte_exitoso(tmp_path):
     """Debe crear un archivo con el contenido del reporte."""
     contenido = "Ejemplo de reporte"
@@ -142,3 +142,16 @@ def test_crear_tabla_libros_render(tmp_path):
 
     assert "A" in texto
     assert "001" in texto
+
+
+def test_crear_tabla_libros_ventana():
+    libros = [{"libro_id": f"{i:03d}", "titulo": f"T{i}", "autor": None, "prestado_a": None} for i in range(10)]
+    tabla = crear_tabla_libros(libros, inicio=4, limite=3)
+
+    console = Console(record=True)
+    console.print(tabla)
+    texto = console.export_text()
+
+    assert tabla.row_count == 3
+    assert "004" in texto and "006" in texto
+    assert "003" not in texto and "007" not in texto
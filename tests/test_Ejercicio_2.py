@@ -1,5 +1,7 @@
+import io
+
 import pytest
-from Ejercicio_2 import crear_perfil
+from Ejercicio_2 import crear_perfil, exportar_perfiles
 
 
 def test_crear_perfil_basico():
@@ -26,3 +28,36 @@ def test_crear_perfil_nombre_invalido():
 def test_crear_perfil_edad_invalida():
     with pytest.raises(ValueError, match="edad debe ser mayor que 0"):
         crear_perfil("Juan", 0)
+
+
+def test_exportar_perfiles_escribe_en_destino():
+    registros = [
+        {"nombre": "Ana", "edad": 30},
+        {"nombre": "Luis", "edad": 22, "hobbies": ["correr", "leer"], "redes_sociales": {"twitter": "@luisito"}},
+    ]
+    destino = io.StringIO()
+    errores = exportar_perfiles(registros, destino)
+
+    assert errores == []
+    esperado = crear_perfil("Ana", 30) + "\n\n" + crear_perfil("Luis", 22, "correr", "leer", twitter="@luisito") + "\n\n"
+    assert destino.getvalue() == esperado
+
+
+def test_exportar_perfiles_acumula_errores_sin_detenerse():
+    registros = iter([
+        {"nombre": "", "edad": 25},
+        {"nombre": "Ana", "edad": 30},
+        {"nombre": "Juan", "edad": 0},
+        {"edad": 40},
+        {"nombre": "María", "edad": 19},
+    ])
+    destino = io.StringIO()
+    errores = exportar_perfiles(registros, destino, separador="\n---\n")
+
+    assert [indice for indice, _ in errores] == [0, 2, 3]
+    assert "nombre no puede estar vacío" in errores[0][1]
+    assert "edad debe ser mayor que 0" in errores[1][1]
+    assert "'nombre'" in errores[2][1]
+    assert destino.getvalue().count("\n---\n") == 2
+    assert "Ana" in destino.getvalue()
+    assert "María" in destino.getvalue()
@@ -1,4 +1,11 @@
-from Ejercicio_3 import crear_contador
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from Ejercicio_3 import RegistroContadores, RegistroPersistente, crear_contador
 
 
 def test_contador_incrementa_correctamente():
@@ -24,3 +31,165 @@ def test_contador_no_resetea():
     for _ in range(5):
         contador()
     assert contador() == 6
+
+
+def test_contador_desde_varios_hilos_no_pierde_incrementos():
+    contador = crear_contador()
+    hilos = [threading.Thread(target=lambda: [contador() for _ in range(5000)]) for _ in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert contador() == 8 * 5000 + 1
+
+
+def test_registro_contadores_con_nombre_y_snapshot():
+    registro = RegistroContadores()
+
+    def trabajar():
+        for _ in range(1000):
+            registro.incrementar("peticiones")
+        registro.incrementar("errores", 2)
+
+    hilos = [threading.Thread(target=trabajar) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert registro.valor("peticiones") == 4000
+    assert registro.snapshot() == {"peticiones": 4000, "errores": 8}
+    assert registro.valor("inexistente") == 0
+
+
+def test_registro_contadores_reiniciar():
+    registro = RegistroContadores()
+    registro.incrementar("a", 5)
+    registro.incrementar("b", 3)
+
+    registro.reiniciar("a")
+    assert registro.snapshot() == {"a": 0, "b": 3}
+    registro.incrementar("a")
+    assert registro.valor("a") == 1
+
+    registro.reiniciar()
+    assert registro.snapshot() == {"a": 0, "b": 0}
+
+
+def test_contadores_con_nombre_comparten_registro():
+    registro = RegistroContadores()
+    contador1 = crear_contador("visitas", registro)
+    contador2 = crear_contador("visitas", registro)
+    assert contador1() == 1
+    assert contador2() == 2
+    assert registro.valor("visitas") == 2
+
+
+def test_registro_persistente_recupera_valores(tmp_path):
+    ruta = tmp_path / "contadores.json"
+    with RegistroPersistente(str(ruta), intervalo=60) as registro:
+        contar = crear_contador("peticiones", registro)
+        for _ in range(10):
+            contar()
+
+    with RegistroPersistente(str(ruta), intervalo=60) as registro:
+        assert registro.valor("peticiones") == 10
+        registro.incrementar("peticiones", 5)
+        assert registro.snapshot() == {"peticiones": 15}
+
+    assert json.loads(ruta.read_text(encoding="utf-8")) == {"peticiones": 15}
+
+
+def test_registro_persistente_guarda_cada_n(tmp_path):
+    ruta = tmp_path / "contadores.json"
+    registro = RegistroPersistente(str(ruta), intervalo=None, cada_n=100)
+    try:
+        for _ in range(100):
+            registro.incrementar("eventos")
+        # Sin intervalo, solo el aviso de cada_n puede escribir el punto de control.
+        with registro._guardado:
+            assert registro._guardado.wait_for(lambda: registro._puntos_de_control >= 1, timeout=10)
+        assert json.loads(ruta.read_text(encoding="utf-8")) == {"eventos": 100}
+    finally:
+        registro.cerrar()
+
+
+def test_registro_persistente_sobrevive_kill_9(tmp_path):
+    """Tras matar el proceso con SIGKILL se recupera el último punto de control."""
+    ruta = tmp_path / "contadores.json"
+    codigo = (
+        "import sys, time\n"
+        "from Ejercicio_3 import RegistroPersistente\n"
+        f"registro = RegistroPersistente({str(ruta)!r}, intervalo=0.05)\n"
+        "for _ in range(1000):\n"
+        "    registro.incrementar('peticiones')\n"
+        "assert registro.esperar_guardado(timeout=10)\n"
+        "print('listo', flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    raiz = Path(__file__).resolve().parent.parent
+    proceso = subprocess.Popen([sys.executable, "-c", codigo], cwd=raiz, stdout=subprocess.PIPE, text=True)
+    try:
+        # El hijo imprime "listo" solo cuando el hilo de guardado ya escribió sus incrementos.
+        assert proceso.stdout.readline().strip() == "listo"
+    finally:
+        proceso.kill()
+        proceso.wait()
+
+    with RegistroPersistente(str(ruta), intervalo=60) as registro:
+        assert registro.valor("peticiones") == 1000
+
+
+def test_registro_persistente_archivo_invalido(tmp_path):
+    ruta = tmp_path / "contadores.json"
+    ruta.write_text("no es json", encoding="utf-8")
+    with pytest.raises(ValueError, match="JSON inválido"):
+        RegistroPersistente(str(ruta))
+
+
+def test_contador_privado_devuelve_valores_unicos_entre_hilos():
+    contador = crear_contador()
+    vistos = []
+    hilos = [threading.Thread(target=lambda: vistos.extend(contador() for _ in range(5000))) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert sorted(vistos) == list(range(1, 20_001))
+
+
+def test_registro_fusiona_fragmentos_de_hilos_terminados():
+    registro = RegistroContadores()
+    for _ in range(50):
+        hilo = threading.Thread(target=registro.incrementar, args=("tareas", 2))
+        hilo.start()
+        hilo.join()
+    registro.incrementar("tareas")
+
+    assert registro.valor("tareas") == 101
+    assert registro.snapshot() == {"tareas": 101}
+    # Fragmento de los retirados + el del hilo actual (y a lo sumo el último hilo).
+    assert len(registro._fragmentos) <= 3
+
+
+def test_registro_persistente_rechaza_nombres_no_str(tmp_path):
+    with RegistroPersistente(str(tmp_path / "contadores.json"), intervalo=60) as registro:
+        with pytest.raises(TypeError, match="str"):
+            registro.incrementar(("no", "str"))
+        registro.incrementar("valido")
+    assert json.loads((tmp_path / "contadores.json").read_text(encoding="utf-8")) == {"valido": 1}
+
+
+def test_registro_persistente_reintenta_tras_error(tmp_path, caplog):
+    carpeta = tmp_path / "todavia_no_existe"
+    registro = RegistroPersistente(str(carpeta / "contadores.json"), intervalo=0.01)
+    try:
+        registro.incrementar("eventos", 3)
+        assert not registro.esperar_guardado(timeout=0.2)
+        assert "No se pudo guardar" in caplog.text
+        carpeta.mkdir()
+        # El hilo de guardado sigue vivo y escribe en el siguiente intento.
+        assert registro.esperar_guardado(timeout=10)
+        assert json.loads((carpeta / "contadores.json").read_text(encoding="utf-8")) == {"eventos": 3}
+    finally:
+        registro.cerrar()
@@ -1,5 +1,22 @@
+import itertools
+
 import pytest
-from Ejercicio_4 import aplicar_validador, es_email_valido, es_mayor_a_10
+import Ejercicio_4
+from Ejercicio_4 import (
+    MAXIMO_VALIDADORES,
+    Alguno,
+    Negar,
+    Todos,
+    aplicar_validador,
+    aplicar_validador_paralelo,
+    aplicar_validador_perezoso,
+    comparar_rendimiento_emails,
+    es_email_valido,
+    es_mayor_a_10,
+    mayor_a,
+    obtener_validador,
+    registrar_validador,
+)
 
 
 def test_es_email_valido():
@@ -30,3 +47,147 @@ def test_aplicar_validador_con_numeros():
 def test_aplicar_validador_error_si_no_funcion():
     with pytest.raises(TypeError):
         aplicar_validador([1, 2, 3], "no_es_funcion")
+
+
+def test_mayor_a_generaliza_es_mayor_a_10():
+    validador = mayor_a(10)
+    for numero in (3, 10, 11, 25):
+        assert validador(numero) == es_mayor_a_10(numero)
+    assert aplicar_validador([1, 5, 8], mayor_a(4)) == [5, 8]
+
+
+def test_obtener_validador_reutiliza_instancias():
+    assert obtener_validador("mayor_a", 3) is obtener_validador("mayor_a", 3)
+    assert obtener_validador("email") is es_email_valido
+    solo_digitos = obtener_validador("regex", r"^\d+$")
+    assert aplicar_validador(["123", "12a", "9"], solo_digitos) == ["123", "9"]
+
+
+def test_obtener_validador_memoizado(monkeypatch):
+    # Registro temporal: al terminar, la fábrica de prueba no queda en _FABRICAS ni en la caché.
+    monkeypatch.setattr(Ejercicio_4, "_FABRICAS", dict(Ejercicio_4._FABRICAS))
+    llamadas = []
+
+    @registrar_validador("contar_llamadas")
+    def contar_llamadas():
+        def validador(dato):
+            llamadas.append(dato)
+            return dato > 0
+        return validador
+
+    try:
+        validador = obtener_validador("contar_llamadas", memoizar=16)
+        assert aplicar_validador([1, -1, 1, 1, -1], validador) == [1, 1, 1]
+        assert llamadas == [1, -1]
+    finally:
+        obtener_validador.cache_clear()
+    monkeypatch.undo()
+    with pytest.raises(ValueError, match="contar_llamadas"):
+        obtener_validador("contar_llamadas")
+
+
+def test_obtener_validador_cache_acotada():
+    assert obtener_validador.cache_info().maxsize == MAXIMO_VALIDADORES
+    for limite in range(MAXIMO_VALIDADORES + 10):
+        obtener_validador("mayor_a", limite)
+    assert obtener_validador.cache_info().currsize <= MAXIMO_VALIDADORES
+
+
+def test_comparar_rendimiento_emails():
+    resultados = comparar_rendimiento_emails(cantidad=2_000, distintos=100)
+    assert set(resultados) == {"texto", "precompilado", "precompilado + LRU"}
+    assert all(por_segundo > 0 for por_segundo in resultados.values())
+
+
+def test_obtener_validador_inexistente():
+    with pytest.raises(ValueError, match="No existe un validador"):
+        obtener_validador("no_registrado")
+
+
+def test_aplicar_validador_perezoso_con_iterable_infinito():
+    resultado = aplicar_validador_perezoso(itertools.count(), mayor_a(10))
+    assert list(itertools.islice(resultado, 3)) == [11, 12, 13]
+
+
+def test_aplicar_validador_perezoso_error_inmediato():
+    with pytest.raises(TypeError):
+        aplicar_validador_perezoso([1, 2, 3], "no_es_funcion")
+
+
+def test_aplicar_validador_paralelo_conserva_orden():
+    datos = (f"usuario{i}@test.com" if i % 3 else f"malo{i}@" for i in range(2500))
+    resultado = list(aplicar_validador_paralelo(datos, es_email_valido, procesos=2, tamano_bloque=100))
+    esperado = [f"usuario{i}@test.com" for i in range(2500) if i % 3]
+    assert resultado == esperado
+
+
+def test_aplicar_validador_paralelo_errores():
+    with pytest.raises(TypeError):
+        aplicar_validador_paralelo([1, 2, 3], "no_es_funcion")
+    with pytest.raises(ValueError, match="bloque"):
+        aplicar_validador_paralelo([1, 2, 3], es_mayor_a_10, tamano_bloque=0)
+    for procesos in (0, -2):
+        with pytest.raises(ValueError, match="procesos"):
+            aplicar_validador_paralelo([1, 2, 3], es_mayor_a_10, procesos=procesos)
+
+
+def test_todos_equivale_a_encadenar_validadores():
+    datos = [f"u{i}@dominio.{'com' if i % 2 else 'co'}" for i in range(50)] + ["malo@", "otro"]
+    termina_en_com = obtener_validador("regex", r".*[.]com$")
+    encadenado = aplicar_validador(aplicar_validador(datos, es_email_valido), termina_en_com)
+    assert aplicar_validador(datos, Todos(es_email_valido, termina_en_com, reordenar_cada=7)) == encadenado
+
+
+def test_alguno_y_negar():
+    validador = Alguno(mayor_a(100), Negar(mayor_a(0)))
+    assert aplicar_validador([-5, 0, 5, 50, 150], validador) == [-5, 0, 150]
+
+
+def test_todos_reordena_etapas_baratas_y_selectivas_primero():
+    def lenta_y_permisiva(numero):
+        sum(range(2000))
+        return True
+
+    def rapida_y_selectiva(numero):
+        return numero % 10 == 0
+
+    validador = Todos(lenta_y_permisiva, rapida_y_selectiva, reordenar_cada=50)
+    resultado = aplicar_validador(range(1000), validador)
+
+    assert resultado == list(range(0, 1000, 10))
+    estadisticas = validador.estadisticas()
+    assert [etapa["nombre"] for etapa in estadisticas] == ["rapida_y_selectiva", "lenta_y_permisiva"]
+    assert estadisticas[0]["evaluados"] == 1000
+    assert estadisticas[1]["evaluados"] < 200
+    assert estadisticas[0]["tasa_corte"] > 0.8
+
+
+def test_etapa_sin_medir_no_pasa_delante():
+    def corta_un_cuarto(numero):
+        return numero % 4 != 3
+
+    def corta_menos(numero):
+        return numero % 8 != 1
+
+    validador = Todos(corta_un_cuarto, corta_menos, reordenar_cada=32)
+    # La única muestra de tiempo (llamada 16, número 15) la corta la primera etapa,
+    # así que la segunda llega al reordenamiento sin tiempos medidos.
+    aplicar_validador(range(32), validador)
+    assert [etapa["nombre"] for etapa in validador.estadisticas()] == ["corta_un_cuarto", "corta_menos"]
+
+
+def test_reordenar_no_deja_la_lista_de_etapas_vacia():
+    validador = Todos(es_mayor_a_10, mayor_a(20), reordenar_cada=1)
+    etapas = validador._etapas
+    validador(5)
+    # Se reemplaza la lista en lugar de ordenarla en el sitio: la anterior sigue intacta.
+    assert validador._etapas is not etapas
+    assert len(etapas) == 2
+    assert validador(5) is False
+
+
+def test_combinacion_errores():
+    with pytest.raises(ValueError, match="al menos un validador"):
+        Todos()
+    with pytest.raises(TypeError):
+        Alguno(es_email_valido, "no_es_funcion")
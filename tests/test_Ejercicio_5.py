@@ -1,3 +1,8 @@
+import asyncio
+import random
+import threading
+
+import pytest
 import Ejercicio_5 
 
 
@@ -13,3 +18,127 @@ def test_actualizar_tasa_iva_cambia_valor():
 def test_tasa_global_se_actualiza():
     Ejercicio_5.actualizar_tasa_iva(0.15)
     assert round(Ejercicio_5.TASA_IVA, 2) == 0.15
+
+
+def test_contexto_iva_no_modifica_la_global():
+    tasa_global = Ejercicio_5.TASA_IVA
+    with Ejercicio_5.contexto_iva(0.05):
+        assert Ejercicio_5.calcular_iva(100000) == 5000.00
+        with Ejercicio_5.contexto_iva(region="MX"):
+            assert Ejercicio_5.calcular_iva(100000) == 16000.00
+        assert Ejercicio_5.calcular_iva(100000) == 5000.00
+    assert Ejercicio_5.TASA_IVA == tasa_global
+    assert Ejercicio_5.tasa_iva_actual() == tasa_global
+
+
+def test_contexto_iva_argumentos_invalidos():
+    with pytest.raises(ValueError, match="no ambos"):
+        with Ejercicio_5.contexto_iva():
+            pass
+    with pytest.raises(ValueError, match="región 'XX'"):
+        with Ejercicio_5.contexto_iva(region="XX"):
+            pass
+
+
+def test_contexto_iva_concurrente_en_hilos():
+    """Muchos hilos con tasas distintas calculan a la vez sin mezclar resultados."""
+    hilos_totales = 32
+    barrera = threading.Barrier(hilos_totales)
+    errores = []
+
+    def facturar(indice: int) -> None:
+        tasa = indice / 100
+        with Ejercicio_5.contexto_iva(tasa):
+            barrera.wait()
+            for _ in range(2000):
+                if Ejercicio_5.calcular_iva(100) != round(100 * tasa, 2):
+                    errores.append(indice)
+                    return
+
+    hilos = [threading.Thread(target=facturar, args=(i,)) for i in range(hilos_totales)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert errores == []
+
+
+def test_contexto_iva_en_tareas_asyncio():
+    async def facturar(region: str) -> float:
+        with Ejercicio_5.contexto_iva(region=region):
+            await asyncio.sleep(0)
+            return Ejercicio_5.calcular_iva(100)
+
+    async def principal():
+        return await asyncio.gather(facturar("CO"), facturar("MX"), facturar("ES"))
+
+    assert asyncio.run(principal()) == [19.0, 16.0, 21.0]
+
+
+@pytest.fixture
+def modulo_numpy():
+    return Ejercicio_5
+
+
+def test_calcular_iva_lote_coincide_con_calcular_iva(motor):
+    precios = [100000, 1234.56, 99.99, 0.01, 45000]
+    with Ejercicio_5.contexto_iva(0.19):
+        resultado = Ejercicio_5.calcular_iva_lote(Ejercicio_5.a_centavos(precios))
+        esperado = [round(Ejercicio_5.calcular_iva(p) * 100) for p in precios]
+
+    assert [int(v) for v in resultado.iva] == esperado
+    assert [int(v) for v in resultado.total] == [round(p * 100) + i for p, i in zip(precios, esperado)]
+    assert resultado.suma_base == sum(round(p * 100) for p in precios)
+    assert resultado.suma_iva == sum(esperado)
+    assert resultado.suma_total == resultado.suma_base + resultado.suma_iva
+
+
+def test_calcular_iva_lote_redondea_igual_que_calcular_iva(motor):
+    # En float, 0.5 * 0.05 queda apenas por encima de 0.025 y 0.7 * 0.05 apenas por
+    # debajo de 0.035: calcular_iva da 0.03 en ambos casos (no mitad al par).
+    resultado = Ejercicio_5.calcular_iva_lote([50, 70], tasa=0.05)
+    assert [int(v) for v in resultado.iva] == [3, 3]
+
+
+@pytest.mark.parametrize("tasa", [0.19, 0.16, 0.21, 0.05, 0.123456])
+def test_calcular_iva_lote_equivale_linea_a_linea(motor, tasa):
+    generador = random.Random(tasa)
+    precios = [generador.randrange(0, 10_000_000) for _ in range(20_000)]
+    # Precios que dejan el IVA justo en medio centavo con aritmética exacta.
+    precios += [50, 150, 250, 2550, 1_234_550, 7_654_350, 10_000_000]
+    with Ejercicio_5.contexto_iva(tasa):
+        resultado = Ejercicio_5.calcular_iva_lote(precios)
+        esperado = [round(Ejercicio_5.calcular_iva(centavos / 100) * 100) for centavos in precios]
+    assert [int(v) for v in resultado.iva] == esperado
+    assert resultado.suma_iva == sum(esperado)
+
+
+def test_calcular_iva_lote_sumas_exactas(motor):
+    resultado = Ejercicio_5.calcular_iva_lote([10] * 100_000, tasa=0.1)
+    assert resultado.suma_iva == 100_000
+    assert resultado.suma_total == 1_100_000
+    # Las sumas no caben en int64 aunque cada importe sí.
+    resultado = Ejercicio_5.calcular_iva_lote([10**15] * 10_000, tasa=0.19)
+    assert resultado.suma_base == 10**19
+    assert resultado.suma_iva == 19 * 10**17
+    assert resultado.suma_total == 119 * 10**17
+
+
+@pytest.mark.parametrize("precios", [[100, 12.5], [1.0], ["100"]])
+def test_calcular_iva_lote_rechaza_precios_no_enteros(motor, precios):
+    with pytest.raises(TypeError, match="enteros|integer"):
+        Ejercicio_5.calcular_iva_lote(precios, tasa=0.19)
+
+
+@pytest.mark.parametrize("precios", [[2**53 + 1], [-(2**63)], [2**70]])
+def test_calcular_iva_lote_rechaza_importes_fuera_de_rango(motor, precios):
+    with pytest.raises(ValueError, match="2\\*\\*53"):
+        Ejercicio_5.calcular_iva_lote(precios, tasa=0.19)
+    with pytest.raises(ValueError, match="IVA"):
+        Ejercicio_5.calcular_iva_lote([2**52], tasa=4)
+
+
+def test_comparar_rendimiento_iva(motor):
+    resultados = Ejercicio_5.comparar_rendimiento_iva(cantidad=1_000, repeticiones=1)
+    assert list(resultados) == ["bucle con calcular_iva", f"calcular_iva_lote ({motor})"]
+    assert all(segundos >= 0 for segundos in resultados.values())
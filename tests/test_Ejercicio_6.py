@@ -1,5 +1,19 @@
+import io
+import random
+from datetime import datetime
+
 import pytest
-from Ejercicio_6 import calcular_precios_con_descuento, Producto
+from rich.console import Console
+
+import Ejercicio_6
+from Ejercicio_6 import (
+    CatalogoColumnar,
+    MotorDescuentos,
+    Producto,
+    ReglaDescuento,
+    calcular_precios_con_descuento,
+    mostrar_tabla_precios,
+)
 
 
 def test_descuento_basico():
@@ -35,3 +49,138 @@ def test_valores_invalidos():
         calcular_precios_con_descuento(productos, -0.1)
     with pytest.raises(ValueError):
         calcular_precios_con_descuento(productos, 1.5)
+
+
+@pytest.fixture
+def modulo_numpy():
+    return Ejercicio_6
+
+
+def test_catalogo_columnar_coincide_con_lista(motor):
+    productos: list[Producto] = [
+        {"nombre": "Camisa", "precio": 50000},
+        {"nombre": "Pantalón", "precio": 80000},
+        {"nombre": "Gorra", "precio": 25999.99},
+    ]
+    catalogo = CatalogoColumnar.desde_productos(productos)
+
+    assert len(catalogo) == 3
+    assert catalogo.precios_con_descuento(0.15).tolist() == calcular_precios_con_descuento(productos, 0.15)
+    assert catalogo.a_productos() == productos
+
+
+def test_catalogo_columnar_redondea_igual_que_round(motor):
+    # Valores donde np.round(x, 2) y round(x, 2) no coinciden.
+    precios = [25506.9, 2.675, 1.005, 0.125, 1e12 + 0.015, float("inf")]
+    generador = random.Random(12)
+    precios += [round(generador.uniform(0, 100_000), 2) for _ in range(20_000)]
+    productos: list[Producto] = [{"nombre": str(i), "precio": precio} for i, precio in enumerate(precios)]
+    catalogo = CatalogoColumnar.desde_productos(productos)
+
+    for porcentaje in (0.0, 0.15, 0.33):
+        assert catalogo.precios_con_descuento(porcentaje).tolist() == calcular_precios_con_descuento(productos, porcentaje)
+    assert catalogo.precios_con_descuento(0.15)[0] == 21680.87
+    assert catalogo.precios_con_descuento(0.0)[1] == 2.67
+
+
+def test_catalogo_columnar_valores_invalidos():
+    catalogo = CatalogoColumnar(["Bolso"], [50000])
+    with pytest.raises(ValueError):
+        catalogo.precios_con_descuento(-0.1)
+    with pytest.raises(ValueError):
+        catalogo.precios_con_descuento(1.5)
+    with pytest.raises(ValueError, match="misma cantidad"):
+        CatalogoColumnar(["Bolso", "Gorra"], [50000])
+
+
+def test_catalogo_columnar_vacio(motor):
+    assert CatalogoColumnar().precios_con_descuento(0.10).tolist() == []
+
+
+def test_motor_descuentos_por_categoria_y_cantidad():
+    motor = MotorDescuentos([
+        ReglaDescuento(0.10, categoria="ropa"),
+        ReglaDescuento(0.05, cantidad_minima=5),
+        ReglaDescuento(0.25, categoria="ropa", cantidad_minima=20),
+    ])
+    assert motor.porcentaje("ropa", 1) == 0.10
+    assert motor.porcentaje("ropa", 10) == 0.10
+    assert motor.porcentaje("ropa", 20) == 0.25
+    assert motor.porcentaje("hogar", 1) == 0.0
+    assert motor.porcentaje("hogar", 5) == 0.05
+
+
+def test_motor_descuentos_ventana_de_fechas_e_invalidacion():
+    motor = MotorDescuentos([ReglaDescuento(0.10)])
+    black_friday = ReglaDescuento(0.30, desde=datetime(2025, 11, 28), hasta=datetime(2025, 11, 29))
+
+    assert motor.porcentaje("ropa", fecha=datetime(2025, 11, 28, 12)) == 0.10
+    motor.agregar_regla(black_friday)
+    assert motor.porcentaje("ropa", fecha=datetime(2025, 11, 28, 12)) == 0.30
+    assert motor.porcentaje("ropa", fecha=datetime(2025, 11, 29)) == 0.10
+    motor.eliminar_regla(black_friday)
+    assert motor.porcentaje("ropa", fecha=datetime(2025, 11, 28, 12)) == 0.10
+
+
+def test_motor_descuentos_precios_en_bloque(motor):
+    catalogo = CatalogoColumnar(["Camisa", "Sartén", "Medias"], [50000, 80000, 9999.99])
+    reglas = MotorDescuentos([ReglaDescuento(0.10, "ropa"), ReglaDescuento(0.20, cantidad_minima=3)])
+    categorias = ["ropa", "hogar", "ropa"]
+
+    assert reglas.precios(catalogo, categorias).tolist() == [45000.0, 80000.0, round(9999.99 * 0.9, 2)]
+    assert reglas.precios(catalogo, categorias, [1, 3, 5]).tolist() == [45000.0, 64000.0, round(9999.99 * 0.8, 2)]
+    with pytest.raises(ValueError, match="misma longitud"):
+        reglas.precios(catalogo, ["ropa"])
+
+
+def test_motor_descuentos_valida_porcentaje():
+    with pytest.raises(ValueError, match="entre 0 y 1"):
+        MotorDescuentos([ReglaDescuento(1.5)])
+
+
+@pytest.mark.parametrize("minima", [0, -3])
+def test_motor_descuentos_valida_cantidad_minima(minima):
+    with pytest.raises(ValueError, match="al menos 1"):
+        MotorDescuentos([ReglaDescuento(0.10, cantidad_minima=minima)])
+
+
+def test_motor_descuentos_rechaza_cantidades_negativas(motor):
+    reglas = MotorDescuentos([ReglaDescuento(0.10), ReglaDescuento(0.50, cantidad_minima=100)])
+    catalogo = CatalogoColumnar(["Camisa", "Sartén"], [50000, 80000])
+    assert reglas.porcentaje("ropa", 0) == 0.0
+    with pytest.raises(ValueError, match="negativa"):
+        reglas.porcentaje("ropa", -1)
+    with pytest.raises(ValueError, match="negativa"):
+        reglas.precios(catalogo, ["ropa", "hogar"], [2, -5])
+
+
+def test_motor_descuentos_precios_con_cantidades_numpy(motor):
+    np = pytest.importorskip("numpy")
+    catalogo = CatalogoColumnar(["Camisa", "Sartén", "Medias"], [50000, 80000, 9999.99])
+    reglas = MotorDescuentos([ReglaDescuento(0.10, "ropa"), ReglaDescuento(0.20, cantidad_minima=3)])
+    categorias = ["ropa", "hogar", "ropa"]
+    cantidades = [1, 3, 5]
+    assert reglas.precios(catalogo, categorias, np.array(cantidades)) == reglas.precios(catalogo, categorias, cantidades)
+    with pytest.raises(ValueError, match="negativa"):
+        reglas.precios(catalogo, categorias, np.array([1, -3, 5]))
+    vacio = CatalogoColumnar()
+    assert reglas.precios(vacio, [], np.array([], dtype=np.int64)).tolist() == []
+
+
+def test_motor_descuentos_precios_redondea_igual_que_round(motor):
+    catalogo = CatalogoColumnar(["a", "b", "c"], [25506.9, 2.675, 1.005])
+    reglas = MotorDescuentos([ReglaDescuento(0.15, "ropa")])
+    categorias = ["ropa", "hogar", "hogar"]
+    assert reglas.precios(catalogo, categorias).tolist() == [21680.87, 2.67, round(1.005, 2)]
+
+
+def test_mostrar_tabla_precios_usa_el_mismo_calculo(monkeypatch):
+    monkeypatch.setattr(Ejercicio_6, "console", Console(file=io.StringIO()))
+    productos: list[Producto] = [{"nombre": "Camisa", "precio": 25506.9}, {"nombre": "Gorra", "precio": 2.675}]
+    mostrar_tabla_precios(productos, 0.15)
+
+    lineas = Ejercicio_6.console.file.getvalue().splitlines()
+    assert lineas[0] == "Listado de precios con 15 % de descuento"
+    assert [linea.split("\t")[2] for linea in lineas[2:]] == [
+        Ejercicio_6._formatear_pesos(precio) for precio in calcular_precios_con_descuento(productos, 0.15)
+    ]
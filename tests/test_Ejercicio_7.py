@@ -1,4 +1,8 @@
-from Ejercicio_7 import filtrar_aprobados
+import io
+import math
+
+from Ejercicio_7 import IndiceNotas, filtrar_aprobados
+from registros_estudiantes import RegistrosEstudiantes
 
 
 def test_filtrar_aprobados_exitoso():
@@ -17,3 +21,49 @@ def test_filtrar_aprobados_todos_aprueban():
     estudiantes = [("Carlos", 3.0), ("Laura", 3.5)]
     resultado = filtrar_aprobados(estudiantes)
     assert resultado == estudiantes
+
+
+def test_indice_notas_consultas():
+    indice = IndiceNotas([("Ana", 4.5), ("Juan", 2.8), ("María", 3.9), ("Pedro", 4.5)])
+    indice.agregar("Luis", 3.0)
+    assert filtrar_aprobados(indice) == [("Ana", 4.5), ("María", 3.9), ("Pedro", 4.5), ("Luis", 3.0)]
+    assert indice.mayores_o_iguales(4.0, orden_original=False) == [("Ana", 4.5), ("Pedro", 4.5)]
+    assert indice.contar_entre(3.0, 4.0) == 2
+    assert indice.contar_entre(5.0, 1.0) == 0
+    assert indice.mejores(2) == [("Ana", 4.5), ("Pedro", 4.5)]
+    assert indice.mejores(0) == []
+    assert len(indice) == 5
+
+
+def test_indice_notas_mejores_con_empates():
+    estudiantes = [(f"e{i}", float(i * 7 % 5)) for i in range(40)]
+    indice = IndiceNotas(estudiantes[:30])
+    for nombre, nota in estudiantes[30:]:
+        indice.agregar(nombre, nota)
+    esperado = sorted(estudiantes, key=lambda e: -e[1])  # estable: a igual nota, por llegada
+    for k in (1, 7, 8, 15, 40, 100):
+        assert indice.mejores(k) == esperado[:k]
+    assert IndiceNotas().mejores(3) == []
+
+
+def test_filtrar_aprobados_nota_minima():
+    estudiantes = [("Ana", 4.5), ("Juan", 2.8), ("María", 3.9)]
+    assert filtrar_aprobados(estudiantes, nota_minima=4.0) == [("Ana", 4.5)]
+    assert filtrar_aprobados(IndiceNotas(estudiantes), 4.0) == filtrar_aprobados(estudiantes, 4.0)
+
+
+def test_filtrar_aprobados_registros_compactos():
+    estudiantes = [("Ana", 4.5), ("Juan", 2.8), ("María", 3.9)]
+    registros = RegistrosEstudiantes.desde_tuplas(estudiantes)
+    assert filtrar_aprobados(registros) == filtrar_aprobados(estudiantes)
+
+
+def test_indice_notas_omite_notas_faltantes():
+    archivo = io.StringIO("id,nombre,nota\n1,A,4.5\n2,B,\n3,C,2.0\n4,D,3.5\n5,E,x\n")
+    registros = RegistrosEstudiantes.desde_csv(archivo)
+    indice = IndiceNotas(registros)
+    indice.agregar("F", math.nan)
+    assert len(indice) == 3
+    assert filtrar_aprobados(indice) == [("A", 4.5), ("D", 3.5)] == filtrar_aprobados(registros)
+    assert indice.mejores(2) == [("A", 4.5), ("D", 3.5)]
+    assert indice.contar_entre(0.0, 5.0) == 3
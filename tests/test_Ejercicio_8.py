@@ -1,4 +1,18 @@
-from Ejercicio_8 import obtener_palabras_mayusculas, crear_diccionario_longitudes
+import io
+
+import pytest
+
+from Ejercicio_8 import (
+    Tokenizador,
+    comparar_rendimiento_longitudes,
+    comparar_rendimiento_tokenizador,
+    crear_diccionario_longitudes,
+    crear_diccionario_longitudes_archivo,
+    generar_corpus,
+    iterar_palabras_mayusculas,
+    leer_palabras_por_bloques,
+    obtener_palabras_mayusculas,
+)
 
 
 def test_obtener_palabras_mayusculas_exitoso():
@@ -17,3 +31,106 @@ def test_crear_diccionario_longitudes():
     palabras = ["PYTHON", "EJEMPLO"]
     resultado = crear_diccionario_longitudes(palabras)
     assert resultado == {"PYTHON": 6, "EJEMPLO": 7}
+
+
+def test_iterar_palabras_mayusculas_bloques_pequenos(tmp_path):
+    texto = "Python es un  lenguaje\nde programación\tincreíble y poderoso  "
+    archivo = tmp_path / "texto.txt"
+    archivo.write_text(texto, encoding="utf-8")
+    esperado = obtener_palabras_mayusculas(texto)
+    for tamano in (1, 3, 7, 64):
+        assert list(iterar_palabras_mayusculas(archivo, tamano_bloque=tamano)) == esperado
+    assert list(iterar_palabras_mayusculas(io.StringIO("palabras"), tamano_bloque=2)) == ["PALABRAS"]
+
+
+def test_leer_palabras_por_bloques_tamano_invalido():
+    with pytest.raises(ValueError):
+        next(leer_palabras_por_bloques(io.StringIO("texto"), tamano_bloque=0))
+
+
+def test_crear_diccionario_longitudes_archivo_igual_al_secuencial(tmp_path):
+    texto = "Programación  paralela\ncon procesos y programación concurrente increíble\tprocesos " * 7
+    archivo = tmp_path / "corpus.txt"
+    archivo.write_text(texto, encoding="utf-8")
+    palabras = obtener_palabras_mayusculas(texto)
+    esperado = crear_diccionario_longitudes(palabras)
+
+    for procesos, tamano in ((1, 5), (1, 64), (2, 16)):
+        resultado = crear_diccionario_longitudes_archivo(archivo, procesos=procesos, tamano_bloque=tamano)
+        assert list(resultado.longitudes.items()) == list(esperado.items())
+        assert resultado.frecuencias["PROCESOS"] == 14
+        assert sum(resultado.frecuencias.values()) == len(palabras)
+
+
+def test_crear_diccionario_longitudes_archivo_vacio(tmp_path):
+    archivo = tmp_path / "vacio.txt"
+    archivo.write_text("", encoding="utf-8")
+    assert crear_diccionario_longitudes_archivo(archivo, procesos=1).longitudes == {}
+
+
+@pytest.mark.parametrize("procesos", [0, -2])
+def test_crear_diccionario_longitudes_archivo_procesos_invalidos(tmp_path, procesos):
+    archivo = tmp_path / "texto.txt"
+    archivo.write_text("hola mundo", encoding="utf-8")
+    with pytest.raises(ValueError, match="procesos"):
+        crear_diccionario_longitudes_archivo(archivo, procesos=procesos)
+
+
+def test_obtener_palabras_mayusculas_sin_puntuacion():
+    texto = "Resolver problemas complejos, de manera eficiente; y elegante."
+    assert obtener_palabras_mayusculas(texto) == [
+        "RESOLVER", "PROBLEMAS", "COMPLEJOS", "MANERA", "EFICIENTE", "ELEGANTE"
+    ]
+    assert obtener_palabras_mayusculas("¡Programación, increíble!") == ["PROGRAMACIÓN", "INCREÍBLE"]
+
+
+def test_tokenizador_opciones():
+    assert Tokenizador(plegar_acentos=True).tokenizar("¡Canción, pingüino!") == ["Cancion", "pinguino"]
+    assert Tokenizador(patron=r"[a-z]+").tokenizar("abc DEF ghi_2") == ["abc", "ghi"]
+
+    texto = "".join(["pala", "bras "]) * 3 + "palabras"
+    palabras = Tokenizador(internar=True).palabras_mayusculas(texto)
+    assert palabras == ["PALABRAS"] * 4
+    assert all(palabra is palabras[0] for palabra in palabras)
+
+
+def test_tokenizador_camino_ascii_igual_a_regex():
+    texto = "foo_bar, baz-qux (x1y2z3)\tnumeros 12345678 fin."
+    tokenizador = Tokenizador()
+    assert tokenizador.tokenizar(texto) == tokenizador.patron.findall(texto)
+    assert tokenizador.tokenizar(texto + " ñandú") == tokenizador.patron.findall(texto + " ñandú")
+
+
+@pytest.mark.parametrize("texto", [
+    "«Canción» — ¿pingüino_feliz? año…",
+    "straße groß maßstab",  # upper() alarga "ß"
+    "ᾳͅbcdefg árboles",  # U+0345 cambia de clase al pasar a mayúscula
+    "uno·dos·tres·cuatro palabra’larga",
+])
+def test_tokenizador_camino_utf8_igual_a_regex(texto):
+    tokenizador = Tokenizador()
+    palabras = tokenizador.patron.findall(texto)
+    assert tokenizador.tokenizar(texto) == palabras
+    assert tokenizador.palabras_mayusculas(texto) == [palabra.upper() for palabra in palabras if len(palabra) > 5]
+
+
+def test_comparar_rendimiento_tokenizador():
+    resultados = comparar_rendimiento_tokenizador(cantidad=1_000, repeticiones=1)
+    assert list(resultados) == [
+        "ASCII: str.split + upper", "ASCII: Tokenizador", "UTF-8: str.split + upper", "UTF-8: Tokenizador"
+    ]
+    assert all(segundos >= 0 for segundos in resultados.values())
+
+
+def test_generar_corpus_y_comparar_rendimiento_longitudes(tmp_path):
+    archivo = tmp_path / "corpus.txt"
+    escritos = generar_corpus(archivo, tamano=5_000)
+    assert 4_900 < escritos <= 5_000
+    assert archivo.stat().st_size == escritos
+    texto = archivo.read_text(encoding="utf-8")
+    esperado = crear_diccionario_longitudes(obtener_palabras_mayusculas(texto))
+    assert crear_diccionario_longitudes_archivo(archivo, procesos=1).longitudes == esperado
+
+    resultados = comparar_rendimiento_longitudes(tamano=20_000, procesos=[1, 2])
+    assert list(resultados) == [1, 2]
+    assert all(segundos > 0 for segundos in resultados.values())
@@ -1,4 +1,4 @@
-from Ejercicio_9 import sumar_lista, concatenar_textos
+from Ejercicio_9 import comparar_rendimiento_agregaciones, concatenar_textos, main, sumar_lista
 
 
 def test_sumar_lista_exitoso():
@@ -23,3 +23,27 @@ def test_concatenar_textos_vacio():
     textos = [""]
     resultado = concatenar_textos(textos)
     assert resultado == ""
+
+
+def test_listas_vacias():
+    assert sumar_lista([]) == 0
+    assert concatenar_textos([]) == ""
+
+
+def test_sumar_lista_paralela_y_compensada():
+    assert sumar_lista(list(range(1000)), procesos=2) == sum(range(1000))
+    assert sumar_lista([0.1] * 10, compensada=True) == 1.0
+
+
+def test_comparar_rendimiento_agregaciones():
+    resultados = comparar_rendimiento_agregaciones(cantidad=1_000, cantidad_reduce_textos=100, repeticiones=1)
+    assert list(resultados) == [
+        "enteros: reduce + lambda", "enteros: sumar_lista", "floats: reduce + lambda", "floats: sumar_lista",
+        "100 textos: reduce + lambda", "100 textos: concatenar_textos", "1,000 textos: concatenar_textos",
+    ]
+    assert all(segundos >= 0 for segundos in resultados.values())
+
+
+def test_main_muestra_resultados(capsys):
+    main([])
+    assert "Hola SENA!" in capsys.readouterr().out
@@ -0,0 +1,104 @@
+import math
+import operator
+from array import array
+from functools import reduce
+
+import pytest
+
+from agregaciones import reducir, reducir_paralelo, registrar_nucleo, sumar_paralelo
+
+
+@pytest.mark.parametrize("operador, valores", [
+    (operator.add, [1, 2, 3, 4]),
+    (operator.add, [True, True, 3]),
+    (operator.mul, [2, 3, 4]),
+    (operator.add, ["a", "b", "c"]),
+    (operator.concat, [b"a", b"b"]),
+    (operator.add, [bytearray(b"a"), b"b"]),
+    (operator.add, [[1], [2, 3], []]),
+    (operator.add, [(1,), (2,)]),
+    (max, [3, 7, 7.0, 1]),
+    (min, ["b", "a", "c"]),
+    (operator.sub, [10, 3, 2]),
+    (operator.or_, [{1}, {2}, {1, 3}]),
+])
+def test_reducir_igual_que_reduce(operador, valores):
+    resultado = reducir(operador, valores)
+    esperado = reduce(operador, valores)
+    assert resultado == esperado
+    assert type(resultado) is type(esperado)
+
+
+@pytest.mark.parametrize("valores", [[[1], "ab"], [[1], (2,)], [(1,), [2]], [[1], [2], range(3)]])
+def test_reducir_tipos_mezclados_falla_como_reduce(valores):
+    with pytest.raises(TypeError):
+        reduce(operator.add, valores)
+    with pytest.raises(TypeError):
+        reducir(operator.add, valores)
+
+
+def test_reducir_subclase_de_lista_usa_su_suma():
+    class Pila(list):
+        def __add__(self, otra):
+            return Pila([*otra, *self])
+
+    valores = [Pila([1]), Pila([2]), [3]]
+    assert reducir(operator.add, valores) == reduce(operator.add, valores) == [3, 2, 1]
+
+
+def test_reducir_inicial_y_vacio():
+    assert reducir(operator.add, [], 0) == 0
+    assert reducir(operator.add, iter(["b", "c"]), "a") == "abc"
+    with pytest.raises(TypeError):
+        reducir(operator.add, [])
+
+
+def test_registrar_nucleo_propio():
+    class Vector(tuple):
+        pass
+
+    llamadas = []
+
+    @registrar_nucleo(operator.xor, Vector)
+    def _nucleo(primero, resto):
+        llamadas.append(primero)
+        return reduce(operator.xor, resto, len(primero))
+
+    assert reducir(operator.xor, [Vector((1, 2)), 1]) == 3
+    assert llamadas == [(1, 2)]
+
+
+def test_reducir_paralelo_igual_con_y_sin_pool():
+    valores = list(range(1, 1001))
+    esperado = reducir(operator.add, valores)
+    for procesos in (1, 2):
+        assert reducir_paralelo(operator.add, valores, procesos=procesos, tamano_bloque=64) == esperado
+    assert reducir_paralelo(max, tuple(valores), procesos=2, tamano_bloque=100) == 1000
+    assert reducir_paralelo(operator.add, ["a", "b", "c"], "x", procesos=2, tamano_bloque=1) == "xabc"
+    assert reducir_paralelo(operator.add, [], 0) == 0
+
+
+def test_sumar_paralelo_memoria_compartida_y_compensada():
+    valores = array("d", [0.1] * 10_000 + [1e16, 1.0, -1e16])
+    exacta = math.fsum(valores)
+    assert sumar_paralelo(valores, procesos=2, tamano_bloque=999, compensada=True) == exacta
+    assert sumar_paralelo(valores, procesos=1, tamano_bloque=999, compensada=True) == exacta
+    assert sumar_paralelo(array("q", range(5000)), procesos=2, tamano_bloque=700) == sum(range(5000))
+    assert sumar_paralelo([], compensada=True) == 0.0
+
+
+@pytest.mark.parametrize("tamano_bloque", [1, 2, 3])
+def test_sumar_paralelo_compensada_redondeo_correcto(tamano_bloque):
+    valores = [1e16, 1.0, -1e16]
+    assert sumar_paralelo(valores, procesos=1, tamano_bloque=tamano_bloque, compensada=True) == math.fsum(valores) == 1.0
+    valores = [1e300, 1e-300, -1e300, 3.0, 2.0**-60, -3.0]
+    assert sumar_paralelo(valores, procesos=2, tamano_bloque=tamano_bloque, compensada=True) == math.fsum(valores)
+
+
+def test_reducir_paralelo_parametros_invalidos():
+    with pytest.raises(ValueError):
+        reducir_paralelo(operator.add, [1, 2], tamano_bloque=0)
+    with pytest.raises(ValueError):
+        sumar_paralelo([1, 2], procesos=-1)
+    with pytest.raises(ValueError):
+        reducir_paralelo(operator.add, [1, 2], procesos=0)
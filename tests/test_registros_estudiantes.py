@@ -0,0 +1,64 @@
+import io
+from math import isnan
+
+import pytest
+
+from registros_estudiantes import RegistrosEstudiantes, comparar_memoria, main
+
+
+def test_desde_csv_con_y_sin_nota():
+    registros = RegistrosEstudiantes.desde_csv(io.StringIO("nombre,id,nota\nAna,1,4.5\n\nJuan,2,\n"))
+    assert registros.ids == ["1", "2"]
+    assert list(registros)[0] == ("Ana", 4.5)
+    assert isnan(registros.notas[1])
+    assert registros.tiene_notas()
+
+    sin_notas = RegistrosEstudiantes.desde_csv(io.StringIO("id,nombre\n1,Ana\n"))
+    assert len(sin_notas) == 1
+    assert not sin_notas.tiene_notas()
+
+
+def test_desde_csv_filas_danadas_no_interrumpen():
+    cortas = RegistrosEstudiantes.desde_csv(io.StringIO("id,nombre\n1,Ana\n2\n3,Luis\n"))
+    assert cortas.ids == ["1", "3"]
+    assert cortas.nombres == ["Ana", "Luis"]
+
+    notas = RegistrosEstudiantes.desde_csv(io.StringIO("id,nombre,nota\n1,Ana,4.5\n2,Juan,n/a\n3,Luis\n"))
+    assert notas.ids == ["1", "2", "3"]
+    assert notas.notas[0] == 4.5
+    assert isnan(notas.notas[1]) and isnan(notas.notas[2])
+
+
+def test_desde_csv_sin_columnas():
+    with pytest.raises(ValueError):
+        RegistrosEstudiantes.desde_csv(io.StringIO("codigo,alumno\n1,Ana\n"))
+
+
+def test_nombres_repetidos_se_comparten():
+    registros = RegistrosEstudiantes.desde_diccionarios(
+        [{"id": "1", "nombre": "".join(["An", "a"])}, {"id": "2", "nombre": "".join(["A", "na"])}]
+    )
+    assert registros.nombres[0] is registros.nombres[1]
+
+
+def test_comparar_memoria_compacto_ocupa_menos():
+    resultados = comparar_memoria(cantidad=20_000, nombres_distintos=100)
+    assert resultados["compacto"] < resultados["tuplas"] < resultados["diccionarios"]
+
+
+def test_main_muestra_tabla(capsys):
+    main(cantidad=2_000)
+    salida = capsys.readouterr().out
+    assert "Memoria de 2,000 estudiantes" in salida
+    assert "compacto" in salida
+
+
+def test_ids_numericos_y_de_texto():
+    registros = RegistrosEstudiantes()
+    registros.agregar("1", "Ana", 4.0)
+    registros.agregar("20", "Juan", 3.0)
+    assert registros.ids == ["1", "20"]
+    registros.agregar("007", "Bond", 5.0)
+    registros.agregar("A-3", "Luis", 2.0)
+    assert registros.ids == ["1", "20", "007", "A-3"]
+    assert list(registros.iterar_ids()) == registros.ids
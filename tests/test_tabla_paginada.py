@@ -0,0 +1,79 @@
+import io
+
+import pytest
+from rich.console import Console
+
+from tabla_paginada import Columna, crear_tabla, medir_primera_fila, mostrar_tabla_paginada
+
+COLUMNAS = (Columna("N°", justify="right"), Columna("Valor", style="green"))
+
+
+def filas(cantidad, formateadas=None):
+    """Genera filas contando cuántas se formatearon realmente."""
+    for i in range(cantidad):
+        if formateadas is not None:
+            formateadas.append(i)
+        yield str(i), f"valor {i}"
+
+
+def consola_terminal():
+    return Console(file=io.StringIO(), force_terminal=True, width=80, color_system=None)
+
+
+def salida_normalizada(consola):
+    """Texto impreso con los espacios colapsados (rich parte los títulos largos)."""
+    return " ".join(consola.file.getvalue().split())
+
+
+def test_crear_tabla():
+    tabla = crear_tabla("Prueba", COLUMNAS, filas(3), show_lines=True)
+    assert tabla.row_count == 3
+    assert [c.header for c in tabla.columns] == ["N°", "Valor"]
+
+
+def test_texto_plano_si_no_es_terminal():
+    consola = Console(file=io.StringIO())
+    total = mostrar_tabla_paginada("Prueba", COLUMNAS, filas(3), consola=consola)
+
+    assert total == 3
+    assert consola.file.getvalue() == "Prueba\nN°\tValor\n0\tvalor 0\n1\tvalor 1\n2\tvalor 2\n"
+
+
+def test_una_sola_pagina_conserva_el_titulo():
+    consola = consola_terminal()
+    mostrar_tabla_paginada("Prueba", COLUMNAS, filas(3), tamano_pagina=3, consola=consola)
+    salida = consola.file.getvalue()
+    assert "Prueba" in salida
+    assert "página" not in salida
+
+
+def test_varias_paginas_sin_interaccion():
+    consola = consola_terminal()
+    total = mostrar_tabla_paginada("Prueba", COLUMNAS, filas(5), tamano_pagina=2, consola=consola, interactivo=False)
+    salida = salida_normalizada(consola)
+    assert total == 5
+    assert "Prueba (página 3)" in salida
+    assert "valor 4" in salida
+
+
+def test_solo_formatea_la_pagina_visible(monkeypatch):
+    consola = consola_terminal()
+    monkeypatch.setattr(consola, "input", lambda *args, **kwargs: "q")
+    formateadas = []
+
+    total = mostrar_tabla_paginada("Prueba", COLUMNAS, filas(1_000_000, formateadas), tamano_pagina=10, consola=consola)
+
+    assert total == 10
+    assert len(formateadas) == 11  # la página visible más una fila de anticipación
+    assert "Prueba (página 1)" in salida_normalizada(consola)
+
+
+def test_tamano_pagina_invalido():
+    with pytest.raises(ValueError, match="página"):
+        mostrar_tabla_paginada("Prueba", COLUMNAS, filas(1), tamano_pagina=0)
+
+
+def test_medir_primera_fila():
+    resultados = medir_primera_fila(cantidad=1_000, tamano_pagina=10, cantidad_tabla_completa=100)
+    assert list(resultados) == ["paginada (1,000 filas)", "texto plano (1,000 filas)", "rich.Table completa (100 filas)"]
+    assert all(segundos >= 0 for segundos in resultados.values())